@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Differential Fuzz Harness
+=========================
+
+Runs generated workload instances through every engine in scaling.ENGINES
+on a process pool and checks each answer independently of the solver:
+
+- n <= 8: the cost must equal a brute-force search over all permutations
+- every n: the returned potentials must certify optimality in O(n²)
+  (perfect matching, dual feasibility, tight assigned cells)
+
+Failing instances are saved as JSON with their family, size and seed (and
+the matrix) so they can be replayed with --replay.
+
+Usage:
+    python benchmarks/fuzz.py [--instances 2000] [--workers 4] [--seed 0]
+    python benchmarks/fuzz.py --families sparse,degenerate --large-sizes 50,100
+    python benchmarks/fuzz.py --replay fuzz_failures/fail-uniform-n7-123.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'hungarian_visualizer')
+sys.path.insert(0, APP_DIR)
+
+import numpy as np  # noqa: E402
+from matrix_generator import WorkloadInstance, WORKLOAD_FAMILIES  # noqa: E402
+from optimality import BRUTE_FORCE_MAX_SIZE, brute_force_cost, certificate_violations  # noqa: E402
+from scaling import ENGINES, run_engine  # noqa: E402
+
+DEFAULT_SMALL_SIZES = list(range(1, BRUTE_FORCE_MAX_SIZE + 1))
+DEFAULT_LARGE_SIZES = [12, 24, 48]
+
+# Families whose solves grow too fast to fuzz at every size, with the largest size used
+SIZE_CAPS = {'adversarial': 24}
+
+# Failing matrices up to this size are stored inline in the failure file
+MAX_SAVED_MATRIX_SIZE = 200
+
+
+def check_instance(task):
+    """Solve one instance with every engine; return its failures (empty when all agree)"""
+    family, size, seed = task
+    matrix = WorkloadInstance(family, size, seed=seed).generate(workers=1)
+    expected = brute_force_cost(matrix) if size <= BRUTE_FORCE_MAX_SIZE else None
+
+    failures = []
+    for engine in ENGINES:
+        try:
+            result = run_engine(engine, matrix)
+            problems = certificate_violations(matrix, result['assignment'], result['row_potentials'],
+                                              result['column_potentials'], result['total_cost'])
+            if expected is not None and abs(float(result['total_cost']) - expected) > 1e-6:
+                problems.append(f"cost {result['total_cost']} but brute force finds {expected}")
+        except Exception as e:  # a crash is a failure of that engine, not of the harness
+            problems = [f'{type(e).__name__}: {e}']
+        if problems:
+            failures.append({'family': family, 'size': size, 'seed': seed, 'engine': engine,
+                             'problems': problems})
+    return failures
+
+
+def make_tasks(count, families, small_sizes, large_sizes, seed):
+    """Seeded instances, alternating brute-force and certificate sizes across families"""
+    rng = np.random.default_rng(seed)
+    tasks = []
+    for k in range(count):
+        family = families[k % len(families)]
+        sizes = small_sizes if k % 2 == 0 or not large_sizes else large_sizes
+        size = int(rng.choice(sizes))
+        size = min(size, SIZE_CAPS.get(family, size))
+        tasks.append((family, size, int(rng.integers(2 ** 63))))
+    return tasks
+
+
+def save_failure(directory, failure):
+    """Write a failure as JSON (one file per instance and engine) and return its path"""
+    os.makedirs(directory, exist_ok=True)
+    record = dict(failure)
+    if failure['size'] <= MAX_SAVED_MATRIX_SIZE:
+        record['matrix'] = WorkloadInstance(failure['family'], failure['size'],
+                                            seed=failure['seed']).generate(workers=1).tolist()
+    path = os.path.join(directory, f"fail-{failure['family']}-n{failure['size']}-{failure['seed']}"
+                                   f"-{failure['engine']}.json")
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump(record, handle, indent=2)
+    return path
+
+
+def replay(path):
+    with open(path, 'r', encoding='utf-8') as handle:
+        record = json.load(handle)
+    failures = check_instance((record['family'], record['size'], record['seed']))
+    if not failures:
+        print(f"{path}: all engines agree now")
+        return 0
+    for failure in failures:
+        print(f"{failure['engine']}: {'; '.join(failure['problems'])}")
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Differentially verify every solver engine')
+    parser.add_argument('--instances', type=int, default=2000)
+    parser.add_argument('--families', default=','.join(WORKLOAD_FAMILIES))
+    parser.add_argument('--small-sizes', default=','.join(map(str, DEFAULT_SMALL_SIZES)),
+                        help=f'sizes checked against brute force (<= {BRUTE_FORCE_MAX_SIZE})')
+    parser.add_argument('--large-sizes', default=','.join(map(str, DEFAULT_LARGE_SIZES)),
+                        help='sizes checked by the dual certificate only')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--failures-dir', default='fuzz_failures')
+    parser.add_argument('--replay', help='re-run a saved failure file')
+    args = parser.parse_args()
+
+    if args.replay:
+        sys.exit(replay(args.replay))
+
+    small_sizes = [int(size) for size in args.small_sizes.split(',') if size]
+    if any(size > BRUTE_FORCE_MAX_SIZE for size in small_sizes):
+        parser.error(f'--small-sizes must be <= {BRUTE_FORCE_MAX_SIZE}')
+    large_sizes = [int(size) for size in args.large_sizes.split(',') if size]
+    tasks = make_tasks(args.instances, args.families.split(','), small_sizes, large_sizes, args.seed)
+
+    start = time.perf_counter()
+    failures = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for instance_failures in pool.map(check_instance, tasks, chunksize=16):
+            for failure in instance_failures:
+                path = save_failure(args.failures_dir, failure)
+                print(f"FAIL {failure['engine']} {failure['family']} n={failure['size']} "
+                      f"seed={failure['seed']}: {'; '.join(failure['problems'])} -> {path}")
+            failures.extend(instance_failures)
+
+    print(f"{len(tasks)} instances x {len(ENGINES)} engines in {time.perf_counter() - start:.1f} s, "
+          f"{len(failures)} failure(s)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Import-Time Benchmark
+=====================
+
+Measures the cold import time of the server modules in fresh interpreters and
+fails when it exceeds a budget or when the heavy plotting/psutil stacks are
+imported eagerly (they must load on the first chart or memory request).
+
+Usage:
+    python benchmarks/import_time.py [--repeat 5] [--budget 0.6]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'hungarian_visualizer')
+
+# Modules that must not be imported at start-up
+HEAVY_MODULES = ['matplotlib', 'seaborn', 'psutil', 'pandas']
+
+# Module imported by each benchmark case
+CASES = {
+    'app': 'app',
+    'analytics': 'analytics',
+    'hungarian_algorithm': 'hungarian_algorithm',
+    'cli': 'cli'
+}
+
+# Further modules a case must not import (the headless CLI runs without the web stack)
+CASE_HEAVY_MODULES = {
+    'cli': ['flask', 'werkzeug']
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed,
+                  'heavy': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module, repeat, heavy_modules=HEAVY_MODULES):
+    """Import a module in `repeat` fresh interpreters, returning timings and heavy imports"""
+    timings = []
+    heavy = set()
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(module=module, heavy=heavy_modules)],
+            cwd=APP_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result['seconds'])
+        heavy.update(result['heavy'])
+    return timings, sorted(heavy)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Guard server cold-start import time')
+    parser.add_argument('--repeat', type=int, default=5, help='fresh interpreters per case')
+    parser.add_argument('--budget', type=float, default=0.6,
+                        help='maximum median import time for app, in seconds')
+    args = parser.parse_args()
+
+    failed = False
+    for name, module in CASES.items():
+        timings, heavy = measure(module, args.repeat, HEAVY_MODULES + CASE_HEAVY_MODULES.get(name, []))
+        median = statistics.median(timings)
+        print(f"{name:22s} median {median * 1000:8.1f} ms   min {min(timings) * 1000:8.1f} ms")
+
+        if heavy:
+            print(f"   ❌ eagerly imported: {', '.join(heavy)}")
+            failed = True
+        if name == 'app' and median > args.budget:
+            print(f"   ❌ exceeds budget of {args.budget * 1000:.0f} ms")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Load Test
+=========
+
+Fires concurrent solve requests at a running server and reports throughput
+(requests/sec) and latency percentiles. The server can be started for the
+run, either as the development server or in pre-fork --serve mode.
+
+Usage:
+    python benchmarks/load_test.py --spawn dev [--concurrency 8] [--requests 200]
+    python benchmarks/load_test.py --spawn serve --workers 4
+    python benchmarks/load_test.py --url http://localhost:5000
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'hungarian_visualizer')
+
+
+def free_port():
+    """Pick an unused local port"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def spawn_server(kind, port, workers):
+    """Start the dev server or the pre-fork server, returning the process once it answers"""
+    if kind == 'dev':
+        code = f"from app import app; app.run(host='127.0.0.1', port={port}, threaded=True)"
+        command = [sys.executable, '-c', code]
+    else:
+        command = [sys.executable, 'run.py', '--serve', '--host', '127.0.0.1',
+                   '--port', str(port), '--workers', str(workers)]
+
+    process = subprocess.Popen(command, cwd=APP_DIR, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL)
+    url = f'http://127.0.0.1:{port}'
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(url + '/', timeout=1).read()
+            return process, url
+        except urllib.error.HTTPError:
+            return process, url  # Up, just unhappy with the probe
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f'{kind} server did not start on port {port}')
+
+
+def build_bodies(size, distinct, mode):
+    """Request bodies cycling through `distinct` matrices (repeats hit the result cache)"""
+    import numpy as np
+    rng = np.random.default_rng(0)
+    return [json.dumps({'matrix': rng.integers(1, 100, (size, size)).tolist(),
+                        'mode': mode}).encode('utf-8')
+            for _ in range(distinct)]
+
+
+def run_load(url, bodies, total, concurrency):
+    """Send `total` requests with `concurrency` threads, returning latencies and failures"""
+    latencies = []
+    failures = []
+    lock = threading.Lock()
+
+    def send(i):
+        request = urllib.request.Request(url + '/api/solve', data=bodies[i % len(bodies)],
+                                         headers={'Content-Type': 'application/json'})
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=120) as response:
+                response.read()
+            with lock:
+                latencies.append(time.perf_counter() - start)
+        except (urllib.error.URLError, ConnectionError) as e:
+            with lock:
+                failures.append(str(getattr(e, 'code', e)))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(send, range(total)))
+    return latencies, failures, time.perf_counter() - start
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure solve throughput of a server')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--url', help='base url of an already running server')
+    target.add_argument('--spawn', choices=['dev', 'serve'], help='start a server for the run')
+    parser.add_argument('--workers', type=int, default=4, help='workers for --spawn serve')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--size', type=int, default=6, help='matrix size')
+    parser.add_argument('--distinct', type=int, default=50, help='distinct matrices to cycle')
+    parser.add_argument('--mode', default='visual', choices=['visual', 'solve'])
+    args = parser.parse_args()
+
+    process = None
+    url = args.url
+    if args.spawn:
+        process, url = spawn_server(args.spawn, free_port(), args.workers)
+
+    try:
+        bodies = build_bodies(args.size, args.distinct, args.mode)
+        latencies, failures, elapsed = run_load(url, bodies, args.requests, args.concurrency)
+    finally:
+        if process is not None:
+            process.send_signal(signal.SIGTERM)
+            process.wait(timeout=30)
+
+    print(f"target      {args.spawn or url}  ({args.mode}, n={args.size}, "
+          f"concurrency {args.concurrency})")
+    print(f"requests    {len(latencies)} ok, {len(failures)} failed in {elapsed:.2f} s")
+    print(f"throughput  {len(latencies) / elapsed:.1f} requests/sec")
+    if latencies:
+        for label, fraction in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99)):
+            print(f"{label:11s} {percentile(latencies, fraction) * 1000:.1f} ms")
+    if failures:
+        print(f"failures    {', '.join(sorted(set(failures)))}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
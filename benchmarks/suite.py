@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+===============
+
+Times the solver engines (see scaling.ENGINES) across sizes and workload
+families, and the full /api/solve path through Flask's test client
+(visual mode with analytics and charts, headless mode with and without
+them). Results are written as JSON with environment metadata and can be
+compared against a stored baseline: the run fails when a case's median is
+slower than the baseline by more than the allowed fraction.
+
+Usage:
+    python benchmarks/suite.py [--quick] [--output results.json]
+    python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json [--max-slowdown 0.25]
+                               [--case-slowdown 'api/*=0.5']
+    python benchmarks/suite.py --corpus /tmp/corpus   # solver cases from a make_corpus.py corpus
+"""
+
+import argparse
+import contextlib
+import datetime
+import fnmatch
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'hungarian_visualizer')
+sys.path.insert(0, APP_DIR)
+
+# Benchmark solves must not land in the performance history or be answered from the result cache
+os.environ['HUNGARIAN_HISTORY_PATH'] = ''
+os.environ['HUNGARIAN_RESULT_CACHE_DIR'] = ''
+
+import numpy as np  # noqa: E402
+from matrix_generator import MatrixGenerator  # noqa: E402
+from scaling import ENGINES, run_engine  # noqa: E402
+
+DEFAULT_FAMILIES = ['uniform', 'euclidean', 'clustered', 'degenerate']
+DEFAULT_SIZES = [10, 50, 150]
+QUICK_SIZES = [10, 50]
+SEED = 0
+
+# Differences below this many seconds are noise, whatever the ratio
+DEFAULT_MIN_DELTA = 0.0005
+
+
+def time_case(function, repeats):
+    """Run function once to warm up, then `repeats` times; return timing statistics"""
+    function()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        'median': timings[len(timings) // 2] if len(timings) % 2 else
+        (timings[len(timings) // 2 - 1] + timings[len(timings) // 2]) / 2,
+        'min': timings[0],
+        'p95': timings[min(int(0.95 * len(timings)), len(timings) - 1)],
+        'repeats': repeats
+    }
+
+
+def solver_instances(families, sizes, corpus):
+    """(family, size, matrix) to time, generated from SEED or memory-mapped from a corpus"""
+    if corpus:
+        from workload_corpus import load_corpus
+        for entry in load_corpus(corpus):
+            if entry['family'] in families and entry['size'] in sizes:
+                yield entry['family'], entry['size'], entry['matrix']
+        return
+    generator = MatrixGenerator()
+    for family in families:
+        for size in sizes:
+            yield family, size, generator.generate_workload(family, size, seed=SEED)
+
+
+def solver_cases(families, sizes, repeats, corpus=None):
+    results = {}
+    for family, size, matrix in solver_instances(families, sizes, corpus):
+        for name in ENGINES:
+            def solve():
+                run_engine(name, matrix)
+            case = f'solver/{name}/{family}/n{size}'
+            results[case] = time_case(solve, repeats)
+            print(f"{case:45s} {results[case]['median'] * 1000:10.2f} ms")
+    return results
+
+
+def api_cases(sizes, repeats):
+    """Full request path: parsing, solve, analytics, charts and JSON encoding"""
+    from app import app
+    client = app.test_client()
+    visual_limit = app.config['MATRIX_SIZE_LIMITS']['visual']
+    generator = MatrixGenerator()
+
+    requests = {}
+    for size in (6, visual_limit):
+        matrix = generator.generate_workload('uniform', size, seed=SEED).tolist()
+        requests[f'api/visual/n{size}'] = {'matrix': matrix}
+    for size in sizes:
+        matrix = generator.generate_workload('uniform', size, seed=SEED).tolist()
+        requests[f'api/solve/n{size}'] = {'matrix': matrix, 'mode': 'solve'}
+        requests[f'api/solve_analytics_charts/n{size}'] = {'matrix': matrix, 'mode': 'solve',
+                                                           'analytics': True, 'charts': True}
+
+    results = {}
+    for case, body in requests.items():
+        def post():
+            # The visual path logs every matrix; keep that out of the timings' terminal
+            with contextlib.redirect_stdout(io.StringIO()):
+                response = client.post('/api/solve', json=body)
+            if response.status_code != 200:
+                raise RuntimeError(f'{case}: HTTP {response.status_code} {response.get_data(as_text=True)[:200]}')
+        results[case] = time_case(post, repeats)
+        print(f"{case:45s} {results[case]['median'] * 1000:10.2f} ms")
+    return results
+
+
+def environment():
+    """Metadata needed to judge whether two result files are comparable"""
+    def git(*args):
+        try:
+            return subprocess.run(['git', *args], cwd=APP_DIR, capture_output=True, text=True,
+                                  timeout=10).stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+    from importlib.metadata import version, PackageNotFoundError
+
+    def package_version(name):
+        try:
+            return version(name)
+        except PackageNotFoundError:
+            return None
+
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'flask': package_version('flask'),
+        'matplotlib': package_version('matplotlib'),
+        'git_commit': git('rev-parse', 'HEAD'),
+        'git_dirty': bool(git('status', '--porcelain', '--untracked-files=no'))
+    }
+
+
+def compare(results, baseline, max_slowdown, case_slowdowns, min_delta):
+    """Return (regressions, report lines) of results against a baseline"""
+    regressions = []
+    lines = []
+    for case, current in sorted(results['cases'].items()):
+        previous = baseline['cases'].get(case)
+        if previous is None:
+            lines.append(f"{case:45s} {'new':>10s}")
+            continue
+        allowed = max_slowdown
+        for pattern, fraction in case_slowdowns:
+            if fnmatch.fnmatch(case, pattern):
+                allowed = fraction
+        ratio = current['median'] / previous['median'] if previous['median'] > 0 else 1.0
+        regressed = ratio > 1 + allowed and current['median'] - previous['median'] > min_delta
+        if regressed:
+            regressions.append(case)
+        lines.append(f"{case:45s} {ratio:9.2f}x {'REGRESSION' if regressed else ''}")
+    for case in sorted(set(baseline['cases']) - set(results['cases'])):
+        lines.append(f"{case:45s} {'missing':>10s}")
+
+    differences = [key for key in ('python', 'numpy', 'machine', 'cpu_count')
+                   if baseline['environment'].get(key) != results['environment'].get(key)]
+    if differences:
+        lines.append(f"warning: environment differs from the baseline in {', '.join(differences)}")
+    return regressions, lines
+
+
+def parse_case_slowdown(value):
+    pattern, _, fraction = value.rpartition('=')
+    if not pattern:
+        raise argparse.ArgumentTypeError('expected PATTERN=FRACTION, e.g. api/*=0.5')
+    return pattern, float(fraction)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the solver and the /api/solve path')
+    parser.add_argument('--quick', action='store_true', help='fewer sizes and repeats')
+    parser.add_argument('--sizes', help='comma-separated solver sizes')
+    parser.add_argument('--families', help='comma-separated workload families')
+    parser.add_argument('--repeats', type=int)
+    parser.add_argument('--corpus', help='take solver instances from a make_corpus.py directory')
+    parser.add_argument('--no-api', action='store_true', help='skip the /api/solve cases')
+    parser.add_argument('--output', help='write results JSON here')
+    parser.add_argument('--save-baseline', help='write results JSON as the new baseline')
+    parser.add_argument('--baseline', help='compare against this baseline and fail on slowdowns')
+    parser.add_argument('--max-slowdown', type=float, default=0.25,
+                        help='allowed median slowdown as a fraction (default 0.25 = 25%%)')
+    parser.add_argument('--case-slowdown', type=parse_case_slowdown, action='append', default=[],
+                        metavar='PATTERN=FRACTION', help='allowed slowdown for cases matching a glob')
+    parser.add_argument('--min-delta', type=float, default=DEFAULT_MIN_DELTA,
+                        help='ignore slowdowns smaller than this many seconds')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')] if args.sizes else (
+        QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    families = args.families.split(',') if args.families else DEFAULT_FAMILIES
+    repeats = args.repeats or (3 if args.quick else 7)
+
+    cases = solver_cases(families, sizes, repeats, args.corpus)
+    if not args.no_api:
+        cases.update(api_cases(sizes, repeats))
+    results = {
+        'environment': environment(),
+        'settings': {'sizes': sizes, 'families': families, 'repeats': repeats, 'seed': SEED,
+                     'corpus': args.corpus},
+        'cases': cases
+    }
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as handle:
+                json.dump(results, handle, indent=2)
+            print(f"wrote {path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        regressions, lines = compare(results, baseline, args.max_slowdown, args.case_slowdown,
+                                     args.min_delta)
+        print(f"\nagainst {args.baseline} (allowed slowdown {args.max_slowdown:.0%})")
+        print('\n'.join(lines))
+        if regressions:
+            print(f"\n{len(regressions)} regression(s)")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
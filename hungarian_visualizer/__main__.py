@@ -0,0 +1,12 @@
+"""Entry point for `python -m hungarian_visualizer` (see cli.py)"""
+
+import os
+import sys
+
+# The application modules import each other by their flat names
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cli import main  # noqa: E402
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+import math
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Any, Optional, Tuple
+
+# Prior cost models per trace level: seconds = overhead + coefficient * n ** exponent.
+#   'full'  - visual mode: step trace, analytics and charts (chart rendering dominates)
+#   'steps' - headless solve that records steps and/or analytics
+#   'none'  - headless solve with step recording off
+PRIOR_COSTS = {
+    'full': (0.6, 3e-6, 2.0),
+    'steps': (0.005, 3e-6, 2.0),
+    'none': (0.0, 2e-6, 2.0)
+}
+
+# Smoothing factor for the per-size-bucket moving average of observed timings
+OBSERVATION_SMOOTHING = 0.3
+
+DEFAULT_ADMISSION_SETTINGS = {
+    'max_inflight_cost': 4.0,   # estimated seconds of heavy work allowed to run at once
+    'interactive_cost': 1.0,    # requests estimated below this always run immediately
+    'max_queue_wait': 5.0,      # seconds a heavy request may wait before a 429
+    'max_queued_cost': 20.0     # estimated seconds of heavy work allowed to wait
+}
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted within the configured budgets"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CostModel:
+    """Estimates solve time from n, engine and trace level, calibrated from observed timings
+
+    Observed timings are kept as a moving average per power-of-two size bucket.
+    A size with no observed bucket is extrapolated from the nearest smaller
+    observed bucket using the prior exponent, falling back to the prior model.
+    """
+
+    def __init__(self, priors: Optional[Dict[str, Tuple[float, float, float]]] = None):
+        self.priors = dict(PRIOR_COSTS if priors is None else priors)
+        self.buckets = {}  # (engine, trace) -> {bucket: [mean n, mean seconds]}
+        self.lock = threading.Lock()
+
+    def estimate(self, n: int, engine: str = 'hungarian', trace: str = 'full') -> float:
+        """Estimate the wall time of a solve in seconds"""
+        overhead, coefficient, exponent = self.priors.get(trace, self.priors['full'])
+        prior = overhead + coefficient * n ** exponent
+
+        with self.lock:
+            observed = self.buckets.get((engine, trace), {})
+            bucket = self._bucket(n)
+            if bucket in observed:
+                return observed[bucket][1]
+
+            lower = [b for b in observed if b < bucket]
+            if not lower:
+                return prior
+            bucket_n, bucket_seconds = observed[max(lower)]
+
+        # Scale only the size-dependent part of the nearest observed timing
+        variable = max(bucket_seconds - overhead, 0.0)
+        return overhead + variable * (n / max(bucket_n, 1)) ** exponent
+
+    def observe(self, n: int, seconds: float, engine: str = 'hungarian', trace: str = 'full'):
+        """Record an observed solve time"""
+        with self.lock:
+            observed = self.buckets.setdefault((engine, trace), {})
+            bucket = self._bucket(n)
+            if bucket not in observed:
+                observed[bucket] = [float(n), seconds]
+                return
+
+            entry = observed[bucket]
+            entry[0] += OBSERVATION_SMOOTHING * (n - entry[0])
+            entry[1] += OBSERVATION_SMOOTHING * (seconds - entry[1])
+
+    def get_calibration(self) -> Dict[str, Any]:
+        """Return the observed timings per engine/trace level and size bucket"""
+        with self.lock:
+            return {
+                f'{engine}/{trace}': {
+                    str(2 ** bucket): {'n': entry[0], 'seconds': entry[1]}
+                    for bucket, entry in sorted(observed.items())
+                }
+                for (engine, trace), observed in self.buckets.items()
+            }
+
+    @staticmethod
+    def _bucket(n: int) -> int:
+        return max(int(n), 1).bit_length()
+
+
+class AdmissionController:
+    """Admits solves against a budget of estimated in-flight work
+
+    Interactive requests (estimated below interactive_cost) bypass the budget
+    so their latency stays flat under load. Heavy requests run while their
+    combined estimated cost fits max_inflight_cost, otherwise they wait in a
+    FIFO queue and are rejected with a Retry-After hint when the queue is
+    full or the wait times out.
+    """
+
+    def __init__(self, cost_model: CostModel, max_inflight_cost: float = 4.0,
+                 interactive_cost: float = 1.0, max_queue_wait: float = 5.0,
+                 max_queued_cost: float = 20.0):
+        self.cost_model = cost_model
+        self.max_inflight_cost = max_inflight_cost
+        self.interactive_cost = interactive_cost
+        self.max_queue_wait = max_queue_wait
+        self.max_queued_cost = max_queued_cost
+
+        self.condition = threading.Condition()
+        self.queue = deque()
+        self.inflight_cost = 0.0
+        self.heavy_inflight = 0  # Exact count: summed float costs drift from 0 when drained
+        self.queued_cost = 0.0
+        self.stats = {'admitted': 0, 'interactive': 0, 'queued': 0, 'rejected': 0, 'inflight': 0}
+
+    @contextmanager
+    def admit(self, n: int, engine: str = 'hungarian', trace: str = 'full', blocking: bool = False):
+        """Hold an admission slot for a solve, recording its duration on exit
+
+        With blocking=True the caller waits as long as needed instead of being
+        rejected (used for streaming batch back-pressure).
+        """
+        cost = self.cost_model.estimate(n, engine, trace)
+        heavy = self.max_inflight_cost > 0 and cost > self.interactive_cost
+        if heavy:
+            self._acquire(cost, blocking)
+        else:
+            with self.condition:
+                self.stats['interactive'] += 1
+                self.stats['inflight'] += 1
+
+        start = perf_counter()
+        try:
+            yield cost
+        finally:
+            self.cost_model.observe(n, perf_counter() - start, engine, trace)
+            with self.condition:
+                self.stats['inflight'] -= 1
+                if heavy:
+                    self.heavy_inflight -= 1
+                    self.inflight_cost = self.inflight_cost - cost if self.heavy_inflight else 0.0
+                    self.condition.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return current load and counters"""
+        with self.condition:
+            return dict(self.stats, inflight_cost=self.inflight_cost,
+                        queued_cost=self.queued_cost, queue_length=len(self.queue))
+
+    def _acquire(self, cost: float, blocking: bool):
+        with self.condition:
+            if not self.queue and self._fits(cost):
+                self._start(cost)
+                return
+
+            if not blocking and self.queued_cost + cost > self.max_queued_cost:
+                self.stats['rejected'] += 1
+                raise AdmissionRejected('Server is busy, queue is full', self._retry_after())
+
+            ticket = object()
+            self.queue.append(ticket)
+            self.queued_cost += cost
+            self.stats['queued'] += 1
+            deadline = None if blocking else perf_counter() + self.max_queue_wait
+
+            try:
+                while not (self.queue[0] is ticket and self._fits(cost)):
+                    remaining = None if deadline is None else deadline - perf_counter()
+                    if remaining is not None and remaining <= 0:
+                        self.stats['rejected'] += 1
+                        raise AdmissionRejected('Server is busy, timed out waiting in queue',
+                                                self._retry_after())
+                    self.condition.wait(remaining)
+            finally:
+                self.queue.remove(ticket)
+                self.queued_cost = self.queued_cost - cost if self.queue else 0.0
+                self.condition.notify_all()
+
+            self._start(cost)
+
+    def _fits(self, cost: float) -> bool:
+        # An oversized request may still run alone once nothing heavy is in flight
+        return self.heavy_inflight == 0 or self.inflight_cost + cost <= self.max_inflight_cost
+
+    def _start(self, cost: float):
+        self.inflight_cost += cost
+        self.heavy_inflight += 1
+        self.stats['admitted'] += 1
+        self.stats['inflight'] += 1
+
+    def _retry_after(self) -> int:
+        # Work is effectively serialized by the GIL, so drain time ~ total estimated cost
+        return int(min(max(math.ceil(self.inflight_cost + self.queued_cost), 1), 60))
+
+
+def load_admission_settings(environ: Optional[Dict[str, str]] = None) -> Dict[str, float]:
+    """Build admission budgets, applying HUNGARIAN_<SETTING> environment overrides
+
+    Setting HUNGARIAN_MAX_INFLIGHT_COST=0 disables admission control.
+    """
+    environ = os.environ if environ is None else environ
+    settings = dict(DEFAULT_ADMISSION_SETTINGS)
+    for name in settings:
+        value = environ.get(f'HUNGARIAN_{name.upper()}')
+        if value:
+            settings[name] = float(value)
+    return settings
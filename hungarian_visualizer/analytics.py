@@ -1,57 +1,118 @@
 import numpy as np
 import time
-from typing import List, Dict, Any
-import psutil
+from typing import List, Dict, Any, Iterable, Optional
 import os
+from hungarian_algorithm import OPERATION_COUNTERS
+
+# Metric groups callers can select; each is computed on first access and memoized
+METRIC_GROUPS = ('steps', 'complexity', 'matrix', 'performance', 'memory', 'convergence', 'duals')
+
+# Above this size the condition number and determinant are estimated in O(n²)
+# instead of computed with O(n³) linear algebra
+EXACT_LINALG_MAX_SIZE = 200
+
+# Power iterations used to estimate the largest singular value
+POWER_ITERATIONS = 20
+
+# Counters summed into each phase's measured work: cells touched plus graph
+# nodes/edges walked (attempt and pass counts are reported but not summed)
+PHASE_WORK_COUNTERS = {
+    'reduction': ['reduction_cells_scanned', 'reduction_cells_updated'],
+    'matching': ['matching_cells_scanned', 'dfs_visits', 'edges_scanned'],
+    'covering': ['cover_cells_scanned'],
+    'adjustment': ['adjustment_cells_scanned', 'adjustment_cells_updated']
+}
 
 class AnalyticsTracker:
-    def __init__(self):
+    def __init__(self, groups: Optional[Iterable[str]] = None):
+        groups = METRIC_GROUPS if groups is None else tuple(groups)
+        unknown = [group for group in groups if group not in METRIC_GROUPS]
+        if unknown:
+            raise ValueError(f"Unknown metric groups: {', '.join(unknown)} "
+                             f"(available: {', '.join(METRIC_GROUPS)})")
+        self.groups = groups
         self.metrics = {}
-        self.process = psutil.Process(os.getpid())
+        self._reset()
+    
+    def _reset(self):
+        self.steps = []
+        self.execution_time = 0.0
+        self.original_matrix = None
+        self.counters = None
+        self.computed = {}  # group -> keys it added to self.metrics
+        self._arrays = {}   # intermediate arrays shared between groups
         
-    def calculate_metrics(self, steps: List[Dict], execution_time: float, original_matrix: np.ndarray):
-        """Calculate comprehensive analytics for the algorithm execution"""
-        try:
-            n = len(original_matrix)
-            
-            # Basic metrics
-            self.metrics['execution_time'] = execution_time
-            self.metrics['num_steps'] = len(steps)
-            self.metrics['matrix_size'] = n
-            
-            # Extract iteration count from final step
-            if steps and 'iterations_count' in steps[-1]:
-                self.metrics['iterations_count'] = steps[-1]['iterations_count']
-            else:
-                self.metrics['iterations_count'] = 0
-            
-            # Step-wise analysis
+    def calculate_metrics(self, steps: List[Dict], execution_time: float, original_matrix: np.ndarray,
+                          counters: Optional[Dict[str, int]] = None):
+        """Record a run for analysis; metric groups are computed when first accessed
+        
+        counters are the solver's measured operation counts (HungarianAlgorithm
+        with count_operations=True); without them operations are estimated.
+        """
+        self._reset()
+        self.steps = steps
+        self.execution_time = execution_time
+        self.original_matrix = np.asarray(original_matrix)
+        self.counters = counters
+        
+        # Basic metrics
+        self.metrics = {
+            'execution_time': execution_time,
+            'num_steps': len(steps),
+            'matrix_size': len(original_matrix)
+        }
+        
+        # Extract iteration count from final step
+        if steps and 'iterations_count' in steps[-1]:
+            self.metrics['iterations_count'] = steps[-1]['iterations_count']
+        else:
+            self.metrics['iterations_count'] = 0
+    
+    def get_group(self, group: str) -> Dict[str, Any]:
+        """Compute (once) and return the metrics of one group, selected or not"""
+        if group not in METRIC_GROUPS:
+            raise ValueError(f"Unknown metric group: {group}")
+        
+        if group not in self.computed:
+            before = set(self.metrics)
+            try:
+                self._compute_group(group)
+            except Exception as e:
+                print(f"Error computing {group} metrics: {e}")
+                self.metrics['error'] = str(e)
+            self.computed[group] = [key for key in self.metrics if key not in before]
+        
+        return {key: self.metrics[key] for key in self.computed[group]}
+    
+    def _compute_group(self, group: str):
+        steps = self.steps
+        n = self.metrics['matrix_size']
+        if group == 'steps':
             self._analyze_steps(steps)
-            
-            # Complexity analysis
+        elif group == 'complexity':
             self._analyze_complexity(steps, n)
-            
-            # Matrix properties
-            self._analyze_matrix_properties(original_matrix, steps)
-            
-            # Performance metrics
-            self._calculate_performance_metrics(steps, execution_time, n)
-            
-            # Memory analysis
+        elif group == 'matrix':
+            self._analyze_matrix_properties(self.original_matrix, steps)
+        elif group == 'performance':
+            self._calculate_performance_metrics(steps, self.execution_time, n)
+        elif group == 'memory':
             self._analyze_memory_usage()
-            
-            # Convergence analysis
+        elif group == 'convergence':
             self._analyze_convergence(steps)
-            
-        except Exception as e:
-            print(f"Error in calculate_metrics: {e}")
-            # Set basic metrics even if detailed analysis fails
-            self.metrics = {
-                'execution_time': execution_time,
-                'num_steps': len(steps),
-                'matrix_size': len(original_matrix),
-                'error': str(e)
-            }
+        elif group == 'duals':
+            self._track_dual_variables(steps)
+    
+    def _final_matrix(self) -> Optional[np.ndarray]:
+        """Final step matrix, converted once and shared between groups"""
+        if 'final' not in self._arrays:
+            self._arrays['final'] = np.asarray(self.steps[-1]['matrix']) if self.steps else None
+        return self._arrays['final']
+    
+    def _final_zero_count(self) -> int:
+        if 'final_zeros' not in self._arrays:
+            final_matrix = self._final_matrix()
+            self._arrays['final_zeros'] = 0 if final_matrix is None else int(np.count_nonzero(final_matrix == 0))
+        return self._arrays['final_zeros']
     
     def _analyze_steps(self, steps: List[Dict]):
         """Analyze step-by-step progression"""
@@ -86,6 +147,10 @@ class AnalyticsTracker:
         # Theoretical complexity: O(n³)
         theoretical_ops = n ** 3
         
+        if self.counters is not None:
+            self._report_measured_operations(theoretical_ops)
+            return
+        
         # Estimate actual operations
         actual_ops = 0
         for step in steps:
@@ -107,6 +172,25 @@ class AnalyticsTracker:
             'comparisons': self._count_operations(steps, 'compare'),
             'assignments': self._count_operations(steps, 'assign')
         }
+        self.metrics['operations_measured'] = False
+    
+    def _report_measured_operations(self, theoretical_ops: int):
+        """Report the solver's operation counters, with the work done per phase"""
+        counters = self.counters
+        phase_work = {phase: sum(counters.get(name, 0) for name in names)
+                      for phase, names in PHASE_WORK_COUNTERS.items()}
+        actual_ops = sum(phase_work.values())
+        
+        self.metrics['theoretical_complexity'] = theoretical_ops
+        self.metrics['actual_operations'] = actual_ops
+        self.metrics['complexity_ratio'] = actual_ops / theoretical_ops if theoretical_ops > 0 else 0
+        self.metrics['operations'] = phase_work
+        self.metrics['operations_measured'] = True
+        self.metrics['operation_counters'] = {
+            phase: {name: counters.get(name, 0) for name in names}
+            for phase, names in OPERATION_COUNTERS.items()
+        }
+        self.metrics['dominant_phase'] = max(phase_work, key=phase_work.get) if actual_ops else None
     
     def _count_operations(self, steps: List[Dict], op_type: str) -> int:
         """Estimate operation counts by step type"""
@@ -152,31 +236,74 @@ class AnalyticsTracker:
             'std': float(np.std(original_matrix)),
             'min': float(np.min(original_matrix)),
             'max': float(np.max(original_matrix)),
-            'condition_number': float(np.linalg.cond(original_matrix)),
-            'determinant': float(np.linalg.det(original_matrix)),
             'trace': float(np.trace(original_matrix)),
-            'frobenius_norm': float(np.linalg.norm(original_matrix, 'fro'))
+            'frobenius_norm': float(np.linalg.norm(original_matrix, 'fro')),
+            **self._linear_algebra_properties(original_matrix)
         }
         
         # Matrix evolution
-        if steps:
-            final_matrix = np.array(steps[-1]['matrix'])
+        final_matrix = self._final_matrix()
+        if final_matrix is not None:
+            zeros_count = self._final_zero_count()
             self.metrics['final_properties'] = {
-                'zeros_count': int(np.sum(final_matrix == 0)),
-                'zero_density': float(np.sum(final_matrix == 0) / (n * n)),
+                'zeros_count': zeros_count,
+                'zero_density': float(zeros_count / (n * n)),
                 'frobenius_norm': float(np.linalg.norm(final_matrix, 'fro'))
             }
     
+    def _linear_algebra_properties(self, matrix: np.ndarray) -> Dict[str, Any]:
+        """Condition number and determinant, bounded cheaply for large matrices
+        
+        Up to EXACT_LINALG_MAX_SIZE both are exact (the determinant via slogdet,
+        so it reports None instead of overflowing). Above it the O(n³) values are
+        replaced by O(n²) bounds: a condition number lower bound, sigma_max from
+        power iteration over the smallest row/column norm (which bounds
+        sigma_min from above), and the Hadamard upper bound on log|det|.
+        """
+        matrix = matrix.astype(float, copy=False)
+        n = len(matrix)
+        if n <= EXACT_LINALG_MAX_SIZE:
+            sign, log_abs_det = np.linalg.slogdet(matrix)
+            determinant = sign * np.exp(log_abs_det) if log_abs_det < 709 else None
+            return {
+                'condition_number': _finite_or_none(np.linalg.cond(matrix)),
+                'determinant': _finite_or_none(determinant),
+                'log_abs_determinant': _finite_or_none(log_abs_det),
+                'linalg_estimated': False
+            }
+        
+        vector = np.random.default_rng(0).standard_normal(n)
+        sigma_max = 0.0
+        for _ in range(POWER_ITERATIONS):
+            vector = matrix.T @ (matrix @ vector)
+            norm = np.linalg.norm(vector)
+            if norm == 0:
+                break
+            sigma_max = np.sqrt(norm)
+            vector /= norm
+        
+        row_norms = np.linalg.norm(matrix, axis=1)
+        column_norms = np.linalg.norm(matrix, axis=0)
+        sigma_min_bound = min(row_norms.min(), column_norms.min())
+        with np.errstate(divide='ignore'):
+            hadamard = min(np.log(row_norms).sum(), np.log(column_norms).sum())
+        
+        return {
+            'condition_number': None,
+            'condition_number_lower_bound': _finite_or_none(sigma_max / sigma_min_bound) if sigma_min_bound > 0 else None,
+            'determinant': None,
+            'log_abs_determinant': None,
+            'log_abs_determinant_upper_bound': _finite_or_none(hadamard),
+            'linalg_estimated': True
+        }
+    
     def _calculate_performance_metrics(self, steps: List[Dict], execution_time: float, n: int):
         """Calculate performance and efficiency metrics"""
         # Time per step
         self.metrics['time_per_step'] = execution_time / len(steps) if steps else 0
         
         # Efficiency ratio: zeros created per n²
-        final_zeros = 0
-        if steps:
-            final_matrix = np.array(steps[-1]['matrix'])
-            final_zeros = np.sum(final_matrix == 0)
+        final_zeros = self._final_zero_count()
         
         self.metrics['efficiency_ratio'] = final_zeros / (n * n) if n > 0 else 0
         
@@ -199,11 +326,13 @@ class AnalyticsTracker:
     def _analyze_memory_usage(self):
         """Analyze memory usage during execution"""
         try:
-            memory_info = self.process.memory_info()
+            import psutil  # Deferred so importing analytics stays cheap
+            process = psutil.Process(os.getpid())
+            memory_info = process.memory_info()
             self.metrics['memory_usage'] = {
                 'rss': memory_info.rss,  # Resident Set Size
                 'vms': memory_info.vms,  # Virtual Memory Size
-                'percent': self.process.memory_percent()
+                'percent': process.memory_percent()
             }
         except:
             self.metrics['memory_usage'] = {
@@ -233,39 +362,55 @@ class AnalyticsTracker:
                 'convergence_achieved': line_counts[-1] == self.metrics['matrix_size'] if line_counts else False,
                 'iterations_to_converge': len(line_counts)
             }
-        
-        # Dual variables tracking (simplified)
-        self._track_dual_variables(steps)
     
     def _track_dual_variables(self, steps: List[Dict]):
-        """Track dual variables for LP insight"""
-        # Simplified dual variable tracking
-        # In the Hungarian algorithm, dual variables correspond to row and column potentials
+        """Report the solver's dual potentials, dual objective and primal-dual gap per step
+        
+        Steps carry the row/column potentials u, v the solver maintains; the
+        dual objective sum(u) + sum(v) is a lower bound on the optimal cost and
+        the gap is measured against the cost of the final assignment.
+        """
+        primal_cost = None
+        final_step = steps[-1] if steps else {}
+        if 'assignment' in final_step and self.original_matrix is not None:
+            rows, columns = zip(*final_step['assignment']) if final_step['assignment'] else ((), ())
+            primal_cost = float(self.original_matrix[list(rows), list(columns)].sum())
         
-        dual_evolution = []
+        evolution = []
         for step in steps:
-            if step.get('type') in ['row_reduction', 'column_reduction']:
-                matrix = np.array(step['matrix'])
-                n = len(matrix)
-                
-                # Row potentials (simplified)
-                row_potentials = [np.min(matrix[i, :]) for i in range(n)]
-                col_potentials = [np.min(matrix[:, j]) for j in range(n)]
-                
-                dual_evolution.append({
-                    'row_potentials': row_potentials,
-                    'column_potentials': col_potentials,
-                    'dual_objective': sum(row_potentials) + sum(col_potentials)
-                })
-        
-        self.metrics['dual_variables'] = dual_evolution
+            if 'dual_objective' not in step:
+                continue
+            entry = {
+                'step_number': step.get('step_number'),
+                'type': step.get('type'),
+                'dual_objective': step['dual_objective']
+            }
+            if primal_cost is not None:
+                entry['gap'] = primal_cost - step['dual_objective']
+            evolution.append(entry)
+        
+        final_duals = {}
+        if 'row_potentials' in final_step:
+            final_duals = {
+                'row_potentials': final_step['row_potentials'],
+                'column_potentials': final_step['column_potentials'],
+                'dual_objective': final_step['dual_objective'],
+                'primal_cost': primal_cost,
+                'gap': evolution[-1].get('gap') if evolution else None
+            }
+        
+        self.metrics['dual_variables'] = dict(final_duals, evolution=evolution)
     
     def get_metrics(self) -> Dict[str, Any]:
-        """Return all calculated metrics"""
+        """Return the basic metrics plus every selected group"""
+        for group in self.groups:
+            self.get_group(group)
         return self.metrics
     
     def get_summary(self) -> Dict[str, Any]:
         """Return a summary of key metrics"""
+        self.get_group('performance')
+        self.get_group('matrix')
         return {
             'execution_time': self.metrics.get('execution_time', 0),
             'num_steps': self.metrics.get('num_steps', 0),
@@ -273,4 +418,11 @@ class AnalyticsTracker:
             'efficiency_ratio': self.metrics.get('efficiency_ratio', 0),
             'convergence_rate': self.metrics.get('convergence_rate', 0),
             'final_zero_density': self.metrics.get('final_properties', {}).get('zero_density', 0)
-        }
\ No newline at end of file
+        }
+
+def _finite_or_none(value) -> Optional[float]:
+    """Convert to float, mapping inf/nan (not valid JSON) to None"""
+    if value is None:
+        return None
+    value = float(value)
+    return value if np.isfinite(value) else None
@@ -1,36 +1,144 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
 import numpy as np
 import json
 import time
 import base64
+import gzip
 import io
-import matplotlib
+import os
+import tempfile
+import threading
 import time
+import zlib
+from collections import OrderedDict
+from contextlib import nullcontext
 from time import perf_counter
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import seaborn as sns
-from hungarian_algorithm import HungarianAlgorithm
+from hungarian_algorithm import HungarianAlgorithm, SOLVER_DTYPES
 from analytics import AnalyticsTracker
 from matrix_generator import MatrixGenerator
+from binary_trace import TRACE_MIMETYPE, encode_binary_trace
+from validation import load_size_limits, size_limit_error, find_duplicate_groups, describe_duplicate_groups
+from admission import AdmissionController, AdmissionRejected, CostModel, load_admission_settings
+from run_store import RunStore, DEFAULT_RUN_STORE_DIR
+from result_cache import ResultCache
+from profiler import PhaseProfiler, to_chrome_trace, to_speedscope, strip_events
+from memory_tracker import SolveMemoryTracker
+from performance_history import PerformanceHistory, DEFAULT_HISTORY_PATH
+from scaling import ScalingAnalyzer, geometric_sizes
+from simulator_track import build_simulator_track, SIMULATOR_TRACK_VERSION
+from matrix_tiles import block_aggregate, default_block, matrix_tile
+from run_export import EXPORT_FORMATS, export_chunks
+from trace_archive import ARCHIVE_EXTENSION
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # Fall back to gzip when brotli is not installed
 
 app = Flask(__name__)
 CORS(app)
 
-# Configure matplotlib for better plots
-try:
-    plt.style.use('seaborn-v0_8')
-except:
-    try:
-        plt.style.use('seaborn')
-    except:
-        pass  # Use default style if seaborn styles not available
+# Per-mode matrix size limits ('visual', 'solve', 'batch')
+app.config['MATRIX_SIZE_LIMITS'] = load_size_limits()
 
-try:
-    sns.set_palette("husl")
-except:
-    pass  # Use default palette if not available
+# Admission control: budgets of estimated in-flight solve time (see admission.py)
+app.config['ADMISSION'] = load_admission_settings()
+admission = AdmissionController(CostModel(), **app.config['ADMISSION'])
+
+# Solved runs are kept by id so large traces can be paged (see run_store.py)
+app.config['RUN_STORE_DIR'] = os.environ.get('HUNGARIAN_RUN_STORE_DIR', DEFAULT_RUN_STORE_DIR)
+app.config['INLINE_STEP_CELLS'] = 250_000  # larger traces are returned one page at a time
+app.config['STEP_PAGE_SIZE'] = 20
+app.config['MAX_STEP_PAGE_SIZE'] = 500
+# Write-through makes runs visible to every worker process sharing the directory
+app.config['RUN_STORE_WRITE_THROUGH'] = os.environ.get('HUNGARIAN_RUN_STORE_WRITE_THROUGH') == '1'
+run_store = RunStore(app.config['RUN_STORE_DIR'], write_through=app.config['RUN_STORE_WRITE_THROUGH'],
+                     dumps=app.json.dumps)
+
+# Optional solve-result cache shared across worker processes (see run.py --serve)
+app.config['RESULT_CACHE_DIR'] = os.environ.get('HUNGARIAN_RESULT_CACHE_DIR')
+result_cache = ResultCache(app.config['RESULT_CACHE_DIR']) if app.config['RESULT_CACHE_DIR'] else None
+
+# Per-run performance summaries behind /api/stats (see performance_history.py); empty path disables
+app.config['HISTORY_PATH'] = os.environ.get('HUNGARIAN_HISTORY_PATH', DEFAULT_HISTORY_PATH)
+performance_history = PerformanceHistory(app.config['HISTORY_PATH']) if app.config['HISTORY_PATH'] else None
+
+# Response compression settings
+NDJSON_MIMETYPE = 'application/x-ndjson'
+COMPRESSIBLE_MIMETYPES = {'application/json', TRACE_MIMETYPE}
+COMPRESS_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Streamed exports of runs with at least this many step cells are compressed on the fly
+EXPORT_COMPRESS_MIN_CELLS = 10_000
+
+# Charts can be disabled entirely for headless/API-only workers
+app.config['CHARTS_ENABLED'] = os.environ.get('HUNGARIAN_CHARTS', '1') != '0'
+
+# Final-matrix heatmap: cell values are annotated up to this size, larger
+# matrices are drawn as at most HEATMAP_MAX_BLOCKS x HEATMAP_MAX_BLOCKS block minimums
+app.config['HEATMAP_ANNOTATE_MAX'] = 20
+app.config['HEATMAP_MAX_BLOCKS'] = 200
+
+# Step matrices most recently converted for /api/runs/<run_id>/tiles, by (run_id, step)
+TILE_MATRIX_CACHE_SIZE = 8
+_tile_matrices = OrderedDict()
+_tile_matrices_lock = threading.Lock()
+
+# Metric groups read by the analytics panel and exports; the rest are computed on request only
+VISUAL_METRIC_GROUPS = ('steps', 'complexity', 'matrix', 'performance', 'convergence')
+
+# Scaling analysis defaults and caps (see /api/scaling)
+app.config['SCALING_DEFAULTS'] = {'min_size': 8, 'max_size': 96, 'points': 6, 'repeats': 3}
+app.config['SCALING_MAX_POINTS'] = 12
+app.config['SCALING_MAX_REPEATS'] = 10
+# Estimated seconds of solving (admission cost model, summed over sizes x repeats x engines) one request may ask for
+app.config['SCALING_MAX_COST'] = float(os.environ.get('HUNGARIAN_SCALING_MAX_COST', 60))
+
+# Element types a headless solve may ask for with "dtype"; the solver works in them without upcasting
+INPUT_DTYPES = {np.dtype(dtype).name: np.dtype(dtype) for dtype in SOLVER_DTYPES}
+
+# Text values _parse_flag understands; any other analytics text is a list of metric groups
+BOOLEAN_WORDS = ('', '0', '1', 'true', 'false', 'yes', 'no', 'on', 'off')
+
+# matplotlib/seaborn are imported on the first chart request (see _load_plotting)
+# to keep server start-up fast
+_plotting = None
+_plotting_lock = threading.Lock()
+
+def _load_plotting():
+    """Import and configure the plotting stack on first use, or None if unavailable"""
+    global _plotting
+    with _plotting_lock:
+        if _plotting is None:
+            try:
+                import matplotlib
+                matplotlib.use('Agg')
+                import matplotlib.pyplot as plt
+                import seaborn as sns
+            except ImportError as e:
+                print(f"Charts disabled, plotting libraries unavailable: {e}")
+                _plotting = False
+                return None
+            
+            # Configure matplotlib for better plots
+            try:
+                plt.style.use('seaborn-v0_8')
+            except:
+                try:
+                    plt.style.use('seaborn')
+                except:
+                    pass  # Use default style if seaborn styles not available
+            
+            try:
+                sns.set_palette("husl")
+            except:
+                pass  # Use default palette if not available
+            
+            _plotting = (plt, sns)
+    
+    return _plotting or None
 
 @app.route('/')
 def index():
@@ -38,15 +146,25 @@ def index():
 
 @app.route('/api/generate_matrix', methods=['POST'])
 def generate_matrix():
-    """Generate a new random matrix"""
+    """Generate a new random matrix
+    
+    "family" picks a workload family instead (see matrix_generator.WORKLOAD_FAMILIES)
+    and "seed" makes the matrix reproducible.
+    """
     try:
         data = request.get_json()
         size = data.get('size', 4)
         min_val = data.get('min_val', 1)
         max_val = data.get('max_val', 20)
         
+        seed = data.get('seed')
+        family = data.get('family')
+        
         generator = MatrixGenerator()
-        matrix = generator.generate_random_matrix(size, min_val, max_val)
+        if family:
+            matrix = generator.generate_workload(family, size, seed=seed, max_value=max_val)
+        else:
+            matrix = generator.generate_random_matrix(size, min_val, max_val, seed=seed)
         
         return jsonify({
             'success': True,
@@ -76,10 +194,42 @@ def get_example():
 
 @app.route('/api/solve', methods=['POST'])
 def solve_hungarian():
-    """Solve Hungarian algorithm with full step tracking"""
+    """Solve Hungarian algorithm with full step tracking
+    
+    Pass "mode": "solve" for a headless solve that skips the step trace and
+    charts and allows the larger headless size limit.
+    
+    Every run is stored under the returned run_id. Traces larger than
+    INLINE_STEP_CELLS (or when "steps_page_size" is given) only include the
+    first page of steps; the rest is served by /api/runs/<run_id>/steps.
+    Visual solves also return "simulator", the bipartite simulator frames
+    (zero edges, matching, cover lines and theta per round as index arrays,
+    see simulator_track.py), which is never paged.
+    
+    "profile": true times each solver phase (add "cprofile": true for a
+    per-function breakdown); the response carries the phase summary and the
+    timeline is exported by /api/runs/<run_id>/profile. "memory": true adds a
+    per-solve allocation breakdown (memory_profile).
+    """
     try:
         print("Starting Hungarian algorithm solve...")
         data = request.get_json()
+        mode = data.get('mode', 'visual')
+        profiler = _make_profiler(data)
+        memory_tracker = SolveMemoryTracker() if _parse_flag(data.get('memory')) else None
+        if mode != 'visual':
+            result = _solve_headless(0, data, mode=mode,
+                                     analytics=_parse_metric_groups(data.get('analytics')),
+                                     charts=_parse_flag(data.get('charts')),
+                                     profiler=profiler, memory_tracker=memory_tracker)
+            if not result['success']:
+                return jsonify({'success': False, 'error': '; '.join(result['errors'])}), 400
+            if 'steps' in result or 'profile' in result:
+                result['run_id'] = run_store.put(result)
+            if 'profile' in result:
+                result['profile'] = strip_events(result['profile'])
+            return jsonify(result)
+        
         matrix = np.array(data['matrix'])
         print(f"Matrix shape: {matrix.shape}")
         print(f"Matrix:\n{matrix}")
@@ -88,44 +238,567 @@ def solve_hungarian():
         if not _validate_matrix(matrix):
             return jsonify({'success': False, 'error': 'Invalid matrix format'}), 400
         
-        # Initialize algorithm and analytics
-        print("Initializing Hungarian algorithm...")
-        hungarian = HungarianAlgorithm(matrix)
-        analytics = AnalyticsTracker()
+        if profiler is not None or memory_tracker is not None:
+            # Measurements of a cached result would be stale
+            payload = _solve_visual(matrix, profiler, memory_tracker)
+        else:
+            payload = _cached_result(matrix, {'mode': 'visual', 'simulator': SIMULATOR_TRACK_VERSION}, lambda: _solve_visual(matrix))
+        steps = payload['steps']
+        
+        payload['run_id'] = run_store.put(payload)
+        payload['num_steps'] = len(steps)
+        if 'profile' in payload:
+            payload['profile'] = strip_events(payload['profile'])
         
-        # Solve with step tracking using high-precision timer
-        print("Starting algorithm execution...")
-        start_time = perf_counter()
-        steps, assignment, total_cost = hungarian.solve_with_steps()
-        end_time = perf_counter()
+        # Large traces are paged: send the first page, the rest is fetched on demand
+        page_size = data.get('steps_page_size')
+        if page_size or len(steps) * matrix.size > app.config['INLINE_STEP_CELLS']:
+            page_size = min(int(page_size or app.config['STEP_PAGE_SIZE']), app.config['MAX_STEP_PAGE_SIZE'])
+            payload['steps'] = steps[:page_size]
+            payload['steps_paged'] = True
+        
+        if _wants_binary_trace():
+            return Response(encode_binary_trace(payload, dumps=app.json.dumps),
+                            mimetype=TRACE_MIMETYPE)
+        
+        return jsonify(payload)
+        
+    except AdmissionRejected as e:
+        return _admission_rejected(e)
+    except Exception as e:
+        print(f"Error in solve_hungarian: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+def _solve_visual(matrix, profiler=None, memory_tracker=None):
+    """Solve with the full step trace, analytics and charts for the visual mode"""
+    with admission.admit(matrix.shape[0], trace='full'), memory_tracker or nullcontext():
+        with _memory_section(memory_tracker, 'solver'):
+            # Initialize algorithm and analytics
+            print("Initializing Hungarian algorithm...")
+            hungarian = HungarianAlgorithm(matrix, count_operations=True, profiler=profiler,
+                                           memory_tracker=memory_tracker)
+            
+            # Solve with step tracking using high-precision timer
+            print("Starting algorithm execution...")
+            start_time = perf_counter()
+            steps, assignment, total_cost = hungarian.solve_with_steps()
+            end_time = perf_counter()
         execution_time = end_time - start_time
         print(f"Algorithm completed in {execution_time:.6f} seconds")
         print(f"Steps: {len(steps)}, Assignment: {assignment}, Total cost: {total_cost}")
         
         # Calculate analytics
         print("Calculating analytics...")
-        analytics.calculate_metrics(steps, end_time - start_time, matrix)
+        with _memory_section(memory_tracker, 'analytics'):
+            analytics = AnalyticsTracker(groups=VISUAL_METRIC_GROUPS)
+            analytics.calculate_metrics(steps, end_time - start_time, matrix, hungarian.counters)
+            metrics = analytics.get_metrics()
         
         # Generate visualizations
         print("Generating charts...")
-        charts = _generate_charts(steps, analytics)
+        with _memory_section(memory_tracker, 'charts'):
+            charts = _generate_charts(steps, analytics)
         
         print("Returning results...")
-        return jsonify({
+        payload = {
             'success': True,
             'steps': steps,
             'assignment': assignment,
             'total_cost': int(total_cost),
-            'analytics': analytics.get_metrics(),
+            'analytics': metrics,
             'charts': charts,
-            'execution_time': end_time - start_time
-        })
+            'execution_time': end_time - start_time,
+            'dual_objective': hungarian.dual_objective,
+            'simulator': build_simulator_track(steps)
+        }
+        if profiler is not None:
+            payload['profile'] = profiler.get_profile()
+        if memory_tracker is not None:
+            payload['memory_profile'] = memory_tracker.get_report()
+    
+    _record_history(matrix, hungarian, execution_time, 'full', payload)
+    return payload
+
+def _memory_section(memory_tracker, name):
+    """Track a section of a solve with memory_tracker, or do nothing without one"""
+    if memory_tracker is None:
+        return nullcontext()
+    return memory_tracker.section(name)
+
+def _make_profiler(options):
+    """Build a PhaseProfiler when the request asks for profiling, else None"""
+    use_cprofile = _parse_flag(options.get('cprofile'))
+    if _parse_flag(options.get('profile')) or use_cprofile:
+        return PhaseProfiler(use_cprofile=use_cprofile)
+    return None
+
+def _cached_result(matrix, options, compute):
+    """Return compute() through the shared result cache when it is enabled"""
+    if result_cache is None:
+        return compute()
+    
+    key = ResultCache.make_key(matrix, **options)
+    cached = result_cache.get(key)
+    if cached is not None:
+        result = json.loads(cached)
+        result['cached'] = True
+        return result
+    
+    result = compute()
+    result_cache.put(key, app.json.dumps(result).encode('utf-8'))
+    return result
+
+@app.route('/api/runs/<run_id>/steps', methods=['GET'])
+def get_run_steps(run_id):
+    """Return a page of steps from a stored run (?from=&to=, end exclusive)"""
+    summary = run_store.get_summary(run_id)
+    if summary is None:
+        return jsonify({'success': False, 'error': 'Run not found'}), 404
+    
+    num_steps = summary['num_steps']
+    start = request.args.get('from', 0, type=int)
+    end = request.args.get('to', start + app.config['STEP_PAGE_SIZE'], type=int)
+    if start < 0 or end < start:
+        return jsonify({'success': False, 'error': 'Invalid step range'}), 400
+    end = min(end, num_steps, start + app.config['MAX_STEP_PAGE_SIZE'])
+    
+    steps = run_store.get_steps(run_id, start, end)
+    if steps is None:
+        return jsonify({'success': False, 'error': 'Run not found'}), 404
+    
+    payload = {
+        'success': True,
+        'run_id': run_id,
+        'from': start,
+        'to': start + len(steps),
+        'num_steps': num_steps,
+        'steps': steps
+    }
+    
+    if _wants_binary_trace():
+        return Response(encode_binary_trace(payload, dumps=app.json.dumps),
+                        mimetype=TRACE_MIMETYPE)
+    return jsonify(payload)
+
+@app.route('/api/runs/<run_id>/tiles', methods=['GET'])
+def get_run_tile(run_id):
+    """Return a window of one step matrix for the canvas matrix view
+    
+    Query options: step, row, col, rows, cols (the window in matrix cells,
+    default the whole matrix) and block. With block > 1 every block x block
+    square is reduced to its minimum and zero count (see matrix_tiles.py);
+    the block is raised as needed to keep the tile within MAX_TILE_CELLS and
+    capped at the window size.
+    """
+    summary = run_store.get_summary(run_id)
+    if summary is None:
+        return jsonify({'success': False, 'error': 'Run not found'}), 404
+    
+    step = request.args.get('step', 0, type=int)
+    if not 0 <= step < summary['num_steps']:
+        return jsonify({'success': False, 'error': 'Invalid step'}), 400
+    
+    n = summary['n']
+    row = request.args.get('row', 0, type=int)
+    col = request.args.get('col', 0, type=int)
+    rows = request.args.get('rows', n, type=int)
+    cols = request.args.get('cols', n, type=int)
+    block = request.args.get('block', 1, type=int)
+    if min(row, col, rows, cols) < 0 or block < 1:
+        return jsonify({'success': False, 'error': 'Invalid tile window'}), 400
+    
+    matrix = _tile_matrix(run_id, step)
+    if matrix is None:
+        return jsonify({'success': False, 'error': 'Run not found'}), 404
+    rows, cols = min(rows, n - min(row, n)), min(cols, n - min(col, n))
+    # At least enough to fit MAX_TILE_CELLS; a block larger than the window adds nothing
+    block = min(max(block, default_block(rows, cols)), max(rows, cols, 1))
+    
+    tile = matrix_tile(matrix, row, col, rows, cols, block=block)
+    return jsonify(dict({'success': True, 'run_id': run_id, 'step': step, 'n': n}, **tile))
+
+def _tile_matrix(run_id, step):
+    """Step matrix of a stored run as an array, keeping the last few converted"""
+    key = (run_id, step)
+    with _tile_matrices_lock:
+        if key in _tile_matrices:
+            _tile_matrices.move_to_end(key)
+            return _tile_matrices[key]
+    
+    steps = run_store.get_steps(run_id, step, step + 1)
+    if not steps:
+        return None
+    matrix = np.asarray(steps[0]['matrix'])
+    
+    with _tile_matrices_lock:
+        _tile_matrices[key] = matrix
+        while len(_tile_matrices) > TILE_MATRIX_CACHE_SIZE:
+            _tile_matrices.popitem(last=False)
+    return matrix
+
+@app.route('/api/runs/<run_id>/export', methods=['GET'])
+def export_run(run_id):
+    """Stream a stored run as a download (?format=csv|json|html|npz|trace, inline=1 to view it)
+    
+    The export is generated step by step from the run store (see run_export.py);
+    large text exports are brotli/gzip compressed as they stream. The trace
+    format is the compact archive read back by /api/runs/import.
+    """
+    summary = run_store.get_summary(run_id)
+    if summary is None:
+        return jsonify({'success': False, 'error': 'Run not found'}), 404
+    
+    export_format = request.args.get('format', 'json')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'success': False, 'error': f'Unknown export format: {export_format}'}), 400
+    mimetype, extension = EXPORT_FORMATS[export_format]
+    
+    archive_path = run_store.trace_path(run_id) if export_format == 'trace' else None
+    chunks = export_chunks(export_format, summary, run_store.iter_steps(run_id), dumps=app.json.dumps,
+                           archive_path=archive_path)
+    encoding = None
+    if export_format not in ('npz', 'trace') and summary['n'] ** 2 * max(summary['num_steps'], 1) >= EXPORT_COMPRESS_MIN_CELLS:
+        encoding = _stream_encoding()
+    if encoding is not None:
+        chunks = _compress_stream(chunks, encoding)
+    
+    response = Response(stream_with_context(chunks), mimetype=mimetype)
+    disposition = 'inline' if _parse_flag(request.args.get('inline')) else 'attachment'
+    response.headers['Content-Disposition'] = f'{disposition}; filename=hungarian-run-{run_id}.{extension}'
+    response.vary.add('Accept-Encoding')
+    if encoding is not None:
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+def _stream_encoding():
+    """Content encoding for a streamed response, or None if the client accepts neither"""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+def _compress_stream(chunks, encoding):
+    """Compress a stream of byte chunks incrementally with brotli or gzip"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        compress, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits 31: gzip container
+        compress, finish = compressor.compress, compressor.flush
+    
+    for chunk in chunks:
+        data = compress(chunk)
+        if data:
+            yield data
+    yield finish()
+
+@app.route('/api/runs/import', methods=['POST'])
+def import_run():
+    """Reopen a trace archive for replay (multipart field "trace", or the raw request body)
+    
+    The archive is stored as a new run; the response is its summary with the
+    first page of steps, the rest is served by /api/runs/<run_id>/steps.
+    """
+    upload = request.files.get('trace')
+    handle, path = tempfile.mkstemp(suffix=ARCHIVE_EXTENSION)
+    try:
+        with os.fdopen(handle, 'wb') as output:
+            if upload is not None:
+                upload.save(output)
+            else:
+                output.write(request.get_data())
+        run_id = run_store.put_trace(path, replay=_replay_charts)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': f'Invalid trace archive: {e}'}), 400
+    finally:
+        os.remove(path)
+    
+    payload = dict(run_store.get_summary(run_id), success=True)
+    payload['steps'] = run_store.get_steps(run_id, 0, app.config['STEP_PAGE_SIZE'])
+    payload['steps_paged'] = True
+    return jsonify(payload)
+
+def _replay_charts(reader):
+    """Regenerate the charts of an imported archive from its step fields and final matrix"""
+    if not app.config['CHARTS_ENABLED'] or not len(reader):
+        return {}
+    steps = [reader.fields(k) for k in range(len(reader))]
+    steps[-1]['matrix'] = np.array(reader.matrix(-1))  # Copied: keyframe views die with the reader
+    return {'charts': _generate_charts(steps, None)}
+
+@app.route('/api/runs/<run_id>/summary', methods=['GET'])
+def get_run_summary(run_id):
+    """Return everything stored for a run except its steps"""
+    summary = run_store.get_summary(run_id)
+    if summary is None:
+        return jsonify({'success': False, 'error': 'Run not found'}), 404
+    return jsonify(summary)
+
+@app.route('/api/runs/<run_id>/profile', methods=['GET'])
+def get_run_profile(run_id):
+    """Export the phase timeline of a profiled run (?format=chrome|speedscope|json)"""
+    summary = run_store.get_summary(run_id)
+    if summary is None or 'profile' not in summary:
+        return jsonify({'success': False, 'error': 'Profiled run not found'}), 404
+    
+    export_format = request.args.get('format', 'chrome')
+    events = summary['profile']['events']
+    if export_format == 'chrome':
+        response = jsonify(to_chrome_trace(events, name=f'run {run_id}'))
+    elif export_format == 'speedscope':
+        response = jsonify(to_speedscope(events, name=f'run {run_id}'))
+    elif export_format == 'json':
+        return jsonify(summary['profile'])
+    else:
+        return jsonify({'success': False, 'error': f'Unknown profile format: {export_format}'}), 400
+    
+    response.headers['Content-Disposition'] = f'attachment; filename=run-{run_id}.{export_format}.json'
+    return response
+
+@app.route('/api/stats', methods=['GET'])
+def get_stats():
+    """Rolling p50/p95/p99 of recorded solves per size bucket
+    
+    Query options: window (seconds, default all history), engine, trace.
+    """
+    if performance_history is None:
+        return jsonify({'success': False, 'error': 'Performance history is disabled'}), 404
+    window = request.args.get('window', type=float)
+    if window is not None and window <= 0:
+        return jsonify({'success': False, 'error': 'window must be a positive number of seconds'}), 400
+    stats = performance_history.stats(window_seconds=window, engine=request.args.get('engine'),
+                                      trace=request.args.get('trace'))
+    return jsonify(dict({'success': True}, **stats))
+
+@app.route('/api/scaling', methods=['POST'])
+def run_scaling_analysis():
+    """Time solver engines over a geometric range of sizes and fit their scaling
+    
+    Options: min_size, max_size, points, repeats, family, engines, seed.
+    Returns the fitted exponent and constant with 95% confidence intervals
+    per engine, crossover sizes between engines and the fastest engine per size.
+    """
+    try:
+        data = dict(app.config['SCALING_DEFAULTS'], **(request.get_json(silent=True) or {}))
+        points = min(int(data['points']), app.config['SCALING_MAX_POINTS'])
+        repeats = min(int(data['repeats']), app.config['SCALING_MAX_REPEATS'])
+        sizes = geometric_sizes(int(data['min_size']), int(data['max_size']), points)
+        size_error = size_limit_error(sizes[-1], 'solve', app.config['MATRIX_SIZE_LIMITS'])
+        if size_error:
+            return jsonify({'success': False, 'error': size_error}), 400
+        
+        analyzer = ScalingAnalyzer(engines=data.get('engines'), family=data.get('family', 'uniform'),
+                                   repeats=repeats, seed=int(data.get('seed', 0)))
+        analyzer.generator.generate_workload(analyzer.family, 1)  # rejects unknown families up front
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    # The analysis runs synchronously, so its total work is capped, not just its largest size
+    estimated = analyzer.estimate_seconds(sizes, admission.cost_model.estimate)
+    if estimated > app.config['SCALING_MAX_COST']:
+        return jsonify({'success': False,
+                        'error': f"Scaling analysis estimated at {estimated:.0f} s exceeds the "
+                                 f"{app.config['SCALING_MAX_COST']:.0f} s limit; lower max_size, points, "
+                                 f"repeats or engines"}), 400
+    
+    try:
+        result = analyzer.run(sizes, solve_context=lambda n, engine, trace:
+                              admission.admit(n, engine=engine, trace=trace))
+    except AdmissionRejected as e:
+        return _admission_rejected(e)
+    return jsonify(dict({'success': True}, **result))
+
+@app.route('/api/solve_batch', methods=['POST'])
+def solve_batch():
+    """Solve many matrices in one request, streaming one NDJSON result line per matrix
+    
+    Accepts either an NDJSON body (one matrix or {"id", "matrix"} object per line,
+    options in the query string) or a JSON body {"matrices": [...], options...}.
+    Options: analytics, charts, steps (all off by default). analytics may also
+    list the metric groups to compute, e.g. "matrix,performance". dtype sets the
+    element type of every matrix (items may override it).
+    """
+    try:
+        if request.mimetype == NDJSON_MIMETYPE:
+            options = request.args
+            items = (line for line in request.stream if line.strip())
+        else:
+            data = request.get_json()
+            options = data
+            items = iter(data['matrices'])
         
+        flags = {name: _parse_flag(options.get(name)) for name in ('charts', 'steps')}
+        flags['analytics'] = _parse_metric_groups(options.get('analytics'))
+        flags['dtype'] = options.get('dtype')
     except Exception as e:
-        print(f"Error in solve_hungarian: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    def generate():
+        for index, item in enumerate(items):
+            # Batch items wait for capacity instead of being rejected (back-pressure)
+            yield app.json.dumps(_solve_headless(index, item, mode='batch', blocking=True, **flags)) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+def _solve_headless(index, item, mode='batch', analytics=False, charts=False, steps=False,
+                    blocking=False, profiler=None, memory_tracker=None, dtype=None):
+    """Solve a single headless/batch entry, returning its result instead of raising
+    
+    AdmissionRejected is the one exception propagated, so callers can answer 429.
+    An object entry may carry "potentials" {"row": [...], "column": [...]} from
+    an earlier solve to warm-start from, and "dtype" (int32, int64, float32 or
+    float64, default inferred) to build and solve the matrix in.
+    """
+    item_id = index
+    potentials = None
+    try:
+        if isinstance(item, (bytes, str)):
+            item = json.loads(item)
+        if isinstance(item, dict):
+            item_id = item.get('id', index)
+            potentials = item.get('potentials')
+            dtype = item.get('dtype', dtype)
+            item = item['matrix']
+        if dtype is not None and dtype not in INPUT_DTYPES:
+            raise ValueError(f"Unknown dtype {dtype}. Choose from: {', '.join(INPUT_DTYPES)}")
+        
+        matrix = np.array(item)
+        validation = _validate_matrix(matrix, detailed=True, mode=mode)
+        if not validation['valid']:
+            return {'index': index, 'id': item_id, 'success': False,
+                    'errors': validation['errors']}
+        if dtype is not None:
+            # Cast once after checking it is lossless; the solver then uses the array without copying it
+            matrix, error = _cast_matrix(matrix, INPUT_DTYPES[dtype])
+            if error:
+                return {'index': index, 'id': item_id, 'success': False, 'errors': [error]}
+        
+        def compute():
+            return _solve_matrix_headless(matrix, analytics, charts, steps, blocking,
+                                          profiler, memory_tracker, potentials)
+        
+        if profiler is not None or memory_tracker is not None:
+            result = compute()
+        else:
+            options = {'mode': 'headless', 'analytics': analytics, 'charts': charts, 'steps': steps,
+                       'potentials': potentials}
+            result = _cached_result(matrix, options, compute)
+        return dict({'index': index, 'id': item_id}, **result)
+    
+    except AdmissionRejected:
+        raise
+    except Exception as e:
+        return {'index': index, 'id': item_id, 'success': False, 'errors': [str(e)]}
+
+def _cast_matrix(matrix, dtype):
+    """Cast a parsed matrix to a solver dtype, returning (cast, error) with error set if values change
+    
+    Integer dtypes need integral values within range; float32 only needs them
+    to stay finite (rounding to float32 precision is what was asked for).
+    """
+    if dtype.kind == 'i':
+        info = np.iinfo(dtype)
+        if matrix.min() < info.min or matrix.max() > info.max:
+            return None, f'Matrix values must be within [{info.min}, {info.max}] for dtype {dtype.name}'
+    with np.errstate(over='ignore'):
+        cast = matrix.astype(dtype)
+    if dtype.kind == 'i' and not np.array_equal(cast, matrix):
+        return None, f'Matrix values must be integers for dtype {dtype.name}'
+    if dtype.kind == 'f' and not np.all(np.isfinite(cast)):
+        return None, f'Matrix values overflow dtype {dtype.name}'
+    return cast, None
+
+def _solve_matrix_headless(matrix, analytics, charts, steps, blocking, profiler=None,
+                           memory_tracker=None, potentials=None):
+    """Solve a validated matrix without the visual pipeline"""
+    initial_potentials = (potentials['row'], potentials['column']) if potentials else None
+    trace = 'full' if charts else 'steps' if analytics or steps else 'none'
+    with admission.admit(matrix.shape[0], trace=trace, blocking=blocking), memory_tracker or nullcontext():
+        with _memory_section(memory_tracker, 'solver'):
+            # Steps are only recorded when something downstream consumes them
+            # The request owns matrix, so it is solved in its own dtype without a copy. Integer
+            # matrices are reduced in place unless analytics still need the original costs:
+            # only there is C = reduced + u + v exact (float costs would drift in the last bits)
+            hungarian = HungarianAlgorithm(matrix, record_steps=bool(analytics or charts or steps),
+                                           count_operations=bool(analytics), profiler=profiler,
+                                           memory_tracker=memory_tracker,
+                                           initial_potentials=initial_potentials,
+                                           copy=False,
+                                           overwrite_input=matrix.dtype.kind == 'i' and not (analytics or charts))
+            start_time = perf_counter()
+            solved_steps, assignment, total_cost = hungarian.solve_with_steps()
+            execution_time = perf_counter() - start_time
+        
+        result = {
+            'success': True,
+            'assignment': assignment,
+            'total_cost': total_cost.item() if hasattr(total_cost, 'item') else total_cost,
+            'iterations_count': hungarian.iterations,
+            'execution_time': execution_time,
+            'dual_objective': hungarian.dual_objective,
+            'potentials': {'row': hungarian.row_potentials.tolist(),
+                           'column': hungarian.column_potentials.tolist()}
+        }
+        
+        if analytics or charts:
+            # analytics is True for every metric group, or the list of groups to compute
+            with _memory_section(memory_tracker, 'analytics'):
+                tracker = AnalyticsTracker(groups=None if analytics is True else analytics or ())
+                tracker.calculate_metrics(solved_steps, execution_time, matrix, hungarian.counters)
+                if analytics:
+                    result['analytics'] = tracker.get_metrics()
+            if charts:
+                with _memory_section(memory_tracker, 'charts'):
+                    result['charts'] = _generate_charts(solved_steps, tracker)
+        if steps:
+            result['steps'] = solved_steps
+        if profiler is not None:
+            result['profile'] = profiler.get_profile()
+        if memory_tracker is not None:
+            result['memory_profile'] = memory_tracker.get_report()
+    
+    _record_history(matrix, hungarian, execution_time, trace, result)
+    return result
+
+def _record_history(matrix, hungarian, execution_time, trace, result):
+    """Add a computed (not cached) solve to the performance history"""
+    if performance_history is None:
+        return
+    profile = result.get('profile')
+    memory_profile = result.get('memory_profile')
+    phases = None
+    if profile is not None:
+        phases = {name: totals['wall_ms'] for name, totals in profile['phases']['phases'].items()}
+    performance_history.record(matrix.shape[0], execution_time, engine='hungarian', trace=trace,
+                               iterations=hungarian.iterations, phases=phases,
+                               peak_bytes=memory_profile['peak_bytes'] if memory_profile else None)
+
+def _admission_rejected(error):
+    """Build the 429 response for a request rejected by admission control"""
+    response = jsonify({'success': False, 'error': str(error), 'retry_after': error.retry_after})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+def _parse_flag(value, default=False):
+    """Interpret a boolean option given as JSON value or query-string text"""
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return bool(value)
+
+def _parse_metric_groups(value):
+    """Interpret the analytics option: a boolean, or metric group names as a list or comma-separated text"""
+    if isinstance(value, str) and value.strip().lower() not in BOOLEAN_WORDS:
+        value = [group.strip() for group in value.split(',') if group.strip()]
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return _parse_flag(value)
 
 @app.route('/api/validate_matrix', methods=['POST'])
 def validate_matrix():
@@ -134,7 +807,7 @@ def validate_matrix():
         data = request.get_json()
         matrix = np.array(data['matrix'])
         
-        validation_result = _validate_matrix(matrix, detailed=True)
+        validation_result = _validate_matrix(matrix, detailed=True, mode=data.get('mode', 'visual'))
         
         return jsonify({
             'success': True,
@@ -146,34 +819,38 @@ def validate_matrix():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 400
 
-def _validate_matrix(matrix, detailed=False):
-    """Validate matrix format and constraints"""
+def _validate_matrix(matrix, detailed=False, mode='visual'):
+    """Validate matrix format and constraints for the given solve mode"""
     errors = []
     warnings = []
     
+    if matrix.ndim != 2 or matrix.dtype.kind not in 'biuf':
+        errors.append("Matrix must be a two-dimensional array of numbers")
+        return {'valid': False, 'errors': errors, 'warnings': warnings} if detailed else False
+    
     # Check if matrix is square
     if matrix.shape[0] != matrix.shape[1]:
         errors.append("Matrix must be square")
     
     # Check size constraints
-    if matrix.shape[0] > 10:
-        errors.append("Matrix size must be ≤ 10 for clarity")
+    size_error = size_limit_error(max(matrix.shape), mode, app.config['MATRIX_SIZE_LIMITS'])
+    if size_error:
+        errors.append(size_error)
     
-    # Check for non-negative values
-    if np.any(matrix < 0):
+    # Check for finite, non-negative values
+    if matrix.dtype.kind == 'f' and not np.all(np.isfinite(matrix)):
+        errors.append("Matrix values must be finite")
+    elif np.any(matrix < 0):
         errors.append("Matrix values must be non-negative")
     
     # Check for non-integer values
-    if not np.all(matrix == matrix.astype(int)):
+    if matrix.dtype.kind == 'f' and not np.all(matrix == np.round(matrix)):
         warnings.append("Non-integer values detected")
     
     # Check for duplicate rows/columns (warning only)
-    for i in range(matrix.shape[0]):
-        for j in range(i+1, matrix.shape[0]):
-            if np.array_equal(matrix[i], matrix[j]):
-                warnings.append(f"Duplicate rows detected: {i+1} and {j+1}")
-            if np.array_equal(matrix[:, i], matrix[:, j]):
-                warnings.append(f"Duplicate columns detected: {i+1} and {j+1}")
+    duplicate_rows, duplicate_columns = find_duplicate_groups(matrix)
+    warnings.extend(describe_duplicate_groups(duplicate_rows, 'row'))
+    warnings.extend(describe_duplicate_groups(duplicate_columns, 'column'))
     
     if detailed:
         return {
@@ -188,6 +865,11 @@ def _generate_charts(steps, analytics):
     """Generate base64 encoded charts"""
     charts = {}
     
+    plotting = _load_plotting() if app.config['CHARTS_ENABLED'] else None
+    if plotting is None:
+        return charts
+    plt, sns = plotting
+    
     try:
         # Cost reduction chart
         costs = [step.get('total_cost', 0) for step in steps]
@@ -229,21 +911,70 @@ def _generate_charts(steps, analytics):
         
         # Matrix heatmap for final step
         if steps:
-            final_matrix = np.array(steps[-1]['matrix'])
-            fig, ax = plt.subplots(figsize=(8, 8))
-            # Convert to integers for display, handle floats properly
-            display_matrix = np.round(final_matrix).astype(int)
-            sns.heatmap(display_matrix, annot=True, fmt='d', cmap='viridis', 
-                       square=True, ax=ax)
-            ax.set_title('Final Matrix State')
-            charts['final_heatmap'] = _fig_to_base64(fig)
-            plt.close(fig)
+            charts['final_heatmap'] = _final_heatmap(np.asarray(steps[-1]['matrix']), plt, sns)
         
     except Exception as e:
         print(f"Error generating charts: {e}")
     
     return charts
 
+def _final_heatmap(final_matrix, plt, sns):
+    """Heatmap of the final matrix, block-aggregated above HEATMAP_MAX_BLOCKS
+    
+    Values are annotated only up to HEATMAP_ANNOTATE_MAX; larger matrices are
+    drawn with imshow, showing the minimum of each block so zeros stay visible.
+    """
+    n = final_matrix.shape[0]
+    fig, ax = plt.subplots(figsize=(8, 8))
+    if n <= app.config['HEATMAP_ANNOTATE_MAX']:
+        # Convert to integers for display, handle floats properly
+        display_matrix = np.round(final_matrix).astype(int)
+        sns.heatmap(display_matrix, annot=True, fmt='d', cmap='viridis', 
+                   square=True, ax=ax)
+        ax.set_title('Final Matrix State')
+    else:
+        block = default_block(n, n, app.config['HEATMAP_MAX_BLOCKS'] ** 2)
+        display_matrix = block_aggregate(final_matrix, block)[0] if block > 1 else final_matrix
+        image = ax.imshow(display_matrix, cmap='viridis', interpolation='nearest',
+                          extent=(0, n, n, 0))
+        fig.colorbar(image, ax=ax, fraction=0.046, pad=0.04)
+        title = 'Final Matrix State'
+        if block > 1:
+            title += f' (minimum of {block}×{block} blocks)'
+        ax.set_title(title)
+    
+    chart = _fig_to_base64(fig)
+    plt.close(fig)
+    return chart
+
+def _wants_binary_trace():
+    """Check whether the client negotiated the packed binary trace format"""
+    best = request.accept_mimetypes.best_match(['application/json', TRACE_MIMETYPE])
+    return best == TRACE_MIMETYPE
+
+@app.after_request
+def _compress_response(response):
+    """Compress large JSON and trace responses with brotli or gzip"""
+    if (response.status_code != 200 or response.is_streamed or response.direct_passthrough
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+    
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        response.set_data(brotli.compress(body, quality=BROTLI_QUALITY))
+        response.headers['Content-Encoding'] = 'br'
+    elif accepted['gzip']:
+        response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+    
+    return response
+
 def _fig_to_base64(fig):
     """Convert matplotlib figure to base64 string"""
     img_buffer = io.BytesIO()
@@ -0,0 +1,108 @@
+import json
+import struct
+import numpy as np
+from typing import Dict, Any, List, Callable
+
+# Content type negotiated by clients that can decode the packed trace
+TRACE_MIMETYPE = 'application/x-hungarian-trace'
+
+# Container layout (all little-endian):
+#   magic (4 bytes) | header length (uint32) | JSON header | padding to 8 bytes
+#   step matrices block: num_steps * n * n values of header['matrix_dtype']
+#   zero bitmaps block:  num_steps * ceil(n * n / 8) bytes, bit k = cell k
+TRACE_MAGIC = b'HGTB'
+TRACE_VERSION = 1
+
+# Step fields carried in the binary blocks instead of the JSON header
+PACKED_STEP_FIELDS = ('matrix', 'zeros')
+
+
+def encode_binary_trace(payload: Dict[str, Any], dumps: Callable = json.dumps) -> bytes:
+    """Pack a /api/solve payload into the compact binary trace container"""
+    steps = payload.get('steps', [])
+    matrices = np.asarray([step['matrix'] for step in steps], dtype=float)
+    num_steps = len(steps)
+    n = matrices.shape[1] if num_steps else 0
+
+    dtype = _smallest_exact_dtype(matrices)
+    matrix_block = matrices.astype(dtype).tobytes()
+
+    # One packed bitmap per step, padded so every step starts on a byte
+    zero_mask = (matrices == 0).reshape(num_steps, n * n)
+    bitmap_block = np.packbits(zero_mask, axis=1, bitorder='little').tobytes()
+
+    header = {key: value for key, value in payload.items() if key != 'steps'}
+    header['steps'] = [
+        {key: value for key, value in step.items() if key not in PACKED_STEP_FIELDS}
+        for step in steps
+    ]
+    header['trace'] = {
+        'version': TRACE_VERSION,
+        'n': n,
+        'num_steps': num_steps,
+        'matrix_dtype': np.dtype(dtype).name,
+        'matrix_bytes': len(matrix_block),
+        'bitmap_stride': (n * n + 7) // 8
+    }
+
+    header_bytes = dumps(header).encode('utf-8')
+    prefix_length = len(TRACE_MAGIC) + 4 + len(header_bytes)
+    padding = b' ' * (-prefix_length % 8)  # keep typed-array views aligned
+
+    return b''.join([
+        TRACE_MAGIC,
+        struct.pack('<I', len(header_bytes) + len(padding)),
+        header_bytes,
+        padding,
+        matrix_block,
+        bitmap_block
+    ])
+
+
+def decode_binary_trace(data: bytes) -> Dict[str, Any]:
+    """Unpack a binary trace container back into the JSON payload shape"""
+    if data[:4] != TRACE_MAGIC:
+        raise ValueError('Not a binary Hungarian trace')
+
+    (header_length,) = struct.unpack_from('<I', data, 4)
+    offset = 8 + header_length
+    header = json.loads(data[8:offset].decode('utf-8'))
+    trace = header.pop('trace')
+
+    n, num_steps = trace['n'], trace['num_steps']
+    matrices = np.frombuffer(data, dtype=np.dtype(trace['matrix_dtype']).newbyteorder('<'),
+                             count=num_steps * n * n, offset=offset)
+    matrices = matrices.reshape(num_steps, n, n)
+    offset += trace['matrix_bytes']
+
+    bitmaps = np.frombuffer(data, dtype=np.uint8, count=num_steps * trace['bitmap_stride'],
+                            offset=offset).reshape(num_steps, trace['bitmap_stride'])
+    zero_masks = np.unpackbits(bitmaps, axis=1, count=n * n, bitorder='little')
+
+    for k, step in enumerate(header['steps']):
+        step['matrix'] = matrices[k].astype(float).tolist()
+        step['zeros'] = _mask_to_zeros(zero_masks[k].reshape(n, n))
+
+    return header
+
+
+def _smallest_exact_dtype(matrices: np.ndarray) -> str:
+    """Pick the narrowest little-endian dtype that stores every value exactly"""
+    if matrices.size == 0:
+        return '<u1'
+
+    if np.all(np.isfinite(matrices)) and np.all(matrices == np.round(matrices)):
+        low, high = matrices.min(), matrices.max()
+        for dtype in ('<u1', '<u2', '<i4'):
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return dtype
+
+    if np.array_equal(matrices.astype('<f4'), matrices, equal_nan=True):
+        return '<f4'
+    return '<f8'
+
+
+def _mask_to_zeros(mask: np.ndarray) -> List[List[int]]:
+    """Convert a boolean zero mask into the (row, col) list used by the JSON trace"""
+    return np.argwhere(mask).tolist()
@@ -0,0 +1,268 @@
+"""
+Headless Batch Solver
+=====================
+
+Solves assignment instances from files without the web server:
+
+    python -m hungarian_visualizer solve corpus/ -o results.csv --workers 8
+    python -m hungarian_visualizer solve 'runs/*.npy' instances.npz --format ndjson
+
+Inputs are .npy files (memory-mapped read-only), .npz archives (one instance
+per array), .csv files, directories (every supported file inside) and glob
+patterns. Instances are solved on a process pool with step recording off and
+results are written as they complete, in input order, as CSV, NDJSON or
+Parquet (Parquet needs pyarrow). With --trace-dir every solve also writes its
+step trace archive (see trace_archive.py) as it runs. Only numpy and the
+solver are imported, so start-up stays fast.
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+from hungarian_algorithm import HungarianAlgorithm
+from trace_archive import ARCHIVE_EXTENSION
+
+INPUT_EXTENSIONS = ('.npy', '.npz', '.csv')
+OUTPUT_FORMATS = ('csv', 'ndjson', 'parquet')
+OUTPUT_EXTENSIONS = {'.csv': 'csv', '.ndjson': 'ndjson', '.jsonl': 'ndjson', '.parquet': 'parquet'}
+RESULT_FIELDS = ('id', 'n', 'total_cost', 'iterations', 'seconds', 'assignment', 'error')
+
+# Results per Parquet row group
+PARQUET_BATCH_SIZE = 1024
+
+# An instance is (id, path, array name inside an .npz or None)
+Instance = Tuple[str, str, Optional[str]]
+
+
+def find_instances(inputs: List[str]) -> List[Instance]:
+    """Expand files, directories and glob patterns into instances, in a stable order"""
+    instances = []
+    for source in inputs:
+        if os.path.isdir(source):
+            paths = sorted(os.path.join(source, name) for name in os.listdir(source)
+                           if name.lower().endswith(INPUT_EXTENSIONS))
+        elif os.path.exists(source):
+            paths = [source]
+        else:
+            paths = sorted(glob.glob(source, recursive=True))
+            if not paths:
+                raise FileNotFoundError(f'No input matches {source}')
+
+        for path in paths:
+            if path.lower().endswith('.npz'):
+                # Only the archive index is read here; arrays are loaded by the workers
+                with np.load(path) as archive:
+                    instances.extend((f'{path}:{name}', path, name) for name in archive.files)
+            elif path.lower().endswith(INPUT_EXTENSIONS):
+                instances.append((path, path, None))
+    return instances
+
+
+def load_instance(path: str, name: Optional[str] = None) -> np.ndarray:
+    """Read one instance; .npy files are memory-mapped instead of read into memory"""
+    if name is not None:
+        with np.load(path) as archive:
+            return archive[name]
+    if path.lower().endswith('.npy'):
+        return np.load(path, mmap_mode='r')
+    return np.loadtxt(path, delimiter=',', ndmin=2)
+
+
+def trace_archive_path(trace_dir: str, instance_id: str) -> str:
+    """Archive file of an instance: its id with path separators and other symbols as '_'"""
+    return os.path.join(trace_dir, re.sub(r'[^\w.-]+', '_', instance_id).strip('_') + ARCHIVE_EXTENSION)
+
+
+def solve_instance(instance: Instance, trace_dir: Optional[str] = None) -> dict:
+    """Solve one instance without step recording; errors are returned, not raised
+
+    With trace_dir the steps are written to the instance's trace archive instead.
+    """
+    instance_id, path, name = instance
+    try:
+        matrix = load_instance(path, name)
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1] or matrix.dtype.kind not in 'biuf':
+            raise ValueError(f'expected a square numeric matrix, got shape {matrix.shape} of {matrix.dtype}')
+        if matrix.dtype.kind == 'f' and not np.all(np.isfinite(matrix)):
+            raise ValueError('matrix values must be finite')
+
+        # Solved in the file's dtype; read-only memory maps and float arrays get one working copy,
+        # loaded integer arrays none (only their costs are recovered exactly from the potentials)
+        trace_path = trace_archive_path(trace_dir, instance_id) if trace_dir else None
+        hungarian = HungarianAlgorithm(matrix, record_steps=False, copy=False,
+                                       overwrite_input=matrix.dtype.kind == 'i',
+                                       trace_path=trace_path)
+        start = time.perf_counter()
+        _, assignment, total_cost = hungarian.solve_with_steps()
+        seconds = time.perf_counter() - start
+
+        # Column assigned to each row, in row order
+        pairs = np.asarray(assignment, dtype=np.int64).reshape(-1, 2)
+        columns = np.full(matrix.shape[0], -1, dtype=np.int64)
+        columns[pairs[:, 0]] = pairs[:, 1]
+        return {
+            'id': instance_id,
+            'n': int(matrix.shape[0]),
+            'total_cost': total_cost.item() if hasattr(total_cost, 'item') else total_cost,
+            'iterations': hungarian.iterations,
+            'seconds': seconds,
+            'assignment': columns.tolist()
+        }
+    except Exception as e:
+        return {'id': instance_id, 'error': str(e)}
+
+
+def solve_all(instances: List[Instance], workers: int = 1, chunksize: int = 1,
+              trace_dir: Optional[str] = None) -> Iterator[dict]:
+    """Yield the result of every instance in input order, solving on `workers` processes"""
+    solve = partial(solve_instance, trace_dir=trace_dir)
+    if workers <= 1:
+        yield from map(solve, instances)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(solve, instances, chunksize=chunksize)
+
+
+class CsvWriter:
+    """One row per result; the assignment is the space-separated column of each row"""
+
+    def __init__(self, handle, include_assignment: bool = True):
+        fields = [field for field in RESULT_FIELDS if include_assignment or field != 'assignment']
+        self.writer = csv.DictWriter(handle, fieldnames=fields, extrasaction='ignore')
+        self.writer.writeheader()
+        self.handle = handle
+
+    def write(self, result: dict):
+        row = dict(result)
+        if 'assignment' in row:
+            row['assignment'] = ' '.join(map(str, row['assignment']))
+        self.writer.writerow(row)
+        self.handle.flush()
+
+    def close(self):
+        pass
+
+
+class NdjsonWriter:
+    """One JSON object per line"""
+
+    def __init__(self, handle, include_assignment: bool = True):
+        self.handle = handle
+        self.include_assignment = include_assignment
+
+    def write(self, result: dict):
+        if not self.include_assignment:
+            result = {key: value for key, value in result.items() if key != 'assignment'}
+        self.handle.write(json.dumps(result) + '\n')
+        self.handle.flush()
+
+    def close(self):
+        pass
+
+
+class ParquetWriter:
+    """Columnar output in row groups of PARQUET_BATCH_SIZE results (requires pyarrow)"""
+
+    def __init__(self, path: str, include_assignment: bool = True, batch_size: int = PARQUET_BATCH_SIZE):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit('Parquet output needs pyarrow: pip install pyarrow')
+
+        columns = [('id', pa.string()), ('n', pa.int64()), ('total_cost', pa.float64()),
+                   ('iterations', pa.int64()), ('seconds', pa.float64())]
+        if include_assignment:
+            columns.append(('assignment', pa.list_(pa.int64())))
+        columns.append(('error', pa.string()))
+        self.pa = pa
+        self.schema = pa.schema(columns)
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.batch_size = batch_size
+        self.pending = []
+
+    def write(self, result: dict):
+        self.pending.append(result)
+        if len(self.pending) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self.pending:
+            table = self.pa.Table.from_pylist(self.pending, schema=self.schema)
+            self.writer.write_table(table)
+            self.pending = []
+
+    def close(self):
+        self._flush()
+        self.writer.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m hungarian_visualizer',
+                                     description='Headless Hungarian assignment solver')
+    commands = parser.add_subparsers(dest='command', required=True)
+    solve = commands.add_parser('solve', help='solve instances from .npy/.npz/.csv files')
+    solve.add_argument('inputs', nargs='+', help='files, directories or glob patterns')
+    solve.add_argument('-o', '--output', help='output file (default: stdout)')
+    solve.add_argument('--format', choices=OUTPUT_FORMATS,
+                       help='output format (default: from the output extension, else ndjson)')
+    solve.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                       help='solver processes (default: CPU count)')
+    solve.add_argument('--chunksize', type=int, default=1, help='instances handed to a worker at once')
+    solve.add_argument('--no-assignment', action='store_true', help='omit the assignment column')
+    solve.add_argument('--trace-dir', help=f'write each step trace to DIR/<instance>{ARCHIVE_EXTENSION}')
+    args = parser.parse_args(argv)
+
+    output_format = args.format
+    if output_format is None:
+        extension = os.path.splitext(args.output or '')[1].lower()
+        output_format = OUTPUT_EXTENSIONS.get(extension, 'ndjson')
+    if output_format == 'parquet' and not args.output:
+        parser.error('parquet output needs --output')
+
+    try:
+        instances = find_instances(args.inputs)
+    except (FileNotFoundError, OSError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.trace_dir:
+        os.makedirs(args.trace_dir, exist_ok=True)
+
+    include_assignment = not args.no_assignment
+    handle = None
+    if output_format == 'parquet':
+        writer = ParquetWriter(args.output, include_assignment)
+    else:
+        handle = open(args.output, 'w', newline='', encoding='utf-8') if args.output else sys.stdout
+        writer_class = CsvWriter if output_format == 'csv' else NdjsonWriter
+        writer = writer_class(handle, include_assignment)
+
+    start = time.perf_counter()
+    failed = 0
+    try:
+        for result in solve_all(instances, workers=min(args.workers, max(len(instances), 1)),
+                                chunksize=args.chunksize, trace_dir=args.trace_dir):
+            failed += 'error' in result
+            writer.write(result)
+    finally:
+        writer.close()
+        if handle is not None and handle is not sys.stdout:
+            handle.close()
+
+    print(f'Solved {len(instances) - failed}/{len(instances)} instances in '
+          f'{time.perf_counter() - start:.2f} s', file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,19 +1,102 @@
 import numpy as np
 import copy
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
+from profiler import PhaseProfiler, TRACE_CATEGORY, profiled_phase
+from trace_archive import TraceWriter
+
+# Hot-path operation counters, grouped by the solver phase doing the work
+OPERATION_COUNTERS = {
+    'reduction': ['reduction_cells_scanned', 'reduction_cells_updated'],
+    'matching': ['matching_cells_scanned', 'augment_attempts', 'augment_successes',
+                 'dfs_visits', 'edges_scanned'],
+    'covering': ['cover_passes', 'cover_cells_scanned'],
+    'adjustment': ['theta_adjustments', 'adjustment_cells_scanned', 'adjustment_cells_updated']
+}
+
+# Dtypes the solver works in directly when copy=False; other inputs are converted
+SOLVER_DTYPES = (np.int32, np.int64, np.float32, np.float64)
 
 class HungarianAlgorithm:
-    def __init__(self, cost_matrix: np.ndarray):
-        self.original_matrix = cost_matrix.copy()
-        self.matrix = cost_matrix.astype(float)
+    def __init__(self, cost_matrix: np.ndarray, record_steps: bool = True,
+                 count_operations: bool = False, profiler: Optional[PhaseProfiler] = None,
+                 memory_tracker=None, initial_potentials: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                 copy: bool = True, overwrite_input: bool = False, trace_path: Optional[str] = None):
+        """cost_matrix is copied twice by default: once kept as the original costs
+        and once as the float64 working matrix.
+        
+        copy=False keeps a reference to the caller's array instead and works in its
+        own dtype (int32, int64, float32 or float64; other dtypes are converted to
+        int64/float64), so there is at most one working copy. With overwrite_input
+        as well, a writeable array is reduced in place and its contents are
+        undefined afterwards; costs are then recovered from the dual potentials
+        (C = reduced + u + v), exactly for integer matrices.
+        
+        trace_path writes every step to a trace archive while solving (see
+        trace_archive.py), whether or not steps are recorded in memory.
+        """
+        cost_matrix = np.asarray(cost_matrix)
+        self.overwrite_input = False  # True once the caller's buffer is the working matrix
+        if copy:
+            self.original_matrix = cost_matrix.copy()
+            self.matrix = cost_matrix.astype(float)
+        else:
+            dtype = _solver_dtype(cost_matrix.dtype)
+            self.original_matrix = cost_matrix
+            if overwrite_input and cost_matrix.dtype == dtype and cost_matrix.flags.writeable:
+                self.matrix = cost_matrix
+                self.overwrite_input = True
+            else:
+                self.matrix = cost_matrix.astype(dtype)
         self.n = len(cost_matrix)
+        self.record_steps = record_steps  # False skips per-step matrix copies (headless solves)
+        self.count_operations = count_operations
+        self.counters = None  # Operation counts of the last solve when count_operations is set
+        self.profiler = profiler  # Times each phase when set (see profiler.py)
+        self.memory_tracker = memory_tracker  # Meters step-trace bytes when set (see memory_tracker.py)
+        self.trace_path = trace_path
+        self.trace_writer = None  # Open while solving with a trace_path
         self.steps = []
         self.step_count = 0
+        self.iterations = 0
+        
+        # Dual potentials u (rows) and v (columns): self.matrix == C - u[:, None] - v[None, :] >= 0
+        # throughout, and sum(u) + sum(v) reaches the optimal cost at the end
+        self.initial_potentials = initial_potentials  # Warm start from a previous solve's potentials
+        self.row_potentials = np.zeros(self.n)
+        self.column_potentials = np.zeros(self.n)
         
+    @profiled_phase('solve')
     def solve_with_steps(self) -> Tuple[List[Dict], List[Tuple], float]:
         """Solve Hungarian algorithm with detailed step tracking"""
+        if self.trace_path is None:
+            return self._solve()
+        
+        # Opened before any reduction: in overwrite mode the input is still the original costs
+        self.trace_writer = TraceWriter(self.trace_path, self.original_matrix)
+        try:
+            steps, assignment, total_cost = self._solve()
+        except BaseException:
+            self.trace_writer.abort()
+            raise
+        finally:
+            writer, self.trace_writer = self.trace_writer, None
+        
+        writer.close({
+            'assignment': assignment,
+            'total_cost': total_cost.item() if hasattr(total_cost, 'item') else total_cost,
+            'iterations': self.iterations,
+            'dual_objective': self.dual_objective
+        }, final_step_fields={'iterations_count': self.iterations})
+        return steps, assignment, total_cost
+    
+    def _solve(self) -> Tuple[List[Dict], List[Tuple], float]:
         self.steps = []
         self.step_count = 0
+        self.iterations = 0
+        if self.count_operations:
+            self.counters = {name: 0 for names in OPERATION_COUNTERS.values() for name in names}
+        if self.initial_potentials is not None:
+            self._apply_potentials(*self.initial_potentials)
         
         # Step 1: Row reduction
         self._row_reduction()
@@ -22,7 +105,9 @@ class HungarianAlgorithm:
         self._column_reduction()
         
         # Step 3: Iterative optimization
-        max_iterations = self.n * 3  # Prevent infinite loops
+        # Each adjustment grows the matching or the alternating tree behind the cover,
+        # so n * (n + 1) bounds the rounds (adversarial inputs need ~n²/2); prevents infinite loops
+        max_iterations = self.n * (self.n + 1)
         iteration = 0
         
         while iteration < max_iterations:
@@ -44,33 +129,86 @@ class HungarianAlgorithm:
         assignment = self._extract_assignment()
         total_cost = self._calculate_total_cost(assignment)
         
+        self.iterations = iteration
+        
         # Add iteration count to the final step for UI display
         if self.steps:
             self.steps[-1]['iterations_count'] = iteration
         
         return self.steps, assignment, total_cost
     
+    @property
+    def dual_objective(self) -> float:
+        """Dual objective sum(u) + sum(v), a lower bound on the optimal cost"""
+        return float(self.row_potentials.sum() + self.column_potentials.sum())
+    
+    def _apply_potentials(self, row_potentials, column_potentials):
+        """Start from the matrix reduced by given dual-feasible potentials (warm start)"""
+        row_potentials = np.asarray(row_potentials, dtype=float)
+        column_potentials = np.asarray(column_potentials, dtype=float)
+        if row_potentials.shape != (self.n,) or column_potentials.shape != (self.n,):
+            raise ValueError(f"Potentials must have {self.n} row and {self.n} column entries")
+        
+        if self.matrix.dtype.kind == 'i':
+            # Integer working matrices stay integral, so their potentials must be too
+            if not (np.all(row_potentials == np.round(row_potentials))
+                    and np.all(column_potentials == np.round(column_potentials))):
+                raise ValueError("Potentials of an integer cost matrix must be integral")
+        
+        reduced = self.matrix if self.overwrite_input else self.matrix.copy()
+        reduced -= row_potentials.astype(self.matrix.dtype)[:, None]
+        reduced -= column_potentials.astype(self.matrix.dtype)[None, :]
+        tolerance = 1e-9 * max(float(np.abs(self.matrix).max()), 1.0)
+        if reduced.min() < -tolerance:
+            raise ValueError("Potentials are not dual feasible: C[i, j] < u[i] + v[j] for some cell")
+        
+        reduced[reduced <= tolerance] = 0  # Snap rounding noise so tight cells are exact zeros
+        self.matrix = reduced
+        self.row_potentials = row_potentials.copy()
+        self.column_potentials = column_potentials.copy()
+    
     def _add_step(self, step_type: str, description: str, matrix: np.ndarray, 
                   additional_data: Dict = None):
-        """Add a step to the tracking list"""
+        """Add a step to the tracking list and the trace archive"""
+        if not self.record_steps and self.trace_writer is None:
+            return
+        if self.memory_tracker is None:
+            self._record_step(step_type, description, matrix, additional_data)
+        else:
+            with self.memory_tracker.attribute('trace'):
+                self._record_step(step_type, description, matrix, additional_data)
+    
+    @profiled_phase('record_step', TRACE_CATEGORY)
+    def _record_step(self, step_type: str, description: str, matrix: np.ndarray,
+                     additional_data: Dict = None):
         step_data = {
             'step_number': self.step_count,
             'type': step_type,
             'description': description,
-            'matrix': matrix.copy().tolist(),
-            'zeros': self._find_zeros(matrix),
             'zero_density': np.sum(matrix == 0) / (self.n * self.n),
             'frobenius_norm': np.linalg.norm(matrix, 'fro'),
             'explanation': self._get_step_explanation(step_type, additional_data),
-            'total_cost': self._calculate_step_cost(matrix, step_type)
+            'total_cost': self._calculate_step_cost(matrix, step_type),
+            'dual_objective': self.dual_objective
         }
         
         if additional_data:
             step_data.update(additional_data)
         
-        self.steps.append(step_data)
+        if self.trace_writer is not None:
+            self.trace_writer.append(step_data, matrix, self.row_potentials, self.column_potentials)
+        
+        if self.record_steps:
+            step_data.update({
+                'matrix': matrix.copy().tolist(),
+                'zeros': self._find_zeros(matrix),
+                'row_potentials': self.row_potentials.tolist(),
+                'column_potentials': self.column_potentials.tolist()
+            })
+            self.steps.append(step_data)
         self.step_count += 1
     
+    @profiled_phase('row_reduction')
     def _row_reduction(self):
         """Step 1: Subtract minimum value from each row"""
         row_mins = np.min(self.matrix, axis=1)
@@ -79,37 +217,41 @@ class HungarianAlgorithm:
             'row_minimums': row_mins.tolist()
         })
         
-        for i in range(self.n):
-            if row_mins[i] > 0:
-                self.matrix[i] -= row_mins[i]
+        # In place in the working dtype: subtracts each positive row minimum without a temporary matrix
+        self.matrix -= np.maximum(row_mins, 0)[:, None]
+        self.row_potentials += np.maximum(row_mins, 0)
+        
+        if self.counters is not None:
+            self.counters['reduction_cells_scanned'] += self.n * self.n
+            self.counters['reduction_cells_updated'] += int(np.count_nonzero(row_mins > 0)) * self.n
         
         self._add_step('row_reduction', 'Row reduction completed', self.matrix, {
             'row_minimums': row_mins.tolist(),
-            'total_reduction': np.sum(row_mins)
+            'total_reduction': float(np.sum(row_mins))
         })
     
+    @profiled_phase('column_reduction')
     def _column_reduction(self):
         """Step 2: Subtract minimum value from each column"""
         col_mins = np.min(self.matrix, axis=0)
         
-        for j in range(self.n):
-            if col_mins[j] > 0:
-                self.matrix[:, j] -= col_mins[j]
+        self.matrix -= np.maximum(col_mins, 0)[None, :]
+        self.column_potentials += np.maximum(col_mins, 0)
+        
+        if self.counters is not None:
+            self.counters['reduction_cells_scanned'] += self.n * self.n
+            self.counters['reduction_cells_updated'] += int(np.count_nonzero(col_mins > 0)) * self.n
         
         self._add_step('column_reduction', 'Column reduction completed', self.matrix, {
             'column_minimums': col_mins.tolist(),
-            'total_reduction': np.sum(col_mins)
+            'total_reduction': float(np.sum(col_mins))
         })
     
     def _find_zeros(self, matrix: np.ndarray) -> List[Tuple]:
         """Find all zero positions in matrix"""
-        zeros = []
-        for i in range(self.n):
-            for j in range(self.n):
-                if matrix[i, j] == 0:
-                    zeros.append((i, j))
-        return zeros
+        return [tuple(position) for position in np.argwhere(matrix == 0).tolist()]
     
+    @profiled_phase('find_minimum_lines')
     def _find_minimum_lines(self) -> Dict:
         """Find minimum number of lines to cover all zeros"""
         zeros = self._find_zeros(self.matrix)
@@ -132,6 +274,7 @@ class HungarianAlgorithm:
         
         return lines_data
     
+    @profiled_phase('maximum_matching')
     def _find_maximum_matching(self) -> List[Tuple]:
         """Find maximum matching in bipartite graph of zeros using Hungarian matching"""
         zeros = self._find_zeros(self.matrix)
@@ -155,11 +298,22 @@ class HungarianAlgorithm:
             if match_row[i] != -1:
                 assignment.append((i, match_row[i]))
         
+        if self.counters is not None:
+            self.counters['matching_cells_scanned'] += self.n * self.n
+            self.counters['augment_attempts'] += self.n
+            self.counters['augment_successes'] += len(assignment)
+        
         return assignment
     
     def _dfs_augment(self, u: int, adj: Dict, match_row: List, match_col: List, visited: List[bool]) -> bool:
         """DFS for finding augmenting paths in bipartite matching"""
+        counters = self.counters
+        if counters is not None:
+            counters['dfs_visits'] += 1
+        
         for v in adj[u]:
+            if counters is not None:
+                counters['edges_scanned'] += 1
             if visited[v]:
                 continue
             visited[v] = True
@@ -172,6 +326,7 @@ class HungarianAlgorithm:
         
         return False
     
+    @profiled_phase('vertex_cover')
     def _find_vertex_cover(self, matching: List[Tuple]) -> Tuple[List, List]:
         """Find minimum vertex cover from maximum matching"""
         matched_rows = set()
@@ -191,6 +346,10 @@ class HungarianAlgorithm:
         changed = True
         while changed:
             changed = False
+            if self.counters is not None:
+                self.counters['cover_passes'] += 1
+                self.counters['cover_cells_scanned'] += len(reachable_rows) * self.n
+            
             # From reachable rows, find reachable columns via zeros
             for i in reachable_rows:
                 for j in range(self.n):
@@ -198,6 +357,9 @@ class HungarianAlgorithm:
                         reachable_cols.add(j)
                         changed = True
             
+            if self.counters is not None:
+                self.counters['cover_cells_scanned'] += len(reachable_cols) * len(matching)
+            
             # From reachable columns, find reachable rows via matching
             for j in reachable_cols:
                 for row, col in matching:
@@ -211,6 +373,7 @@ class HungarianAlgorithm:
         
         return covered_rows, covered_cols
     
+    @profiled_phase('adjust_matrix')
     def _adjust_matrix(self, lines_data: Dict):
         """Adjust matrix by subtracting minimum uncovered value"""
         covered_rows = set(lines_data['covered_rows'])
@@ -223,6 +386,9 @@ class HungarianAlgorithm:
                 if i not in covered_rows and j not in covered_cols:
                     min_uncovered = min(min_uncovered, self.matrix[i, j])
         
+        if self.counters is not None:
+            self.counters['adjustment_cells_scanned'] += self.n * self.n
+        
         if min_uncovered == float('inf') or min_uncovered == 0:
             return
         
@@ -236,13 +402,26 @@ class HungarianAlgorithm:
                     # Doubly covered - add
                     self.matrix[i, j] += min_uncovered
         
+        # Same update on the duals: raise u on uncovered rows, lower v on covered columns
+        uncovered_rows = np.ones(self.n, dtype=bool)
+        uncovered_rows[list(covered_rows)] = False
+        self.row_potentials[uncovered_rows] += min_uncovered
+        self.column_potentials[list(covered_cols)] -= min_uncovered
+        
+        if self.counters is not None:
+            uncovered = (self.n - len(covered_rows)) * (self.n - len(covered_cols))
+            self.counters['theta_adjustments'] += 1
+            self.counters['adjustment_cells_scanned'] += self.n * self.n
+            self.counters['adjustment_cells_updated'] += uncovered + len(covered_rows) * len(covered_cols)
+        
         self._add_step('matrix_adjustment', 'Matrix adjustment completed', 
                       self.matrix, {
-                          'min_uncovered_value': min_uncovered,
+                          'min_uncovered_value': float(min_uncovered),
                           'covered_rows': lines_data['covered_rows'],
                           'covered_columns': lines_data['covered_columns']
                       })
     
+    @profiled_phase('extraction')
     def _extract_assignment(self) -> List[Tuple]:
         """Extract final assignment from matrix using maximum cardinality matching"""
         # Use maximum matching to find optimal assignment from zeros
@@ -256,17 +435,32 @@ class HungarianAlgorithm:
         
         return assignment
     
+    @profiled_phase('total_cost')
     def _calculate_total_cost(self, assignment: List[Tuple]) -> float:
         """Calculate total cost of assignment"""
-        total_cost = 0
-        for i, j in assignment:
-            total_cost += self.original_matrix[i, j]
+        if not assignment:
+            return 0
+        rows, cols = np.asarray(assignment, dtype=np.intp).T
+        total_cost = self._original_costs(rows, cols).sum()
+        if self.overwrite_input and self.original_matrix.dtype.kind == 'i':
+            total_cost = np.int64(np.rint(total_cost))
         return total_cost
     
+    def _original_costs(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Original costs C[rows, cols], gathered with fancy indexing
+        
+        When the input was reduced in place they are rebuilt from the potentials.
+        """
+        if self.overwrite_input:
+            return self.matrix[rows, cols] + self.row_potentials[rows] + self.column_potentials[cols]
+        return self.original_matrix[rows, cols]
+    
     def _calculate_step_cost(self, matrix: np.ndarray, step_type: str) -> float:
         """Calculate meaningful cost metric for each step"""
         # For initial step, use original matrix sum as baseline
         if step_type == 'initial':
+            if self.overwrite_input:
+                return float(np.sum(matrix) + self.n * (self.row_potentials.sum() + self.column_potentials.sum()))
             return float(np.sum(self.original_matrix))
         
         # For other steps, calculate matrix sum (represents remaining cost potential)
@@ -291,10 +485,8 @@ class HungarianAlgorithm:
                 
                 # If we have a complete assignment, calculate its cost
                 if len(temp_assignment) == self.n:
-                    assignment_cost = 0
-                    for i, j in temp_assignment:
-                        assignment_cost += self.original_matrix[i, j]
-                    return float(assignment_cost)
+                    rows, cols = np.asarray(temp_assignment, dtype=np.intp).T
+                    return float(self._original_costs(rows, cols).sum())
             except:
                 pass
         
@@ -322,4 +514,10 @@ class HungarianAlgorithm:
         if data and step_type == 'matrix_adjustment':
             base_explanation += f" Minimum uncovered value θ = {data.get('min_uncovered_value', 0)}"
         
-        return base_explanation
\ No newline at end of file
+        return base_explanation
+
+def _solver_dtype(dtype: np.dtype) -> np.dtype:
+    """Working dtype for copy=False: the input's own if supported, else int64 or float64"""
+    if dtype in SOLVER_DTYPES:
+        return dtype
+    return np.dtype(np.int64) if dtype.kind in 'biu' else np.dtype(np.float64)
@@ -1,9 +1,207 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import random
-from typing import Dict, List
+from typing import Dict, List, Optional
+from validation import DEFAULT_SIZE_LIMITS, find_duplicate_groups
+
+# Above this size the O(n³) condition number is skipped during validation
+CONDITION_NUMBER_MAX_SIZE = 200
+
+# Reproducible workload families for benchmarks and scaling analysis (see WorkloadInstance)
+WORKLOAD_FAMILIES = ('uniform', 'structured', 'euclidean', 'low_rank', 'clustered', 'heavy_tailed',
+                     'degenerate', 'adversarial', 'sparse')
+
+# Workloads are generated in row blocks of about this many cells (16 MB of int32), each from
+# its own child seed, so generating or writing an instance holds one block of temporaries
+WORKLOAD_BLOCK_CELLS = 1 << 22
+
+
+class WorkloadInstance:
+    """One seeded instance of a workload family, generated block by block
+    
+    Family-wide parameters (points, factors, clusters, permutations) come
+    from the seed itself and each row block (about WORKLOAD_BLOCK_CELLS cells)
+    from a child seed, so an instance is identical whether it is built in
+    memory, a block at a time or streamed to disk with write_npy(). With
+    seed=None fresh entropy is drawn; self.seed holds it so the instance can
+    be reproduced.
+    
+    Families (costs are non-negative integers, mostly in [0, max_value]):
+    uniform, structured (banded diagonal), euclidean (distances between
+    random points), low_rank (rank-`rank` products), clustered (cluster-pair
+    base costs plus noise), heavy_tailed (Pareto, capped at 1000*max_value),
+    degenerate (values 0-2, many ties), adversarial (permuted i*j products
+    that force about n²/2 adjustment rounds; ignores max_value) and sparse
+    (about `degree` allowed cells per row over a feasible permutation, every
+    other cell at the prohibitive `forbidden_cost`). An integer dtype must
+    hold the family's largest possible cost (self.max_cost), otherwise
+    ValueError is raised.
+    """
+    
+    def __init__(self, family: str, size: int, seed: Optional[int] = None, max_value: int = 100,
+                 dtype=np.int32, rank: int = 4, clusters: int = 8, degree: int = 4):
+        if family not in WORKLOAD_FAMILIES:
+            raise ValueError(f"Unknown workload family '{family}'. Choose from: {', '.join(WORKLOAD_FAMILIES)}")
+        self.family = family
+        self.size = int(size)
+        self.seed = np.random.SeedSequence(seed).entropy
+        self.max_value = max_value
+        self.dtype = np.dtype(dtype)
+        self.rank = rank
+        self.clusters = clusters
+        self.degree = degree
+        self.forbidden_cost = max_value * self.size + 1  # exceeds the cost of any all-allowed assignment
+        
+        # Largest cost each family can produce; casting beyond the dtype would wrap or clip the costs
+        # (and break the structure that makes adversarial and sparse instances what they are)
+        self.max_cost = {
+            'structured': 2 * self.size + 11,
+            'heavy_tailed': max_value * 1000,
+            'degenerate': 2,
+            'adversarial': max(self.size - 1, 0) ** 2,
+            'sparse': self.forbidden_cost
+        }.get(family, max_value)
+        if self.dtype.kind in 'iu' and self.max_cost > np.iinfo(self.dtype).max:
+            raise ValueError(f"'{family}' costs of size {self.size} (max_value={max_value}) reach "
+                             f"{self.max_cost}, beyond {self.dtype.name}; use dtype=np.int64")
+        self.rows_per_block = max(1, min(self.size, WORKLOAD_BLOCK_CELLS // max(self.size, 1)))
+        self.num_blocks = -(-self.size // self.rows_per_block)
+        
+        n = self.size
+        shared = np.random.default_rng(np.random.SeedSequence(self.seed))
+        if family == 'structured':
+            self.band = 7 + 2 * np.abs(np.arange(-(n - 1), n, dtype=np.int32))
+        elif family == 'euclidean':
+            self.row_points = shared.random((n, 2), dtype=np.float32)
+            self.column_points = shared.random((n, 2), dtype=np.float32)
+        elif family == 'low_rank':
+            self.row_factors = shared.random((n, rank), dtype=np.float32)
+            self.column_factors = shared.random((rank, n), dtype=np.float32) * np.float32(max_value / rank)
+        elif family == 'clustered':
+            self.cluster_costs = shared.integers(0, int(max_value * 0.8) + 1, size=(clusters, clusters),
+                                                 dtype=self.dtype)
+            self.row_clusters = shared.integers(0, clusters, size=n)
+            self.column_clusters = shared.integers(0, clusters, size=n)
+        elif family in ('adversarial', 'sparse'):
+            self.row_order = shared.permutation(n)
+            self.column_order = shared.permutation(n)
+    
+    def generate(self, workers: Optional[int] = None) -> np.ndarray:
+        """Build the whole matrix, filling blocks on `workers` threads (default: CPU count)"""
+        matrix = np.empty((self.size, self.size), dtype=self.dtype)
+        workers = min(workers or os.cpu_count() or 1, self.num_blocks)
+        
+        def fill(index):
+            start, stop = self.block_rows(index)
+            self.block(index, out=matrix[start:stop])
+        
+        if workers > 1:
+            # numpy releases the GIL while filling arrays, and blocks have independent generators
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(fill, range(self.num_blocks)))
+        else:
+            for index in range(self.num_blocks):
+                fill(index)
+        return matrix
+    
+    def block_rows(self, index: int):
+        """Row range [start, stop) of a block"""
+        start = index * self.rows_per_block
+        return start, min(start + self.rows_per_block, self.size)
+    
+    def write_npy(self, path: str) -> str:
+        """Stream the matrix to a .npy file block by block, with bounded memory
+        
+        The file is written under a temporary name and renamed into place, so
+        readers never see a partial instance. Load it with
+        np.load(path, mmap_mode='r').
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        handle, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.npy')
+        os.close(handle)
+        try:
+            matrix = np.lib.format.open_memmap(temp_path, mode='w+', dtype=self.dtype,
+                                               shape=(self.size, self.size))
+            for index in range(self.num_blocks):
+                start, stop = self.block_rows(index)
+                self.block(index, out=matrix[start:stop])
+                matrix.flush()  # written blocks can leave the page cache
+            del matrix
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        return path
+    
+    def block(self, index: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rows of one block, from its own child seed, written to out when given"""
+        start, stop = self.block_rows(index)
+        rows = stop - start
+        n = self.size
+        if out is None:
+            out = np.empty((rows, n), dtype=self.dtype)
+        rng = np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(index,)))
+        family = self.family
+        
+        # Intermediates are int32/float32 where the values allow, to halve memory traffic
+        if family == 'uniform':
+            out[...] = rng.integers(1, self.max_value + 1, size=(rows, n), dtype=np.int32)
+        elif family == 'structured':
+            # Banded costs around the diagonal with small noise, like _generate_structured_example
+            # Row i of the band is a window of 7 + 2|k| (10 + noise in [-3, 3] once noise is added)
+            windows = np.lib.stride_tricks.sliding_window_view(self.band, n)
+            np.add(windows[n - stop:n - start][::-1], rng.integers(0, 7, size=(rows, n), dtype=np.int32),
+                   out=out, casting='unsafe')
+        elif family == 'euclidean':
+            points = self.row_points[start:stop]
+            distances = points[:, :1] - self.column_points[:, 0]
+            distances *= distances
+            dy = points[:, 1:] - self.column_points[:, 1]
+            dy *= dy
+            distances += dy
+            np.sqrt(distances, out=distances)
+            distances *= np.float32(self.max_value / np.sqrt(2))
+            out[...] = np.rint(distances, out=distances)
+        elif family == 'low_rank':
+            products = self.row_factors[start:stop] @ self.column_factors
+            out[...] = np.rint(products, out=products)
+        elif family == 'clustered':
+            np.take(self.cluster_costs[self.row_clusters[start:stop]], self.column_clusters, axis=1, out=out)
+            out += rng.integers(0, self.max_value // 5 + 1, size=(rows, n), dtype=np.int32)
+        elif family == 'heavy_tailed':
+            # Pareto(1.5) by inversion: U ** (-1 / 1.5) - 1 with U in (0, 1]
+            costs = rng.random((rows, n), dtype=np.float32)
+            np.subtract(1, costs, out=costs)
+            np.power(costs, np.float32(-1 / 1.5), out=costs)
+            costs -= 1
+            costs *= np.float32(self.max_value / 10)
+            np.floor(costs, out=costs)
+            costs += 1
+            out[...] = np.minimum(costs, self.max_value * 1000, out=costs)
+        elif family == 'degenerate':
+            out[...] = rng.integers(0, 3, size=(rows, n), dtype=np.int32)
+        elif family == 'adversarial':
+            # i * j costs: reductions leave zeros only in one row and column, so each round adds one line
+            np.multiply.outer(self.row_order[start:stop], self.column_order, out=out, casting='unsafe')
+        else:
+            # sparse: a feasible permutation plus ~degree random allowed cells per row
+            out[...] = self.forbidden_cost
+            counts = rng.binomial(n, min(self.degree / max(n, 1), 1.0), size=rows)
+            block_rows = np.concatenate([np.repeat(np.arange(rows), counts), np.arange(rows)])
+            block_columns = np.concatenate([rng.integers(0, n, size=counts.sum()),
+                                            self.column_order[self.row_order[start:stop]]])
+            out[block_rows, block_columns] = rng.integers(1, self.max_value + 1, size=len(block_rows))
+        return out
+
 
 class MatrixGenerator:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        # Fresh entropy by default, so each generated matrix is new; pass a seed to reproduce them
+        self.rng = np.random.default_rng(seed)
         self.example_matrices = {
             3: [
                 np.array([[4, 2, 8], [4, 3, 7], [3, 1, 6]]),
@@ -40,44 +238,54 @@ class MatrixGenerator:
             ]
         }
     
-    def generate_random_matrix(self, size: int, min_val: int = 1, max_val: int = 20) -> np.ndarray:
-        """Generate a new random matrix every time"""
-        # Ensure we get a different matrix each time
-        np.random.seed(None)  # Use system time as seed
-        random.seed(None)
-        
-        # Generate random matrix
-        matrix = np.random.randint(min_val, max_val + 1, size=(size, size))
+    def generate_random_matrix(self, size: int, min_val: int = 1, max_val: int = 20,
+                               seed: Optional[int] = None) -> np.ndarray:
+        """Generate a random matrix, new every time unless a seed is given"""
+        rng = self.rng if seed is None else np.random.default_rng(seed)
+        matrix = rng.integers(min_val, max_val + 1, size=(size, size))
         
         # Add some structure to make it more interesting
-        if random.random() < 0.3:  # 30% chance to add some structure
-            self._add_structure(matrix, size)
+        if rng.random() < 0.3:  # 30% chance to add some structure
+            self._add_structure(matrix, size, rng)
         
         return matrix
     
-    def _add_structure(self, matrix: np.ndarray, size: int):
+    def _add_structure(self, matrix: np.ndarray, size: int, rng: np.random.Generator):
         """Add some interesting structure to the matrix"""
-        structure_type = random.choice(['diagonal_bias', 'corner_bias', 'symmetric_bias'])
+        structure_type = rng.choice(['diagonal_bias', 'corner_bias', 'symmetric_bias'])
         
         if structure_type == 'diagonal_bias':
             # Make diagonal elements smaller (better assignment likely on diagonal)
-            for i in range(size):
-                matrix[i, i] = max(1, matrix[i, i] - random.randint(1, 5))
+            diagonal = np.arange(size)
+            matrix[diagonal, diagonal] = np.maximum(1, matrix[diagonal, diagonal] - rng.integers(1, 6, size=size))
         
         elif structure_type == 'corner_bias':
             # Make corner elements smaller
-            corners = [(0, 0), (0, size-1), (size-1, 0), (size-1, size-1)]
-            for i, j in corners:
-                matrix[i, j] = max(1, matrix[i, j] - random.randint(2, 7))
+            rows = np.array([0, 0, size - 1, size - 1])
+            columns = np.array([0, size - 1, 0, size - 1])
+            matrix[rows, columns] = np.maximum(1, matrix[rows, columns] - rng.integers(2, 8, size=4))
         
         elif structure_type == 'symmetric_bias':
-            # Add some symmetry
-            for i in range(size):
-                for j in range(i+1, size):
-                    if random.random() < 0.2:  # 20% chance to make symmetric
-                        avg = (matrix[i, j] + matrix[j, i]) // 2
-                        matrix[i, j] = avg
-                        matrix[j, i] = avg
+            # Make 20% of the pairs above the diagonal symmetric
+            rows, columns = np.triu_indices(size, k=1)
+            chosen = rng.random(len(rows)) < 0.2
+            rows, columns = rows[chosen], columns[chosen]
+            average = (matrix[rows, columns] + matrix[columns, rows]) // 2
+            matrix[rows, columns] = average
+            matrix[columns, rows] = average
+    
+    def generate_workload(self, family: str, size: int, seed: Optional[int] = None, **options) -> np.ndarray:
+        """Generate a matrix of a workload family; the same seed gives the same matrix
+        
+        Options are those of WorkloadInstance (max_value, dtype, rank, clusters, degree).
+        """
+        return WorkloadInstance(family, size, seed=seed, **options).generate()
+    
+    def write_workload(self, path: str, family: str, size: int, seed: Optional[int] = None, **options) -> int:
+        """Stream a workload instance to a .npy file in row blocks, returning its seed"""
+        instance = WorkloadInstance(family, size, seed=seed, **options)
+        instance.write_npy(path)
+        return instance.seed
     
     def get_example_matrix(self, size: int, index: int = 0) -> np.ndarray:
         """Get a predefined example matrix"""
@@ -93,28 +301,20 @@ class MatrixGenerator:
     
     def _generate_structured_example(self, size: int) -> np.ndarray:
         """Generate a structured example for sizes not predefined"""
-        # Create a matrix with known optimal structure
-        matrix = np.zeros((size, size), dtype=int)
-        
-        # Fill with base values
-        base_value = 10
-        for i in range(size):
-            for j in range(size):
-                matrix[i, j] = base_value + abs(i - j) * 2
-        
-        # Add some randomness
-        noise = np.random.randint(-3, 4, size=(size, size))
-        matrix = np.maximum(matrix + noise, 1)  # Ensure positive values
-        
-        return matrix
+        # Banded costs around the diagonal with some randomness
+        return self.generate_workload('structured', size, seed=int(self.rng.integers(2 ** 32)), dtype=int)
     
     def get_all_examples(self) -> Dict[int, List[np.ndarray]]:
         """Get all predefined example matrices"""
         return {size: [matrix.copy() for matrix in matrices] 
                 for size, matrices in self.example_matrices.items()}
     
-    def generate_test_cases(self) -> List[Dict]:
-        """Generate various test cases for algorithm validation"""
+    def generate_test_cases(self, family_sizes: List[int] = (8, 32)) -> List[Dict]:
+        """Generate various test cases for algorithm validation
+        
+        Besides the small cases, every workload family is included at each of
+        family_sizes, with the seed that reproduces it.
+        """
         test_cases = []
         
         # Small matrices
@@ -155,21 +355,32 @@ class MatrixGenerator:
             }
         ])
         
+        for family in WORKLOAD_FAMILIES:
+            for size in family_sizes:
+                seed = int(self.rng.integers(2 ** 32))
+                test_cases.append({
+                    'name': f'{family.replace("_", " ").capitalize()} {size}x{size}',
+                    'matrix': self.generate_workload(family, size, seed=seed),
+                    'size': size,
+                    'type': 'workload',
+                    'family': family,
+                    'seed': seed
+                })
+        
         return test_cases
     
     def _generate_identity_like(self, size: int) -> np.ndarray:
         """Generate matrix where diagonal assignment is optimal"""
-        matrix = np.random.randint(10, 20, size=(size, size))
+        matrix = self.rng.integers(10, 20, size=(size, size))
         
         # Make diagonal elements much smaller
-        for i in range(size):
-            matrix[i, i] = random.randint(1, 3)
+        np.fill_diagonal(matrix, self.rng.integers(1, 4, size=size))
         
         return matrix
     
     def _generate_high_cost(self, size: int) -> np.ndarray:
         """Generate matrix with high costs to test algorithm robustness"""
-        return np.random.randint(50, 100, size=(size, size))
+        return self.rng.integers(50, 100, size=(size, size))
     
     def _generate_uniform(self, size: int) -> np.ndarray:
         """Generate matrix with uniform values (challenging case)"""
@@ -177,13 +388,13 @@ class MatrixGenerator:
         matrix = np.full((size, size), base_value)
         
         # Add small random variations
-        noise = np.random.randint(-2, 3, size=(size, size))
+        noise = self.rng.integers(-2, 3, size=(size, size))
         matrix = np.maximum(matrix + noise, 1)
         
         return matrix
     
-    def validate_matrix(self, matrix: np.ndarray) -> Dict:
-        """Validate matrix properties"""
+    def validate_matrix(self, matrix: np.ndarray, max_size: int = DEFAULT_SIZE_LIMITS['visual']) -> Dict:
+        """Validate matrix properties against a size limit (see validation.DEFAULT_SIZE_LIMITS)"""
         validation = {
             'valid': True,
             'errors': [],
@@ -197,9 +408,9 @@ class MatrixGenerator:
             validation['errors'].append('Matrix must be square')
         
         # Check size limits
-        if matrix.shape[0] > 10:
+        if matrix.shape[0] > max_size:
             validation['valid'] = False
-            validation['errors'].append('Matrix size must be ≤ 10')
+            validation['errors'].append(f'Matrix size must be ≤ {max_size}')
         
         # Check for negative values
         if np.any(matrix < 0):
@@ -210,14 +421,25 @@ class MatrixGenerator:
         if np.any(matrix > 1000):
             validation['warnings'].append('Very large values detected (>1000)')
         
-        # Calculate properties
+        # Calculate properties (condition number only where O(n³) is affordable)
+        size = matrix.shape[0]
+        if size == 0:
+            condition_number = 0
+        elif size <= CONDITION_NUMBER_MAX_SIZE and matrix.shape[0] == matrix.shape[1]:
+            condition_number = float(np.linalg.cond(matrix))
+        else:
+            condition_number = None
+        
+        duplicate_rows, duplicate_columns = find_duplicate_groups(matrix)
         validation['properties'] = {
-            'size': matrix.shape[0],
+            'size': size,
             'min_value': int(np.min(matrix)),
             'max_value': int(np.max(matrix)),
             'mean_value': float(np.mean(matrix)),
             'has_zeros': bool(np.any(matrix == 0)),
-            'condition_number': float(np.linalg.cond(matrix)) if matrix.shape[0] > 0 else 0
+            'duplicate_rows': len(duplicate_rows),
+            'duplicate_columns': len(duplicate_columns),
+            'condition_number': condition_number
         }
         
         return validation
\ No newline at end of file
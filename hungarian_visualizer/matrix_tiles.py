@@ -0,0 +1,54 @@
+import math
+import numpy as np
+from typing import Dict, Any, Tuple
+
+# Largest tile (in output cells) served at once; bigger views are downsampled into blocks
+MAX_TILE_CELLS = 256 * 256
+
+
+def block_aggregate(matrix: np.ndarray, block: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Minimum and zero count of every block x block square of a matrix
+
+    Edge blocks cover whatever cells remain. The minimum keeps what matters
+    for the assignment view: a block is 0 exactly when it holds a zero, and
+    the zero count says how many.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    rows, cols = matrix.shape
+    block_rows, block_cols = -(-rows // block), -(-cols // block)
+    padded = np.full((block_rows * block, block_cols * block), np.inf)
+    padded[:rows, :cols] = matrix
+    blocks = padded.reshape(block_rows, block, block_cols, block)
+    minimum = blocks.min(axis=(1, 3))
+    zeros = (blocks == 0).sum(axis=(1, 3))
+    return minimum, zeros
+
+
+def default_block(rows: int, cols: int, max_cells: int = MAX_TILE_CELLS) -> int:
+    """Smallest block size that keeps a rows x cols view within max_cells output cells"""
+    return max(1, math.ceil(math.sqrt(rows * cols / max_cells)))
+
+
+def matrix_tile(matrix: np.ndarray, row: int, col: int, rows: int, cols: int,
+                block: int = 1) -> Dict[str, Any]:
+    """A window of a matrix, block-aggregated when block > 1 (see block_aggregate)
+
+    The window is clipped to the matrix; 'rows' and 'cols' in the result are
+    the clipped extent in matrix cells, 'values' and 'zeros' are the block grid.
+    """
+    n_rows, n_cols = matrix.shape
+    row, col = min(max(row, 0), n_rows), min(max(col, 0), n_cols)
+    window = matrix[row:row + max(rows, 0), col:col + max(cols, 0)]
+    if block == 1:
+        values, zeros = window, (window == 0).astype(int)
+    else:
+        values, zeros = block_aggregate(window, block)
+    return {
+        'row': row,
+        'col': col,
+        'rows': window.shape[0],
+        'cols': window.shape[1],
+        'block': block,
+        'values': values.tolist(),
+        'zeros': zeros.tolist()
+    }
@@ -0,0 +1,79 @@
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Any
+
+# tracemalloc is process-wide: tracked solves run one at a time so their peaks don't mix
+_tracking_lock = threading.Lock()
+
+
+class SolveMemoryTracker:
+    """Peak and retained allocations of one solve, per section, using tracemalloc
+
+    Used as a context manager around the solve; each section (e.g. 'solver',
+    'analytics') records its peak allocation above the memory in use when it
+    started and what it still holds at the end. attribute() meters the bytes
+    a block leaves allocated under a label, e.g. the solver wraps each step
+    it records in attribute('trace').
+
+    Allocations of concurrent untracked requests still land in these
+    figures, so they are most precise on an otherwise idle worker.
+    """
+
+    def __init__(self):
+        self.sections = {}
+        self.attributed = {}
+        self.started_tracing = False
+        self.start_bytes = 0
+        self.peak_bytes = 0
+
+    def __enter__(self):
+        _tracking_lock.acquire()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        self.start_bytes = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.started_tracing:
+            tracemalloc.stop()
+        _tracking_lock.release()
+        return False
+
+    @contextmanager
+    def section(self, name: str):
+        """Track the peak and retained allocations of one section"""
+        before = tracemalloc.get_traced_memory()[0]
+        if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+; earlier peaks span the whole solve
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            after, peak = tracemalloc.get_traced_memory()
+            self.sections[name] = {
+                'peak_bytes': max(peak - before, 0),
+                'retained_bytes': after - before
+            }
+            self.peak_bytes = max(self.peak_bytes, peak - self.start_bytes)
+    
+    @contextmanager
+    def attribute(self, label: str):
+        """Add the bytes the enclosed block leaves allocated to label"""
+        before = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            retained = tracemalloc.get_traced_memory()[0] - before
+            self.attributed[label] = self.attributed.get(label, 0) + retained
+
+    def get_report(self) -> Dict[str, Any]:
+        """Return per-section figures plus the solver working memory / trace split, in bytes"""
+        report = {'peak_bytes': self.peak_bytes, 'sections': self.sections}
+        report.update({f'{label}_bytes': size for label, size in self.attributed.items()})
+
+        solver = self.sections.get('solver')
+        if solver is not None:
+            report.setdefault('trace_bytes', 0)
+            report['solver_working_bytes'] = max(solver['peak_bytes'] - report['trace_bytes'], 0)
+        return report
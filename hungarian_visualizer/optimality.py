@@ -0,0 +1,65 @@
+import itertools
+from functools import lru_cache
+import numpy as np
+from typing import List, Tuple, Optional
+
+# Brute force enumerates n! assignments; beyond this size use the dual certificate
+BRUTE_FORCE_MAX_SIZE = 8
+
+
+@lru_cache(maxsize=BRUTE_FORCE_MAX_SIZE + 1)
+def _permutations(n: int) -> np.ndarray:
+    return np.array(list(itertools.permutations(range(n))), dtype=np.intp).reshape(-1, n)
+
+
+def brute_force_cost(matrix: np.ndarray) -> float:
+    """Optimal assignment cost by enumerating every permutation (n <= BRUTE_FORCE_MAX_SIZE)"""
+    n = matrix.shape[0]
+    if n > BRUTE_FORCE_MAX_SIZE:
+        raise ValueError(f'Brute force is limited to n <= {BRUTE_FORCE_MAX_SIZE}')
+    if n == 0:
+        return 0.0
+    permutations = _permutations(n)
+    return float(np.asarray(matrix, dtype=float)[np.arange(n), permutations].sum(axis=1).min())
+
+
+def certificate_violations(matrix: np.ndarray, assignment: List[Tuple[int, int]],
+                           row_potentials: np.ndarray, column_potentials: np.ndarray,
+                           total_cost: Optional[float] = None) -> List[str]:
+    """Check an assignment's optimality certificate in O(n²); return the violations found
+
+    The assignment is optimal when it is a perfect matching, the potentials
+    are dual feasible (u[i] + v[j] <= C[i][j] for every cell) and every
+    assigned cell is tight (complementary slackness), since the assignment
+    cost then equals the dual objective sum(u) + sum(v).
+    """
+    costs = np.asarray(matrix, dtype=float)
+    n = costs.shape[0]
+    u = np.asarray(row_potentials, dtype=float)
+    v = np.asarray(column_potentials, dtype=float)
+    tolerance = 1e-9 * max(1.0, float(np.max(np.abs(costs)))) * max(n, 1) if n else 1e-9
+    violations = []
+
+    rows = np.array([i for i, _ in assignment], dtype=np.intp)
+    columns = np.array([j for _, j in assignment], dtype=np.intp)
+    if len(assignment) != n or len(set(rows.tolist())) != n or len(set(columns.tolist())) != n:
+        violations.append(f'assignment is not a perfect matching ({len(assignment)} pairs for n={n})')
+        return violations
+    if u.shape != (n,) or v.shape != (n,):
+        violations.append(f'potentials have shapes {u.shape} and {v.shape}, expected ({n},)')
+        return violations
+
+    slack = costs - u[:, None] - v[None, :]
+    if n and slack.min() < -tolerance:
+        i, j = np.unravel_index(np.argmin(slack), slack.shape)
+        violations.append(f'dual infeasible at ({i}, {j}): u + v exceeds the cost by {-slack[i, j]:.6g}')
+
+    assigned_slack = slack[rows, columns]
+    if n and np.abs(assigned_slack).max() > tolerance:
+        k = int(np.argmax(np.abs(assigned_slack)))
+        violations.append(f'assigned cell ({rows[k]}, {columns[k]}) is not tight: slack {assigned_slack[k]:.6g}')
+
+    assignment_cost = float(costs[rows, columns].sum())
+    if total_cost is not None and abs(float(total_cost) - assignment_cost) > tolerance:
+        violations.append(f'reported cost {total_cost} differs from the assignment cost {assignment_cost}')
+    return violations
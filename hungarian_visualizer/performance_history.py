@@ -0,0 +1,144 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import numpy as np
+from typing import Dict, Any, Optional
+
+DEFAULT_HISTORY_PATH = os.path.join(tempfile.gettempdir(), 'hungarian_history.sqlite3')
+
+# Oldest runs beyond max_rows are deleted every PRUNE_INTERVAL inserts
+PRUNE_INTERVAL = 256
+
+PERCENTILES = (50, 95, 99)
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    n INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    engine TEXT NOT NULL,
+    trace TEXT NOT NULL,
+    iterations INTEGER,
+    seconds REAL NOT NULL,
+    phases TEXT,
+    peak_bytes INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_created ON runs (created);
+'''
+
+
+class PerformanceHistory:
+    """Per-run performance summaries in a local SQLite database
+
+    One row per solve: size, engine, trace level, iterations, wall time and,
+    when the run was profiled or memory-tracked, its phase timings and peak
+    allocation. The database is in WAL mode with one connection per thread,
+    so every worker process and request thread can write to the same file.
+    stats() aggregates percentiles per power-of-two size bucket.
+    """
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH, max_rows: int = 100_000):
+        self.path = path
+        self.max_rows = max_rows
+        self.local = threading.local()
+        self.inserts = 0
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.executescript(SCHEMA)
+        connection.execute('PRAGMA journal_mode=WAL')
+
+    def record(self, n: int, seconds: float, engine: str = 'hungarian', trace: str = 'none',
+               iterations: Optional[int] = None, phases: Optional[Dict[str, float]] = None,
+               peak_bytes: Optional[int] = None):
+        """Append one run; errors are logged, never raised into the request"""
+        try:
+            with self._connection() as connection:
+                connection.execute(
+                    'INSERT INTO runs (created, n, bucket, engine, trace, iterations, seconds, phases, peak_bytes) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (time.time(), int(n), size_bucket(n), engine, trace, iterations, float(seconds),
+                     json.dumps(phases) if phases else None, peak_bytes))
+
+            with self.lock:
+                self.inserts += 1
+                prune = self.inserts % PRUNE_INTERVAL == 0
+            if prune:
+                self._prune()
+        except sqlite3.Error as e:
+            print(f"Error recording performance history: {e}")
+
+    def stats(self, window_seconds: Optional[float] = None, engine: Optional[str] = None,
+              trace: Optional[str] = None) -> Dict[str, Any]:
+        """Percentiles of wall time, iterations, phase times and peak memory per size bucket"""
+        query = 'SELECT bucket, n, seconds, iterations, phases, peak_bytes FROM runs WHERE created >= ?'
+        params = [time.time() - window_seconds if window_seconds else 0]
+        if engine:
+            query += ' AND engine = ?'
+            params.append(engine)
+        if trace:
+            query += ' AND trace = ?'
+            params.append(trace)
+
+        rows_by_bucket = {}
+        for row in self._connection().execute(query + ' ORDER BY bucket', params):
+            rows_by_bucket.setdefault(row[0], []).append(row[1:])
+
+        buckets = []
+        for bucket, rows in rows_by_bucket.items():
+            sizes, seconds, iterations, phases, peak_bytes = zip(*rows)
+            entry = {
+                'sizes': bucket_label(bucket),
+                'runs': len(rows),
+                'mean_n': float(np.mean(sizes)),
+                'seconds': _percentiles(seconds),
+                'iterations': _percentiles([value for value in iterations if value is not None])
+            }
+
+            phase_samples = {}
+            for phase_json in phases:
+                for name, milliseconds in json.loads(phase_json or '{}').items():
+                    phase_samples.setdefault(name, []).append(milliseconds)
+            if phase_samples:
+                entry['phase_ms'] = {name: _percentiles(values) for name, values in phase_samples.items()}
+
+            peaks = [value for value in peak_bytes if value is not None]
+            if peaks:
+                entry['peak_bytes'] = _percentiles(peaks)
+            buckets.append(entry)
+
+        return {'window_seconds': window_seconds, 'engine': engine, 'trace': trace, 'buckets': buckets}
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5)
+            self.local.connection = connection
+        return connection
+
+    def _prune(self):
+        with self._connection() as connection:
+            connection.execute('DELETE FROM runs WHERE id <= (SELECT MAX(id) FROM runs) - ?',
+                               (self.max_rows,))
+
+
+def size_bucket(n: int) -> int:
+    """Power-of-two size bucket: n in [2**(b-1), 2**b - 1] has bucket b"""
+    return max(int(n), 1).bit_length()
+
+
+def bucket_label(bucket: int) -> str:
+    return f'{2 ** (bucket - 1)}-{2 ** bucket - 1}'
+
+
+def _percentiles(values) -> Optional[Dict[str, float]]:
+    if not values:
+        return None
+    return {f'p{p}': float(value) for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
@@ -0,0 +1,182 @@
+import cProfile
+import functools
+import pstats
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional
+
+# Category of step-trace recording, reported apart from the solver's own work
+TRACE_CATEGORY = 'trace'
+
+SPEEDSCOPE_SCHEMA = 'https://www.speedscope.app/file-format-schema.json'
+
+
+class PhaseProfiler:
+    """Records wall and CPU time of nested solver phases as timeline events
+
+    Events are dicts with name, category, start (ts) and wall duration (dur)
+    and CPU time (cpu) in microseconds from the first phase, plus their
+    nesting depth. CPU time is per thread, so concurrent requests in a
+    threaded server do not inflate each other. With use_cprofile the
+    outermost phase also runs under cProfile for a per-function breakdown.
+    """
+
+    def __init__(self, use_cprofile: bool = False, top_functions: int = 25):
+        self.use_cprofile = use_cprofile
+        self.top_functions = top_functions
+        self.events = []
+        self.depth = 0
+        self.origin = None
+        self.cprofile = None
+
+    @contextmanager
+    def phase(self, name: str, category: str = 'solver'):
+        """Time the enclosed block as one event"""
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        if self.origin is None:
+            self.origin = wall_start
+
+        # Appended on entry so events stay ordered by start time, parents first
+        event = {'name': name, 'cat': category, 'ts': (wall_start - self.origin) * 1e6,
+                 'depth': self.depth}
+        self.events.append(event)
+
+        if self.depth == 0 and self.use_cprofile:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            if self.depth == 0 and self.cprofile is not None:
+                self.cprofile.disable()
+            event['dur'] = (time.perf_counter() - wall_start) * 1e6
+            event['cpu'] = (time.thread_time() - cpu_start) * 1e6
+
+    def get_profile(self) -> Dict[str, Any]:
+        """Return the phase summary, raw events and (with cProfile) the top functions"""
+        profile = {'phases': summarize_events(self.events), 'events': self.events}
+        if self.cprofile is not None:
+            profile['functions'] = self._top_functions()
+        return profile
+
+    def _top_functions(self) -> List[Dict[str, Any]]:
+        stats = pstats.Stats(self.cprofile)
+        rows = []
+        for (filename, line, function), (_, calls, own, cumulative, _) in stats.stats.items():
+            rows.append({
+                'function': f'{function} ({filename.rsplit("/", 1)[-1]}:{line})',
+                'calls': calls,
+                'own_ms': own * 1000,
+                'cumulative_ms': cumulative * 1000
+            })
+        rows.sort(key=lambda row: row['cumulative_ms'], reverse=True)
+        return rows[:self.top_functions]
+
+
+def profiled_phase(name: str, category: str = 'solver'):
+    """Decorate a solver method so it is timed as a phase when self.profiler is set"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.profiler is None:
+                return method(self, *args, **kwargs)
+            with self.profiler.phase(name, category):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def summarize_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate events per phase name with total and self (children excluded) times"""
+    phases = {}
+    trace_ms = 0.0
+    total_ms = 0.0
+    open_events = []  # stack of (event, phase totals) for the current nesting path
+
+    for event in events:
+        while open_events and open_events[-1][0]['depth'] >= event['depth']:
+            open_events.pop()
+        if open_events:
+            open_events[-1][1]['self_ms'] -= event.get('dur', 0) / 1000
+
+        totals = phases.setdefault(event['name'], {
+            'category': event['cat'], 'calls': 0, 'wall_ms': 0.0, 'cpu_ms': 0.0, 'self_ms': 0.0
+        })
+        duration_ms = event.get('dur', 0) / 1000
+        totals['calls'] += 1
+        totals['wall_ms'] += duration_ms
+        totals['cpu_ms'] += event.get('cpu', 0) / 1000
+        totals['self_ms'] += duration_ms
+        open_events.append((event, totals))
+
+        if event['depth'] == 0:
+            total_ms += duration_ms
+        if event['cat'] == TRACE_CATEGORY and not any(
+                parent['cat'] == TRACE_CATEGORY for parent, _ in open_events[:-1]):
+            trace_ms += duration_ms
+
+    return {
+        'total_ms': total_ms,
+        'trace_overhead_ms': trace_ms,
+        'solver_ms': total_ms - trace_ms,
+        'phases': phases
+    }
+
+
+def to_chrome_trace(events: List[Dict[str, Any]], name: str = 'solve') -> Dict[str, Any]:
+    """Export events in the Chrome trace event format (chrome://tracing, Perfetto)"""
+    trace_events = [{'name': 'process_name', 'ph': 'M', 'pid': 1, 'tid': 1, 'args': {'name': name}}]
+    for event in events:
+        trace_events.append({
+            'name': event['name'],
+            'cat': event['cat'],
+            'ph': 'X',
+            'ts': event['ts'],
+            'dur': event.get('dur', 0),
+            'pid': 1,
+            'tid': 1,
+            'args': {'cpu_us': event.get('cpu', 0)}
+        })
+    return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+
+def to_speedscope(events: List[Dict[str, Any]], name: str = 'solve') -> Dict[str, Any]:
+    """Export events as a speedscope evented profile"""
+    frames = []
+    frame_index = {}
+    timeline = []  # (time, order, type, frame); closes sort before opens at equal times
+    for order, event in enumerate(events):
+        if event['name'] not in frame_index:
+            frame_index[event['name']] = len(frames)
+            frames.append({'name': event['name']})
+        frame = frame_index[event['name']]
+        end = event['ts'] + event.get('dur', 0)
+        timeline.append((event['ts'], 1, order, 'O', frame))
+        timeline.append((end, 0, -order, 'C', frame))
+    timeline.sort()
+
+    end_value = max((entry[0] for entry in timeline), default=0)
+    return {
+        '$schema': SPEEDSCOPE_SCHEMA,
+        'name': name,
+        'shared': {'frames': frames},
+        'profiles': [{
+            'type': 'evented',
+            'name': name,
+            'unit': 'microseconds',
+            'startValue': 0,
+            'endValue': end_value,
+            'events': [{'type': kind, 'frame': frame, 'at': at}
+                       for at, _, _, kind, frame in timeline]
+        }]
+    }
+
+
+def strip_events(profile: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Profile without its raw events, for inline responses"""
+    if profile is None:
+        return None
+    return {key: value for key, value in profile.items() if key != 'events'}
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import numpy as np
+from typing import Optional
+
+# Entries are pruned (oldest first) every PRUNE_INTERVAL writes
+PRUNE_INTERVAL = 32
+
+
+class ResultCache:
+    """Solve-result cache shared by every process on the host
+
+    One file per entry under `directory`, written atomically (temp file +
+    os.replace), so pre-forked workers can read each other's results without
+    locks. Keys hash the matrix bytes, dtype, shape and solve options.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 1000):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.writes = 0
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(matrix: np.ndarray, **options) -> str:
+        """Hash a matrix and its solve options into a cache key"""
+        digest = hashlib.sha256()
+        digest.update(f'{matrix.dtype.str}{matrix.shape}'.encode('ascii'))
+        digest.update(np.ascontiguousarray(matrix).tobytes())
+        digest.update(json.dumps(options, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached bytes for a key, or None"""
+        try:
+            with open(os.path.join(self.directory, key), 'rb') as handle:
+                return handle.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes):
+        """Store bytes under a key, replacing any previous entry"""
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(handle, 'wb') as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, os.path.join(self.directory, key))
+        except OSError as e:
+            print(f"Error writing result cache entry: {e}")
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            return
+
+        with self.lock:
+            self.writes += 1
+            prune = self.writes % PRUNE_INTERVAL == 0
+        if prune:
+            self._prune()
+
+    def _prune(self):
+        """Delete the oldest entries beyond max_entries"""
+        try:
+            entries = [entry for entry in os.scandir(self.directory)
+                       if entry.is_file() and not entry.name.startswith('.')]
+            excess = len(entries) - self.max_entries
+            if excess <= 0:
+                return
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:excess]:
+                os.unlink(entry.path)
+        except OSError:
+            pass  # Another worker pruned concurrently
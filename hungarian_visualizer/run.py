@@ -9,7 +9,13 @@ with proper error handling and setup validation.
 
 import sys
 import os
+import argparse
+import signal
+import socket
 import subprocess
+import tempfile
+import threading
+import time
 import importlib.util
 
 def check_python_version():
@@ -25,7 +31,11 @@ def check_dependencies():
     """Check if required dependencies are installed"""
     required_packages = [
         'flask',
-        'numpy',
+        'numpy'
+    ]
+    
+    # Only needed for charts and memory metrics, loaded on first use
+    optional_packages = [
         'matplotlib',
         'seaborn',
         'psutil'
@@ -37,6 +47,13 @@ def check_dependencies():
         if importlib.util.find_spec(package) is None:
             missing_packages.append(package)
     
+    missing_optional = [package for package in optional_packages
+                        if importlib.util.find_spec(package) is None]
+    if missing_optional:
+        print("⚠️  Optional packages not installed (charts/memory metrics disabled):")
+        for package in missing_optional:
+            print(f"   - {package}")
+    
     if missing_packages:
         print("❌ Missing required packages:")
         for package in missing_packages:
@@ -109,8 +126,143 @@ def start_application():
         print(f"❌ Error starting application: {e}")
         return False
 
+def _worker_memory_mb():
+    """Resident memory of this process in MB (peak RSS when psutil is missing)"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 / 1024
+    except ImportError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _run_worker(app, sock, host, port, max_memory_mb):
+    """Serve requests on the inherited socket until told to stop or recycled"""
+    from werkzeug.serving import make_server
+    
+    server = make_server(host, port, app, threaded=True, fd=sock.fileno())
+    # Let in-flight requests finish on shutdown instead of dropping them
+    server.daemon_threads = False
+    server.block_on_close = True
+    
+    def stop(*_):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+    
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # The parent handles Ctrl+C
+    
+    def watch():
+        parent = os.getppid()
+        while True:
+            time.sleep(5)
+            if os.getppid() != parent:
+                print(f"👋 Worker {os.getpid()} lost its parent, stopping")
+                break
+            memory_mb = _worker_memory_mb() if max_memory_mb else 0
+            if memory_mb > max_memory_mb:
+                print(f"♻️  Worker {os.getpid()} using {memory_mb:.0f} MB, recycling")
+                break
+        stop()
+    
+    threading.Thread(target=watch, daemon=True).start()
+    
+    server.serve_forever()
+    server.server_close()
+
+def serve_production(host='0.0.0.0', port=5000, workers=4, max_worker_memory_mb=1024):
+    """Serve with pre-forked worker processes sharing one listening socket
+    
+    The solver, app and plotting stacks are imported once in the parent so the
+    workers start warm and share those pages copy-on-write. Workers share
+    stored runs and solve results through the disk-backed run store and result
+    cache, drain in-flight requests on SIGTERM and are replaced when they exit
+    (including when they recycle themselves above max_worker_memory_mb).
+    """
+    if not hasattr(os, 'fork'):
+        print("⚠️  Pre-fork serving needs os.fork, falling back to the development server")
+        from app import app
+        app.run(host=host, port=port)
+        return
+    
+    # Must be configured before app is imported: workers cannot see each other's memory
+    os.environ['HUNGARIAN_RUN_STORE_WRITE_THROUGH'] = '1'
+    os.environ.setdefault('HUNGARIAN_RESULT_CACHE_DIR',
+                          os.path.join(tempfile.gettempdir(), 'hungarian_results'))
+    
+    from app import app, _load_plotting
+    import hungarian_algorithm, analytics, matrix_generator  # noqa: F401 (warm start)
+    if app.config['CHARTS_ENABLED']:
+        _load_plotting()
+    
+    sock = socket.socket(socket.AF_INET6 if ':' in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(128)
+    sock.set_inheritable(True)
+    
+    stopping = False
+    children = set()
+    
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _run_worker(app, sock, host, port, max_worker_memory_mb)
+            except Exception as e:
+                print(f"❌ Worker {os.getpid()} failed: {e}")
+                code = 1
+            finally:
+                os._exit(code)
+        children.add(pid)
+    
+    def stop(*_):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    
+    print(f"🚀 Serving on http://{host}:{port} with {workers} workers (pid {os.getpid()})")
+    for _ in range(workers):
+        spawn()
+    
+    while children:
+        try:
+            pid, _ = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        children.discard(pid)
+        if not stopping:
+            print(f"🔁 Worker {pid} exited, starting a replacement")
+            spawn()
+    
+    sock.close()
+    print("👋 All workers stopped")
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description='Start the Hungarian Method Visualizer')
+    parser.add_argument('--serve', action='store_true',
+                        help='production mode: pre-forked workers, no debugger or reloader')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2,
+                        help='worker processes in --serve mode (default: CPU count)')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--max-worker-memory-mb', type=float, default=1024,
+                        help='recycle a worker above this resident memory, 0 disables')
+    return parser.parse_args()
+
 def main():
     """Main startup function"""
+    args = parse_args()
+    
     print("🔍 Hungarian Method Visualizer - Startup Check")
     print("=" * 50)
     
@@ -134,7 +286,10 @@ def main():
     print("=" * 50)
     
     # Start the application
-    start_application()
+    if args.serve:
+        serve_production(args.host, args.port, args.workers, args.max_worker_memory_mb)
+    else:
+        start_application()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,411 @@
+import html
+import json
+import os
+import tempfile
+import time
+import zipfile
+import numpy as np
+from typing import Dict, Any, Iterable, Iterator, Callable, List, Optional
+from trace_archive import ARCHIVE_EXTENSION, write_trace_archive
+
+# Formats served by /api/runs/<run_id>/export: format -> (mimetype, file extension)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'json': ('application/json', 'json'),
+    'html': ('text/html', 'html'),
+    'npz': ('application/octet-stream', 'npz'),
+    'trace': ('application/octet-stream', ARCHIVE_EXTENSION[1:])
+}
+
+# Buffered output is handed to the response in chunks of about this many bytes
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+REPORT_STYLE = '''
+        body { font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; color: #333; }
+        .header { text-align: center; margin-bottom: 30px; border-bottom: 2px solid #3498db; padding-bottom: 20px; }
+        .section { margin-bottom: 40px; page-break-inside: avoid; }
+        .matrix-table { border-collapse: collapse; margin: 20px auto; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }
+        .matrix-table th, .matrix-table td { border: 1px solid #ddd; padding: 12px; text-align: center; min-width: 50px; }
+        .matrix-table th { background-color: #3498db; color: white; font-weight: bold; }
+        .assigned-cell { background-color: #2ecc71; color: white; font-weight: bold; }
+        .zero-cell { background-color: #f39c12; color: white; font-weight: bold; }
+        .metrics-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; margin: 20px 0; }
+        .metric-card { border: 2px solid #3498db; padding: 20px; text-align: center; border-radius: 8px;
+                       background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); }
+        .metric-value { font-size: 28px; font-weight: bold; color: #2c3e50; margin: 10px 0; }
+        .metric-label { font-size: 14px; color: #6c757d; text-transform: uppercase; letter-spacing: 1px; }
+        .step-summary { margin: 15px 0; padding: 15px; background: #f8f9fa; border-left: 4px solid #3498db; border-radius: 4px; }
+        .chart-container { text-align: center; margin: 30px 0; page-break-inside: avoid; }
+        .chart-container img { max-width: 100%; height: auto; border: 1px solid #ddd; border-radius: 8px; }
+        .chart-title { font-size: 18px; font-weight: bold; margin-bottom: 15px; color: #2c3e50; }
+        .summary-box { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white;
+                       padding: 25px; border-radius: 10px; margin: 20px 0; }
+        .algorithm-steps { background: #f8f9fa; padding: 20px; border-radius: 8px; }
+        h1 { color: #2c3e50; font-size: 2.5em; margin-bottom: 10px; }
+        h2 { color: #3498db; border-bottom: 2px solid #3498db; padding-bottom: 10px; }
+        h3 { color: #2c3e50; margin-top: 25px; }
+        .page-break { page-break-before: always; }
+        @media print {
+            body { margin: 0; font-size: 12px; }
+            .section { margin-bottom: 30px; }
+        }
+'''
+
+CHART_TITLES = (
+    ('cost_reduction', 'Cost Progression Through Algorithm Steps'),
+    ('zero_density', 'Zero Density Evolution'),
+    ('final_heatmap', 'Final Matrix Heatmap')
+)
+
+
+def export_chunks(export_format: str, summary: Dict[str, Any], steps: Iterable[Dict[str, Any]],
+                  dumps: Callable = json.dumps, archive_path: Optional[str] = None) -> Iterator[bytes]:
+    """Stream a stored run in one of EXPORT_FORMATS as byte chunks
+
+    `steps` is consumed once, in order, so a run read page by page from the
+    run store is never held in memory as a whole. For the trace format an
+    existing archive of the run (archive_path) is streamed as is.
+    """
+    if export_format == 'npz':
+        return export_npz(summary, steps)
+    if export_format == 'trace':
+        return export_trace(summary, steps, dumps, archive_path)
+    writers = {'csv': export_csv, 'json': export_json, 'html': export_html}
+    return _buffered(writers[export_format](summary, steps, dumps))
+
+
+def export_csv(summary: Dict[str, Any], steps: Iterable[Dict[str, Any]],
+               dumps: Callable = json.dumps) -> Iterator[str]:
+    """The CSV export: original matrix, assignment, step summary and analytics"""
+    steps = iter(steps)
+    first_step = next(steps, None)
+    original = _original_matrix(first_step)
+
+    yield 'Hungarian Algorithm Results\n\n'
+    if original is not None:
+        yield 'Original Cost Matrix\n'
+        yield 'Row,' + ','.join(f'Col{j + 1}' for j in range(len(original))) + '\n'
+        for i, row in enumerate(original):
+            yield f'Row{i + 1},' + ','.join(_format_value(value) for value in row) + '\n'
+        yield '\n'
+
+    assignment = summary.get('assignment') or []
+    if assignment:
+        yield 'Final Assignment\n'
+        yield 'Agent,Task,Cost\n'
+        for row, col in assignment:
+            cost = _format_value(original[row][col]) if original is not None else ''
+            yield f'{row + 1},{col + 1},{cost}\n'
+        yield f"Total Cost,{_format_value(summary.get('total_cost', 0))}\n"
+    yield '\n'
+
+    yield 'Algorithm Steps Summary\n'
+    yield 'Step,Type,Description,Zero Density,Frobenius Norm\n'
+    for step in _chain(first_step, steps):
+        yield (f"{step['step_number'] + 1},{_csv_text(step['type'])},{_csv_text(step.get('description', ''))},"
+               f"{step.get('zero_density', 0):.4f},{step.get('frobenius_norm', 0):.4f}\n")
+    yield '\n'
+
+    analytics = summary.get('analytics')
+    if analytics:
+        yield 'Performance Analytics\n'
+        yield 'Metric,Value\n'
+        for label, value in _analytics_rows(analytics):
+            yield f'{label},{value}\n'
+
+
+def export_json(summary: Dict[str, Any], steps: Iterable[Dict[str, Any]],
+                dumps: Callable = json.dumps) -> Iterator[str]:
+    """The JSON export, in the shape of the browser export, written one step at a time"""
+    steps = iter(steps)
+    first_step = next(steps, None)
+    original = _original_matrix(first_step)
+    analytics = summary.get('analytics')
+
+    metadata = {
+        'algorithm': 'Hungarian Method',
+        'exportDate': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'runId': summary.get('run_id'),
+        'matrixSize': summary.get('n', 0),
+        'totalSteps': summary.get('num_steps', 0)
+    }
+    yield '{"metadata": ' + dumps(metadata)
+    yield ', "originalMatrix": ['
+    for i, row in enumerate(original or []):
+        yield (',' if i else '') + dumps(row)
+    yield '], "algorithmSteps": ['
+    for k, step in enumerate(_chain(first_step, steps)):
+        yield (',\n' if k else '\n') + dumps(step)
+    yield '\n], "analytics": ' + dumps(analytics)
+    yield ', "finalAssignment": ' + dumps(summary.get('assignment') or [])
+    yield ', "totalCost": ' + dumps(summary.get('total_cost', 0))
+    yield ', "summary": ' + dumps({
+        'optimalCost': summary.get('total_cost', 0),
+        'executionTime': summary.get('execution_time', 0),
+        'totalSteps': summary.get('num_steps', 0),
+        'efficiencyRatio': (analytics or {}).get('efficiency_ratio', 0),
+        'performanceScore': (analytics or {}).get('performance_score', 0),
+        'guaranteedOptimal': True
+    })
+    yield '}\n'
+
+
+def export_html(summary: Dict[str, Any], steps: Iterable[Dict[str, Any]],
+                dumps: Callable = json.dumps) -> Iterator[str]:
+    """The printable HTML report, with matrix tables written row by row"""
+    steps = iter(steps)
+    first_step = next(steps, None)
+    original = _original_matrix(first_step)
+    analytics = summary.get('analytics') or {}
+    assignment = summary.get('assignment') or []
+    assigned = {row: col for row, col in assignment}
+    num_steps = summary.get('num_steps', 0)
+    n = summary.get('n', 0)
+    total_cost = _format_value(summary.get('total_cost', 0))
+
+    yield ('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+           '<title>Hungarian Algorithm Comprehensive Report</title>\n'
+           f'<style>{REPORT_STYLE}</style>\n</head>\n<body>\n')
+    yield ('<div class="header"><h1>Hungarian Algorithm Analysis Report</h1>'
+           f"<p><strong>Generated:</strong> {time.strftime('%Y-%m-%d %H:%M:%S')}</p>"
+           f'<p><strong>Matrix Size:</strong> {n}×{n} | <strong>Total Cost:</strong> {total_cost}</p></div>\n')
+
+    yield '<div class="section"><h2>Performance Metrics Overview</h2>\n'
+    if analytics:
+        yield '<div class="metrics-grid">'
+        for label, value in _analytics_rows(analytics):
+            yield f'<div class="metric-card"><div class="metric-label">{html.escape(label)}</div>' \
+                  f'<div class="metric-value">{html.escape(str(value))}</div></div>'
+        yield '</div>'
+    else:
+        yield '<p>No analytics available</p>'
+    yield '</div>\n'
+
+    charts = summary.get('charts') or {}
+    if charts:
+        yield '<div class="section"><h2>Algorithm Performance Charts</h2>\n'
+        for name, title in CHART_TITLES:
+            if name in charts:
+                yield (f'<div class="chart-container"><div class="chart-title">{title}</div>'
+                       f'<img src="{charts[name]}" alt="{title}" /></div>\n')
+        yield '</div>\n'
+
+    if original is not None:
+        yield '<div class="section page-break"><h2>Original Cost Matrix</h2>\n'
+        yield from _matrix_table(original, assigned)
+        yield '</div>\n'
+
+    yield '<div class="section"><h2>Optimal Assignment Solution</h2>\n'
+    if assignment:
+        yield '<table class="matrix-table"><tr><th>Agent</th><th>Task</th><th>Cost</th></tr>\n'
+        for row, col in assignment:
+            cost = _format_value(original[row][col]) if original is not None else ''
+            yield f'<tr><td>Agent {row + 1}</td><td>Task {col + 1}</td><td>{cost}</td></tr>\n'
+        yield f'<tr><th colspan="2">Optimal Total</th><th>{total_cost}</th></tr></table>\n'
+    else:
+        yield '<p>No assignment available</p>'
+    yield '</div>\n'
+
+    yield '<div class="section"><h2>Algorithm Steps Breakdown</h2><div class="algorithm-steps">\n'
+    final_step = None
+    for k, step in enumerate(_chain(first_step, steps)):
+        final_step = step
+        yield (f'<div class="step-summary"><h4>Step {step["step_number"] + 1}: '
+               f'{html.escape(step["type"].replace("_", " ").upper())}</h4>'
+               f'<p><strong>Description:</strong> {html.escape(str(step.get("description", "")))}</p>'
+               f'<p><strong>Zero Density:</strong> {step.get("zero_density", 0) * 100:.1f}% | '
+               f'<strong>Frobenius Norm:</strong> {step.get("frobenius_norm", 0):.2f} | '
+               f'<strong>Progress:</strong> {(k + 1) / max(num_steps, 1) * 100:.1f}%</p></div>\n')
+    if final_step is None:
+        yield '<p>No steps available</p>'
+    yield '</div></div>\n'
+
+    if final_step is not None and 'matrix' in final_step:
+        yield '<div class="section page-break"><h2>Final Matrix State</h2>\n'
+        yield from _matrix_table(final_step['matrix'], assigned)
+        yield '</div>\n'
+
+    yield ('<div class="section"><h2>Executive Summary</h2><div class="summary-box">'
+           f'<p><strong>Problem:</strong> Solved a {n}×{n} assignment problem using the Hungarian Algorithm.</p>'
+           f'<p><strong>Solution:</strong> Optimal assignment with total cost <strong>{total_cost}</strong> '
+           f'in {num_steps} algorithm steps.</p></div></div>\n')
+    yield '</body>\n</html>\n'
+
+
+def export_npz(summary: Dict[str, Any], steps: Iterable[Dict[str, Any]],
+               chunk_bytes: int = EXPORT_CHUNK_BYTES) -> Iterator[bytes]:
+    """A compressed .npz archive of the run, written one step matrix at a time
+
+    Arrays: original_matrix, step_matrices (num_steps x n x n), step_types,
+    zero_density, frobenius_norm, step_total_cost, assignment and total_cost.
+    Load with numpy.load(path).
+    """
+    sink = _ChunkSink()
+    steps = iter(steps)
+    first_step = next(steps, None)
+    original = _original_matrix(first_step)
+    num_steps = summary.get('num_steps', 0) if first_step is not None else 0
+    n = len(first_step['matrix']) if first_step is not None else 0
+
+    step_types: List[str] = []
+    scalars: Dict[str, List[float]] = {'zero_density': [], 'frobenius_norm': [], 'step_total_cost': []}
+
+    # An unseekable sink makes zipfile write data descriptors instead of seeking back
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+        _write_npy(archive, 'original_matrix', np.asarray(original if original is not None else [], dtype=float))
+
+        with archive.open('step_matrices.npy', 'w', force_zip64=True) as handle:
+            _write_npy_header(handle, np.dtype(float), (num_steps, n, n))
+            for step in _chain(first_step, steps):
+                handle.write(np.asarray(step['matrix'], dtype=float).tobytes())
+                step_types.append(step['type'])
+                scalars['zero_density'].append(step.get('zero_density', 0))
+                scalars['frobenius_norm'].append(step.get('frobenius_norm', 0))
+                scalars['step_total_cost'].append(step.get('total_cost', 0))
+                if sink.size >= chunk_bytes:
+                    yield sink.drain()
+
+        _write_npy(archive, 'step_types', np.asarray(step_types, dtype=str))
+        for name, values in scalars.items():
+            _write_npy(archive, name, np.asarray(values, dtype=float))
+        _write_npy(archive, 'assignment',
+                   np.asarray(summary.get('assignment') or [], dtype=np.int64).reshape(-1, 2))
+        _write_npy(archive, 'total_cost', np.asarray(summary.get('total_cost', 0)))
+    yield sink.drain()
+
+
+def export_trace(summary: Dict[str, Any], steps: Iterable[Dict[str, Any]], dumps: Callable = json.dumps,
+                 archive_path: Optional[str] = None) -> Iterator[bytes]:
+    """The trace archive (see trace_archive.py), written to a temporary file first
+
+    The archive's step index comes last, so it cannot be streamed while it is
+    built; only the finished file is read back in chunks.
+    """
+    if archive_path is not None:
+        yield from _file_chunks(archive_path)
+        return
+
+    handle, path = tempfile.mkstemp(suffix=ARCHIVE_EXTENSION)
+    os.close(handle)
+    try:
+        write_trace_archive(path, steps, summary=summary, dumps=dumps)
+        yield from _file_chunks(path)
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _file_chunks(path: str, chunk_bytes: int = EXPORT_CHUNK_BYTES) -> Iterator[bytes]:
+    with open(path, 'rb') as handle:
+        while True:
+            chunk = handle.read(chunk_bytes)
+            if not chunk:
+                return
+            yield chunk
+
+
+class _ChunkSink:
+    """Write-only file object collecting output until it is drained"""
+
+    def __init__(self):
+        self.chunks = []
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self.chunks)
+        self.chunks = []
+        self.size = 0
+        return data
+
+
+def _write_npy(archive: zipfile.ZipFile, name: str, array: np.ndarray):
+    with archive.open(f'{name}.npy', 'w', force_zip64=True) as handle:
+        _write_npy_header(handle, array.dtype, array.shape)
+        handle.write(np.ascontiguousarray(array).tobytes())
+
+
+def _write_npy_header(handle, dtype: np.dtype, shape):
+    np.lib.format.write_array_header_1_0(handle, {
+        'descr': np.lib.format.dtype_to_descr(dtype),
+        'fortran_order': False,
+        'shape': tuple(shape)
+    })
+
+
+def _buffered(chunks: Iterable[str], chunk_bytes: int = EXPORT_CHUNK_BYTES) -> Iterator[bytes]:
+    """Join small text pieces into UTF-8 chunks of about chunk_bytes"""
+    pending = []
+    size = 0
+    for piece in chunks:
+        pending.append(piece)
+        size += len(piece)
+        if size >= chunk_bytes:
+            yield ''.join(pending).encode('utf-8')
+            pending = []
+            size = 0
+    if pending:
+        yield ''.join(pending).encode('utf-8')
+
+
+def _matrix_table(matrix, assigned: Dict[int, int]) -> Iterator[str]:
+    yield '<table class="matrix-table"><tr><th></th>'
+    yield ''.join(f'<th>T{j + 1}</th>' for j in range(len(matrix))) + '</tr>\n'
+    for i, row in enumerate(matrix):
+        cells = []
+        for j, value in enumerate(row):
+            cell_class = 'assigned-cell' if assigned.get(i) == j else 'zero-cell' if value == 0 else ''
+            cells.append(f'<td class="{cell_class}">{_format_value(value)}</td>')
+        yield f'<tr><th>A{i + 1}</th>' + ''.join(cells) + '</tr>\n'
+    yield '</table>\n'
+
+
+def _analytics_rows(analytics: Dict[str, Any]):
+    """(label, formatted value) pairs of the headline analytics present in a run"""
+    rows = []
+    if 'execution_time' in analytics:
+        rows.append(('Execution Time (ms)', f"{analytics['execution_time'] * 1000:.2f}"))
+    if 'num_steps' in analytics:
+        rows.append(('Total Steps', analytics['num_steps']))
+    if 'iterations_count' in analytics:
+        rows.append(('Iterations', analytics['iterations_count']))
+    if 'efficiency_ratio' in analytics:
+        rows.append(('Efficiency Ratio', f"{analytics['efficiency_ratio'] * 100:.2f}%"))
+    if 'convergence_rate' in analytics:
+        rows.append(('Convergence Rate', f"{analytics['convergence_rate']:.4f}"))
+    if 'performance_score' in analytics:
+        rows.append(('Performance Score', f"{analytics['performance_score']:.2f}"))
+    if 'actual_operations' in analytics:
+        rows.append(('Total Operations', analytics['actual_operations']))
+    return rows
+
+
+def _original_matrix(first_step: Optional[Dict[str, Any]]):
+    """The input matrix, recorded as the matrix of the initial step"""
+    if first_step is None or first_step.get('type') != 'initial':
+        return None
+    return first_step.get('matrix')
+
+
+def _chain(first_step: Optional[Dict[str, Any]], steps: Iterator[Dict[str, Any]]):
+    if first_step is not None:
+        yield first_step
+        yield from steps
+
+
+def _format_value(value) -> str:
+    """Integral values without a trailing .0, as the browser shows them"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _csv_text(text: str) -> str:
+    return '"' + str(text).replace('"', '""') + '"'
@@ -0,0 +1,258 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Callable
+from trace_archive import TraceReader, write_trace_archive
+
+# Run ids are uuid4 hex strings; anything else is rejected before touching the disk
+RUN_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+DEFAULT_RUN_STORE_DIR = os.path.join(tempfile.gettempdir(), 'hungarian_runs')
+
+TRACE_FILE = 'trace.hgtrace'
+
+
+class RunStore:
+    """Stores solved runs by id with a bounded in-memory tier that spills to disk
+
+    Memory holds the most recently used runs, bounded by run count and by the
+    total number of step-matrix cells. Evicted runs are written to
+    <directory>/<run_id>/ as summary.json plus trace.hgtrace, a trace archive
+    (see trace_archive.py) that is memory-mapped to read any step range
+    without loading the rest. Runs whose steps cannot be archived (no step
+    matrices) fall back to steps.ndjson, whose line byte offsets are kept in
+    the summary so any step range is read with one seek. With write_through,
+    every run is also written to disk on put, so separate worker processes
+    sharing the directory can serve it.
+    """
+
+    def __init__(self, directory: str = DEFAULT_RUN_STORE_DIR, max_memory_runs: int = 32,
+                 max_memory_cells: int = 20_000_000, max_disk_runs: int = 500,
+                 write_through: bool = False, dumps: Callable = json.dumps, max_open_traces: int = 16):
+        self.directory = directory
+        self.max_memory_runs = max_memory_runs
+        self.max_memory_cells = max_memory_cells
+        self.max_disk_runs = max_disk_runs
+        self.write_through = write_through
+        self.dumps = dumps
+
+        self.memory = OrderedDict()  # run_id -> {'summary': ..., 'steps': [...], 'cells': int}
+        self.memory_cells = 0
+        self.spilling = {}  # runs being written to disk, still readable
+        self.max_open_traces = max_open_traces
+        self.traces = OrderedDict()  # run_id -> TraceReader of recently read disk runs
+        self.lock = threading.Lock()
+
+    def put(self, payload: Dict[str, Any]) -> str:
+        """Store a solve payload (with 'steps'), returning its new run id"""
+        run_id = uuid.uuid4().hex
+        steps = payload.get('steps', [])
+        n = len(steps[0]['matrix']) if steps and 'matrix' in steps[0] else 0
+
+        summary = {key: value for key, value in payload.items() if key != 'steps'}
+        summary.update({'run_id': run_id, 'num_steps': len(steps), 'n': n,
+                        'created': time.time()})
+        record = {'summary': summary, 'steps': steps, 'cells': len(steps) * n * n}
+
+        if self.write_through:
+            self._spill(run_id, record)
+
+        with self.lock:
+            self.memory[run_id] = record
+            self.memory_cells += record['cells']
+            evicted = self._evict()
+            if self.write_through:
+                return run_id  # Already on disk
+            self.spilling.update(evicted)
+
+        for evicted_id, evicted_record in evicted.items():
+            self._spill(evicted_id, evicted_record)
+        return run_id
+
+    def put_trace(self, path: str, replay: Optional[Callable[[TraceReader], Dict[str, Any]]] = None) -> str:
+        """Store a trace archive file as a disk run, returning its new run id
+
+        The archive is validated (checksums, footer, offsets and every step's
+        fields) and copied into the store; its run summary becomes the run
+        summary, extended by replay(reader) if given (e.g. the charts, which
+        archives do not keep). Raises ValueError if it is not a valid archive.
+        """
+        with TraceReader(path) as reader:
+            for k in range(reader.num_steps):
+                reader.metadata(k)
+            summary = dict(reader.summary, n=reader.n, num_steps=reader.num_steps)
+            if replay is not None:
+                summary.update(replay(reader))
+
+        run_id = uuid.uuid4().hex
+        run_dir = os.path.join(self.directory, run_id)
+        os.makedirs(run_dir, exist_ok=True)
+        shutil.copyfile(path, os.path.join(run_dir, TRACE_FILE))
+        summary.update({'run_id': run_id, 'created': time.time(), 'step_format': 'trace'})
+        self._write_summary(run_dir, summary)
+        self._prune_disk()
+        return run_id
+
+    def get_summary(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Return the run summary (everything but the steps), or None if unknown"""
+        record = self._lookup(run_id)
+        if record is not None:
+            return record['summary']
+
+        summary = self._read_disk_summary(run_id)
+        if summary is not None:
+            summary = dict(summary)
+            summary.pop('step_offsets', None)
+            summary.pop('step_format', None)
+        return summary
+
+    def get_steps(self, run_id: str, start: int = 0, end: Optional[int] = None) -> Optional[List[Dict]]:
+        """Return steps[start:end] of a run, or None if the run is unknown"""
+        record = self._lookup(run_id)
+        if record is not None:
+            return record['steps'][start:end]
+
+        summary = self._read_disk_summary(run_id)
+        if summary is None:
+            return None
+
+        if summary.get('step_format') == 'trace':
+            reader = self._open_trace(run_id)
+            return reader.steps(start, end) if reader is not None else None
+
+        offsets = summary['step_offsets']
+        start, end, _ = slice(start, end).indices(len(offsets) - 1)
+        if start >= end:
+            return []
+
+        with open(self._path(run_id, 'steps.ndjson'), 'rb') as handle:
+            handle.seek(offsets[start])
+            chunk = handle.read(offsets[end] - offsets[start])
+        return [json.loads(line) for line in chunk.splitlines()]
+
+    def iter_steps(self, run_id: str, page_size: int = 64):
+        """Yield the steps of a run one at a time, reading disk runs page by page"""
+        summary = self.get_summary(run_id)
+        if summary is None:
+            return
+        for start in range(0, summary['num_steps'], page_size):
+            yield from self.get_steps(run_id, start, start + page_size) or []
+
+    def trace_path(self, run_id: str) -> Optional[str]:
+        """Path of the run's trace archive if it is on disk in that format, else None"""
+        summary = self._read_disk_summary(run_id)
+        if summary is None or summary.get('step_format') != 'trace':
+            return None
+        return self._path(run_id, TRACE_FILE)
+
+    def _open_trace(self, run_id: str) -> Optional[TraceReader]:
+        """Memory-mapped reader of a disk run, keeping the last few open"""
+        with self.lock:
+            reader = self.traces.get(run_id)
+            if reader is not None:
+                self.traces.move_to_end(run_id)
+                return reader
+
+        try:
+            # Written by this store or checksummed by put_trace, so only the footer CRC is checked
+            reader = TraceReader(self._path(run_id, TRACE_FILE), verify=False)
+        except (OSError, ValueError):
+            return None
+
+        with self.lock:
+            self.traces[run_id] = reader
+            while len(self.traces) > self.max_open_traces:
+                # Dropped, not closed: another thread may still be reading it
+                self.traces.popitem(last=False)
+        return reader
+
+    def _lookup(self, run_id: str) -> Optional[Dict[str, Any]]:
+        if not RUN_ID_PATTERN.match(run_id or ''):
+            return None
+        with self.lock:
+            record = self.memory.get(run_id)
+            if record is not None:
+                self.memory.move_to_end(run_id)
+                return record
+            return self.spilling.get(run_id)
+
+    def _evict(self) -> Dict[str, Dict[str, Any]]:
+        """Pop least recently used runs until the memory tier fits its bounds"""
+        evicted = {}
+        while len(self.memory) > 1 and (len(self.memory) > self.max_memory_runs
+                                        or self.memory_cells > self.max_memory_cells):
+            run_id, record = self.memory.popitem(last=False)
+            self.memory_cells -= record['cells']
+            evicted[run_id] = record
+        return evicted
+
+    def _spill(self, run_id: str, record: Dict[str, Any]):
+        """Write an evicted run to disk"""
+        try:
+            run_dir = os.path.join(self.directory, run_id)
+            os.makedirs(run_dir, exist_ok=True)
+
+            try:
+                write_trace_archive(os.path.join(run_dir, TRACE_FILE), record['steps'],
+                                    summary=record['summary'], dumps=self.dumps)
+                summary = dict(record['summary'], step_format='trace')
+            except ValueError:
+                summary = dict(record['summary'], step_format='ndjson',
+                               step_offsets=self._write_ndjson(run_dir, record['steps']))
+            self._write_summary(run_dir, summary)
+            self._prune_disk()
+        except OSError as e:
+            print(f"Error spilling run {run_id} to disk: {e}")
+        finally:
+            with self.lock:
+                self.spilling.pop(run_id, None)
+
+    def _write_summary(self, run_dir: str, summary: Dict[str, Any]):
+        """Write the summary last and atomically: its presence marks a complete run"""
+        temp_path = os.path.join(run_dir, 'summary.json.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            handle.write(self.dumps(summary))
+        os.replace(temp_path, os.path.join(run_dir, 'summary.json'))
+
+    def _write_ndjson(self, run_dir: str, steps: List[Dict]) -> List[int]:
+        """Write steps one JSON line each, returning the line byte offsets"""
+        offsets = [0]
+        with open(os.path.join(run_dir, 'steps.ndjson'), 'wb') as handle:
+            for step in steps:
+                line = (self.dumps(step) + '\n').encode('utf-8')
+                handle.write(line)
+                offsets.append(offsets[-1] + len(line))
+        return offsets
+
+    def _prune_disk(self):
+        """Delete the oldest spilled runs beyond max_disk_runs"""
+        try:
+            entries = [entry for entry in os.scandir(self.directory)
+                       if entry.is_dir() and RUN_ID_PATTERN.match(entry.name)]
+        except FileNotFoundError:
+            return
+
+        excess = len(entries) - self.max_disk_runs
+        if excess <= 0:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:excess]:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+    def _read_disk_summary(self, run_id: str) -> Optional[Dict[str, Any]]:
+        if not RUN_ID_PATTERN.match(run_id or ''):
+            return None
+        try:
+            with open(self._path(run_id, 'summary.json'), encoding='utf-8') as handle:
+                return json.load(handle)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _path(self, run_id: str, name: str) -> str:
+        return os.path.join(self.directory, run_id, name)
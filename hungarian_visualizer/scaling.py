@@ -0,0 +1,174 @@
+import math
+from contextlib import nullcontext
+from time import perf_counter
+import numpy as np
+from typing import List, Dict, Any, Optional, Callable
+from hungarian_algorithm import HungarianAlgorithm
+from matrix_generator import MatrixGenerator
+
+# Solver configurations the analyzer can time: the engine plus the trace level it runs at.
+# Every engine here is timed by the benchmarks and checked by the fuzz harness (see run_engine)
+ENGINES = {
+    'hungarian': {'engine': 'hungarian', 'trace': 'none', 'record_steps': False},
+    'hungarian_traced': {'engine': 'hungarian', 'trace': 'steps', 'record_steps': True},
+    # Copy-free input path: works in the input dtype and reduces its own buffer in place
+    'hungarian_inplace': {'engine': 'hungarian', 'trace': 'none', 'record_steps': False, 'in_place': True}
+}
+
+# Two-sided 95% Student t critical values by degrees of freedom (larger df use the next lower entry)
+T_CRITICAL_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+    9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042,
+    40: 2.021, 60: 2.000, 120: 1.980
+}
+
+
+class ScalingAnalyzer:
+    """Empirical scaling of solver engines over a geometric range of sizes
+
+    Each engine solves `repeats` seeded instances of a workload family per
+    size. A least-squares fit of log(time) = log(c) + k log(n) over all
+    timings gives the empirical exponent k and constant c with 95%
+    confidence intervals, replacing the fixed n³ assumption; crossovers
+    are the sizes where two engines' fitted curves meet.
+    """
+
+    def __init__(self, engines: Optional[List[str]] = None, family: str = 'uniform',
+                 repeats: int = 3, seed: int = 0):
+        engines = list(engines or ENGINES)
+        unknown = [name for name in engines if name not in ENGINES]
+        if unknown:
+            raise ValueError(f"Unknown engines: {', '.join(unknown)}. Choose from: {', '.join(ENGINES)}")
+        self.engines = engines
+        self.family = family
+        self.repeats = max(int(repeats), 1)
+        self.seed = seed
+        self.generator = MatrixGenerator()
+
+    def estimate_seconds(self, sizes: List[int], estimate: Callable) -> float:
+        """Estimated total solve time of run(sizes), given estimate(n, engine, trace) per solve"""
+        return self.repeats * sum(estimate(n, ENGINES[name]['engine'], ENGINES[name]['trace'])
+                                  for n in sizes for name in self.engines)
+
+    def run(self, sizes: List[int], solve_context: Optional[Callable] = None) -> Dict[str, Any]:
+        """Time every engine at every size and fit its scaling
+
+        solve_context(n, engine, trace), when given, returns the context each
+        solve runs in (app.py passes admission control).
+        """
+        samples = {name: {} for name in self.engines}
+        for n in sizes:
+            for repeat in range(self.repeats):
+                # Every engine solves the same instances
+                matrix = self.generator.generate_workload(self.family, n, seed=self.seed + n * 1000 + repeat)
+                for name in self.engines:
+                    config = ENGINES[name]
+                    context = solve_context(n, config['engine'], config['trace']) if solve_context else nullcontext()
+                    with context:
+                        start = perf_counter()
+                        run_engine(name, matrix)
+                        samples[name].setdefault(n, []).append(perf_counter() - start)
+
+        engines = {}
+        for name, timings in samples.items():
+            engines[name] = {
+                'sizes': list(timings),
+                'median_seconds': [float(np.median(values)) for values in timings.values()],
+                'fit': fit_power_law(timings)
+            }
+
+        return {
+            'family': self.family,
+            'repeats': self.repeats,
+            'seed': self.seed,
+            'sizes': list(sizes),
+            'engines': engines,
+            'crossovers': find_crossovers(engines, sizes),
+            'fastest_by_size': _fastest_by_size(engines, sizes)
+        }
+
+
+def run_engine(name: str, matrix: np.ndarray) -> Dict[str, Any]:
+    """Solve with a registered engine, returning its assignment, cost and dual potentials"""
+    config = ENGINES[name]
+    if config.get('in_place'):
+        # The engine consumes its input, so it gets a buffer of its own and the caller's stays intact
+        hungarian = HungarianAlgorithm(np.array(matrix), record_steps=False, copy=False, overwrite_input=True)
+    else:
+        hungarian = HungarianAlgorithm(matrix, record_steps=config['record_steps'])
+    _, assignment, total_cost = hungarian.solve_with_steps()
+    return {
+        'assignment': assignment,
+        'total_cost': total_cost,
+        'row_potentials': hungarian.row_potentials,
+        'column_potentials': hungarian.column_potentials,
+        'iterations': hungarian.iterations
+    }
+
+
+def geometric_sizes(min_size: int, max_size: int, points: int) -> List[int]:
+    """Distinct integer sizes spaced geometrically from min_size to max_size"""
+    sizes = np.geomspace(max(min_size, 1), max(max_size, min_size, 1), max(points, 1))
+    return sorted(set(int(round(size)) for size in sizes))
+
+
+def fit_power_law(timings: Dict[int, List[float]]) -> Optional[Dict[str, Any]]:
+    """Fit time = constant * n ** exponent by least squares on log-log timings"""
+    pairs = [(n, t) for n, values in timings.items() for t in values if n > 0 and t > 0]
+    if len({n for n, _ in pairs}) < 2:
+        return None
+    x = np.log([n for n, _ in pairs])
+    y = np.log([t for _, t in pairs])
+    count = len(pairs)
+
+    x_mean = x.mean()
+    sxx = float(np.sum((x - x_mean) ** 2))
+    exponent = float(np.sum((x - x_mean) * (y - y.mean())) / sxx)
+    intercept = float(y.mean() - exponent * x_mean)
+    residuals = y - (intercept + exponent * x)
+    ss_residual = float(np.sum(residuals ** 2))
+    ss_total = float(np.sum((y - y.mean()) ** 2))
+
+    fit = {
+        'exponent': exponent,
+        'constant': math.exp(intercept),
+        'r_squared': 1 - ss_residual / ss_total if ss_total > 0 else 1.0,
+        'samples': count
+    }
+    if count > 2:
+        variance = ss_residual / (count - 2)
+        margin_exponent = t_critical_95(count - 2) * math.sqrt(variance / sxx)
+        margin_intercept = t_critical_95(count - 2) * math.sqrt(variance * (1 / count + x_mean ** 2 / sxx))
+        fit['exponent_ci'] = [exponent - margin_exponent, exponent + margin_exponent]
+        fit['constant_ci'] = [math.exp(intercept - margin_intercept), math.exp(intercept + margin_intercept)]
+    return fit
+
+
+def t_critical_95(degrees_of_freedom: int) -> float:
+    return T_CRITICAL_95[max(df for df in T_CRITICAL_95 if df <= max(degrees_of_freedom, 1))]
+
+
+def find_crossovers(engines: Dict[str, Dict[str, Any]], sizes: List[int]) -> List[Dict[str, Any]]:
+    """Sizes where two engines' fitted curves cross, with the faster engine on each side"""
+    crossovers = []
+    names = [name for name, result in engines.items() if result['fit'] is not None]
+    for i, first in enumerate(names):
+        for second in names[i + 1:]:
+            a, b = engines[first]['fit'], engines[second]['fit']
+            if a['exponent'] == b['exponent']:
+                continue
+            n = math.exp((math.log(b['constant']) - math.log(a['constant'])) / (a['exponent'] - b['exponent']))
+            steeper, flatter = (first, second) if a['exponent'] > b['exponent'] else (second, first)
+            crossovers.append({
+                'engines': [first, second],
+                'size': n,
+                'faster_below': steeper,
+                'faster_above': flatter,
+                'within_measured_range': min(sizes) <= n <= max(sizes)
+            })
+    return crossovers
+
+
+def _fastest_by_size(engines: Dict[str, Dict[str, Any]], sizes: List[int]) -> Dict[int, str]:
+    medians = {name: dict(zip(result['sizes'], result['median_seconds'])) for name, result in engines.items()}
+    return {n: min(medians, key=lambda name: medians[name][n]) for n in sorted(set(sizes))}
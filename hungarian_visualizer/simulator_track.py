@@ -0,0 +1,74 @@
+import numpy as np
+from typing import List, Dict, Any, Optional
+
+# Bumped when the frame layout changes, so cached payloads with an old track are not served
+SIMULATOR_TRACK_VERSION = 1
+
+
+def build_simulator_track(steps: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Bipartite simulator frames derived from a solver's recorded steps
+
+    Every frame points at the solver step whose matrix it shows ('step') and
+    carries compact index arrays, so the browser only renders and never
+    recomputes the algorithm:
+
+    - zeros: flat indices i * n + j of the zero-weight edges
+    - matching_rows / matching_cols: the matched edges, pairwise
+    - cover_rows / cover_cols: the minimum vertex cover (König lines)
+    - theta: the minimum uncovered value subtracted in an adjustment
+
+    One matching / adjustment pair is emitted for every round the solver ran.
+    """
+    if not steps:
+        return {'version': SIMULATOR_TRACK_VERSION, 'n': 0, 'rounds': 0, 'frames': []}
+
+    n = len(steps[0]['matrix'])
+    frames = []
+    rounds = 0
+    for index, step in enumerate(steps):
+        step_type = step['type']
+        if step_type == 'initial':
+            frames.append(_frame('construct_graph', index, step))
+        elif step_type in ('row_reduction', 'column_reduction'):
+            frames.append(_frame(step_type, index, step))
+        elif step_type == 'line_covering':
+            matching = step['matching']
+            frame_type = 'initial_matching' if rounds == 0 else 'repeat_matching'
+            frames.append(_frame(frame_type, index, step, matching=matching, round_number=rounds))
+            frames.append(_frame('check_matching', index, step, matching=matching,
+                                 perfect=len(matching) == n, round_number=rounds))
+        elif step_type == 'matrix_adjustment':
+            # Lines and theta are drawn on the matrix they were found in (the previous step)
+            frames.append(_frame('adjust_weights', index - 1, steps[index - 1],
+                                 matching=steps[index - 1].get('matching', []),
+                                 cover=(step['covered_rows'], step['covered_columns']),
+                                 theta=step['min_uncovered_value'], round_number=rounds))
+            rounds += 1
+        elif step_type == 'assignment_extraction':
+            frames.append(_frame('final_assignment', index, step, matching=step['assignment'],
+                                 perfect=len(step['assignment']) == n, round_number=rounds))
+
+    return {'version': SIMULATOR_TRACK_VERSION, 'n': n, 'rounds': rounds, 'frames': frames}
+
+
+def _frame(frame_type: str, step_index: int, step: Dict[str, Any], matching=(), cover=((), ()),
+           theta: Optional[float] = None, perfect: Optional[bool] = None,
+           round_number: Optional[int] = None) -> Dict[str, Any]:
+    matrix = np.asarray(step['matrix'])
+    pairs = np.asarray(matching, dtype=np.int64).reshape(-1, 2)
+    frame = {
+        'type': frame_type,
+        'step': step_index,
+        'zeros': np.flatnonzero(matrix == 0).tolist(),
+        'matching_rows': pairs[:, 0].tolist(),
+        'matching_cols': pairs[:, 1].tolist(),
+        'cover_rows': sorted(int(i) for i in cover[0]),
+        'cover_cols': sorted(int(j) for j in cover[1])
+    }
+    if theta is not None:
+        frame['theta'] = float(theta)
+    if perfect is not None:
+        frame['perfect'] = perfect
+    if round_number is not None:
+        frame['round'] = round_number
+    return frame
@@ -310,6 +310,83 @@ class AnalyticsDisplay {
         return metrics;
     }
     
+    async runScalingAnalysis() {
+        const button = document.getElementById('run-scaling');
+        const summary = document.getElementById('scaling-summary');
+        if (!button || !summary) return;
+        
+        button.disabled = true;
+        summary.textContent = 'Timing solver engines...';
+        try {
+            const response = await fetch('/api/scaling', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({})
+            });
+            const data = await response.json();
+            if (data.success) {
+                this.displayScaling(data);
+            } else {
+                summary.textContent = 'Scaling analysis failed: ' + data.error;
+            }
+        } catch (error) {
+            summary.textContent = 'Network error: ' + error.message;
+        } finally {
+            button.disabled = false;
+        }
+    }
+    
+    displayScaling(scaling) {
+        const colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12'];
+        const data = [];
+        Object.entries(scaling.engines).forEach(([name, result], k) => {
+            const color = colors[k % colors.length];
+            data.push({
+                x: result.sizes,
+                y: result.median_seconds.map(t => t * 1000),
+                type: 'scatter',
+                mode: 'markers',
+                name: `${name} (median)`,
+                marker: { color: color, size: 8 }
+            });
+            if (result.fit) {
+                data.push({
+                    x: result.sizes,
+                    y: result.sizes.map(n => result.fit.constant * Math.pow(n, result.fit.exponent) * 1000),
+                    type: 'scatter',
+                    mode: 'lines',
+                    name: `${name} fit`,
+                    line: { color: color, dash: 'dot' }
+                });
+            }
+        });
+        
+        const layout = {
+            xaxis: { title: 'Matrix size n', type: 'log' },
+            yaxis: { title: 'Time (ms)', type: 'log' },
+            height: 300,
+            margin: { t: 20, r: 20, b: 50, l: 60 },
+            showlegend: true
+        };
+        
+        if (window.Plotly) {
+            Plotly.newPlot('scaling-chart', data, layout, { responsive: true, displayModeBar: false });
+        }
+        
+        const lines = Object.entries(scaling.engines).map(([name, result]) => {
+            if (!result.fit) return `<p><strong>${name}</strong>: not enough sizes to fit</p>`;
+            const fit = result.fit;
+            const interval = fit.exponent_ci
+                ? ` (95% CI ${fit.exponent_ci[0].toFixed(2)}–${fit.exponent_ci[1].toFixed(2)})` : '';
+            return `<p><strong>${name}</strong>: time ≈ ${fit.constant.toExponential(2)} · n<sup>${fit.exponent.toFixed(2)}</sup>${interval}, R² ${fit.r_squared.toFixed(3)}</p>`;
+        });
+        scaling.crossovers.forEach(crossover => {
+            const where = crossover.within_measured_range ? '' : ' (extrapolated)';
+            lines.push(`<p>Crossover at n ≈ ${Math.round(crossover.size)}${where}: ${crossover.faster_below} faster below, ${crossover.faster_above} above</p>`);
+        });
+        document.getElementById('scaling-summary').innerHTML = lines.join('');
+    }
+    
     generateDetailedReport() {
         if (!this.currentAnalytics) return null;
         
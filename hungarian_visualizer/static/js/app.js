@@ -1,8 +1,62 @@
+// Packed binary trace format negotiated with /api/solve (see binary_trace.py)
+const TRACE_MIMETYPE = 'application/x-hungarian-trace';
+const TRACE_DTYPES = {
+    uint8: Uint8Array,
+    uint16: Uint16Array,
+    int32: Int32Array,
+    float32: Float32Array,
+    float64: Float64Array
+};
+
+function decodeBinaryTrace(buffer) {
+    const bytes = new Uint8Array(buffer);
+    const magic = String.fromCharCode(...bytes.subarray(0, 4));
+    if (magic !== 'HGTB') {
+        throw new Error('Invalid binary trace');
+    }
+    
+    const headerLength = new DataView(buffer).getUint32(4, true);
+    let offset = 8 + headerLength;
+    const data = JSON.parse(new TextDecoder().decode(bytes.subarray(8, offset)));
+    const trace = data.trace;
+    delete data.trace;
+    
+    const n = trace.n;
+    const cells = n * n;
+    const ArrayType = TRACE_DTYPES[trace.matrix_dtype];
+    const values = new ArrayType(buffer, offset, trace.num_steps * cells);
+    offset += trace.matrix_bytes;
+    const bitmaps = bytes.subarray(offset, offset + trace.num_steps * trace.bitmap_stride);
+    
+    data.steps.forEach((step, k) => {
+        const base = k * cells;
+        step.matrix = [];
+        for (let i = 0; i < n; i++) {
+            step.matrix.push(Array.from(values.subarray(base + i * n, base + (i + 1) * n)));
+        }
+        
+        const bitmap = bitmaps.subarray(k * trace.bitmap_stride, (k + 1) * trace.bitmap_stride);
+        step.zeros = [];
+        for (let cell = 0; cell < cells; cell++) {
+            if (bitmap[cell >> 3] & (1 << (cell & 7))) {
+                step.zeros.push([Math.floor(cell / n), cell % n]);
+            }
+        }
+    });
+    
+    return data;
+}
+
 // Main Application Controller
 class HungarianVisualizerApp {
     constructor() {
         this.currentMatrix = null;
         this.algorithmSteps = [];
+        this.runId = null;
+        this.stepsPaged = false;  // large traces are fetched page by page from the run store
+        this.stepPageSize = 0;
+        this.pendingPages = {};
+        this.simulatorTrack = null;  // bipartite simulator frames computed by the server
         this.currentStep = 0;
         this.isPlaying = false;
         this.playInterval = null;
@@ -53,6 +107,19 @@ class HungarianVisualizerApp {
             this.validateMatrix();
         });
         
+        // Reopen an archived run (.hgtrace) for replay
+        document.getElementById('import-trace').addEventListener('click', () => {
+            document.getElementById('import-trace-file').click();
+        });
+        
+        document.getElementById('import-trace-file').addEventListener('change', (e) => {
+            const file = e.target.files[0];
+            e.target.value = '';
+            if (file) {
+                this.importTrace(file);
+            }
+        });
+        
         // Step controls
         document.getElementById('first-step').addEventListener('click', () => {
             this.goToStep(0);
@@ -113,6 +180,11 @@ class HungarianVisualizerApp {
             this.visualization.toggleAnnotations(e.target.classList.contains('active'));
         });
         
+        // Scaling analysis
+        document.getElementById('run-scaling').addEventListener('click', () => {
+            this.analyticsDisplay.runScalingAnalysis();
+        });
+        
         // Random settings toggle
         document.getElementById('generate-random').addEventListener('click', () => {
             const settings = document.getElementById('random-settings');
@@ -288,61 +360,22 @@ class HungarianVisualizerApp {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
+                    'Accept': `${TRACE_MIMETYPE}, application/json;q=0.9`
                 },
                 body: JSON.stringify({ matrix: matrix })
             });
             
-            console.log('Response received, parsing JSON...');
-            const data = await response.json();
+            console.log('Response received, decoding...');
+            const data = await this.parseSolveResponse(response);
             console.log('Response data:', data);
             
             if (data.success) {
                 console.log('Algorithm solved successfully!');
-                this.algorithmSteps = data.steps;
-                this.analytics = data.analytics;
-                this.currentStep = 0;
-                
-                this.setupStepNavigation();
-                this.displayStep(0);
-                
-                // Display analytics with error handling
-                try {
-                    this.analyticsDisplay.displayAnalytics(data.analytics, data.charts);
-                } catch (error) {
-                    console.error('Analytics display error:', error);
-                }
+                await this.loadRun(data, matrix);
                 
                 // Get iteration count from analytics
                 const iterationCount = data.analytics.iterations_count || 0;
                 this.showMessage(`Algorithm solved! Total cost: ${data.total_cost} (${iterationCount} iterations)`, 'success');
-                
-                // Initialize bipartite simulator
-                try {
-                    console.log('Initializing bipartite simulator...');
-                    this.bipartiteSimulator.generateSimulatorSteps(matrix, data.steps);
-                    this.bipartiteSimulator.show();
-                    console.log('Bipartite simulator initialized successfully');
-                } catch (error) {
-                    console.error('Error initializing bipartite simulator:', error);
-                }
-                
-                // ALWAYS enable export buttons regardless of other errors
-                console.log('🔧 Enabling export buttons...');
-                this.enableExportButtons();
-                
-                // Multiple backup attempts
-                setTimeout(() => {
-                    console.log('🔧 Backup enable attempt 1...');
-                    this.enableExportButtons();
-                    this.forceEnableExportButtons();
-                }, 200);
-                
-                setTimeout(() => {
-                    console.log('🔧 Backup enable attempt 2...');
-                    this.forceEnableExportButtons();
-                    window.testEnableExports && window.testEnableExports();
-                }, 1000);
-                
             } else {
                 console.error('Algorithm solving failed:', data.error);
                 this.showMessage('Solving error: ' + data.error, 'error');
@@ -356,6 +389,119 @@ class HungarianVisualizerApp {
         }
     }
     
+    // Show a stored run: the solve response or an imported trace archive
+    async loadRun(data, matrix) {
+        this.runId = data.run_id || null;
+        this.stepsPaged = Boolean(data.steps_paged);
+        this.stepPageSize = data.steps.length;
+        this.pendingPages = {};
+        if (this.stepsPaged) {
+            // Only the first page was sent; fetch the final step for analytics
+            this.algorithmSteps = new Array(data.num_steps).fill(null);
+            data.steps.forEach((step, k) => { this.algorithmSteps[k] = step; });
+            await this.loadStepRange(data.num_steps - 1, data.num_steps);
+        } else {
+            this.algorithmSteps = data.steps;
+        }
+        this.analytics = data.analytics;
+        this.simulatorTrack = data.simulator || null;
+        this.currentStep = 0;
+        
+        this.setupStepNavigation();
+        this.displayStep(0);
+        
+        // Display analytics with error handling
+        try {
+            this.analyticsDisplay.displayAnalytics(data.analytics, data.charts);
+        } catch (error) {
+            console.error('Analytics display error:', error);
+        }
+        
+        // Initialize bipartite simulator
+        try {
+            console.log('Initializing bipartite simulator...');
+            this.bipartiteSimulator.generateSimulatorSteps(this.simulatorTrack, matrix);
+            this.bipartiteSimulator.show();
+            console.log('Bipartite simulator initialized successfully');
+        } catch (error) {
+            console.error('Error initializing bipartite simulator:', error);
+        }
+        
+        // ALWAYS enable export buttons regardless of other errors
+        console.log('🔧 Enabling export buttons...');
+        this.enableExportButtons();
+        
+        // Multiple backup attempts
+        setTimeout(() => {
+            console.log('🔧 Backup enable attempt 1...');
+            this.enableExportButtons();
+            this.forceEnableExportButtons();
+        }, 200);
+        
+        setTimeout(() => {
+            console.log('🔧 Backup enable attempt 2...');
+            this.forceEnableExportButtons();
+            window.testEnableExports && window.testEnableExports();
+        }, 1000);
+    }
+    
+    async importTrace(file) {
+        try {
+            this.showLoading(true);
+            const form = new FormData();
+            form.append('trace', file);
+            const response = await fetch('/api/runs/import', { method: 'POST', body: form });
+            const data = await response.json();
+            
+            if (data.success) {
+                // Replay from the archived original matrix
+                const matrix = data.steps.length ? data.steps[0].matrix : [];
+                this.currentMatrix = matrix;
+                await this.loadRun(data, matrix);
+                this.showMessage(`Trace opened: ${data.num_steps} steps, total cost ${data.total_cost}`, 'success');
+            } else {
+                this.showMessage('Import error: ' + data.error, 'error');
+            }
+        } catch (error) {
+            this.showMessage('Network error: ' + error.message, 'error');
+        } finally {
+            this.showLoading(false);
+        }
+    }
+    
+    async parseSolveResponse(response) {
+        const contentType = response.headers.get('Content-Type') || '';
+        if (!contentType.startsWith(TRACE_MIMETYPE)) {
+            return response.json();
+        }
+        return decodeBinaryTrace(await response.arrayBuffer());
+    }
+    
+    async loadStepRange(start, end) {
+        const key = `${start}:${end}`;
+        if (!this.pendingPages[key]) {
+            const steps = this.algorithmSteps;
+            this.pendingPages[key] = fetch(`/api/runs/${this.runId}/steps?from=${start}&to=${end}`, {
+                headers: { 'Accept': `${TRACE_MIMETYPE}, application/json;q=0.9` }
+            })
+                .then(response => this.parseSolveResponse(response))
+                .then(data => {
+                    if (!data.success) {
+                        throw new Error(data.error);
+                    }
+                    data.steps.forEach((step, k) => { steps[data.from + k] = step; });
+                })
+                .catch(error => this.showMessage('Error loading steps: ' + error.message, 'error'))
+                .finally(() => { delete this.pendingPages[key]; });
+        }
+        return this.pendingPages[key];
+    }
+    
+    loadStepPage(stepIndex) {
+        const start = stepIndex - (stepIndex % this.stepPageSize);
+        return this.loadStepRange(start, Math.min(start + this.stepPageSize, this.algorithmSteps.length));
+    }
+    
     setupStepNavigation() {
         document.getElementById('step-controls-panel').style.display = 'block';
         document.getElementById('analytics-panel').style.display = 'block';
@@ -367,6 +513,17 @@ class HungarianVisualizerApp {
     displayStep(stepIndex) {
         if (stepIndex < 0 || stepIndex >= this.algorithmSteps.length) return;
         
+        if (!this.algorithmSteps[stepIndex]) {
+            // Page not loaded yet: fetch it, then display if it arrived
+            const steps = this.algorithmSteps;
+            this.loadStepPage(stepIndex).then(() => {
+                if (steps === this.algorithmSteps && steps[stepIndex]) {
+                    this.displayStep(stepIndex);
+                }
+            });
+            return;
+        }
+        
         this.currentStep = stepIndex;
         const step = this.algorithmSteps[stepIndex];
         
@@ -537,7 +694,8 @@ Doubly covered: C'[i,j] = C[i,j] + θ`;
         const exportButtons = [
             document.getElementById('export-json'),
             document.getElementById('export-csv'),
-            document.getElementById('export-pdf')
+            document.getElementById('export-pdf'),
+            document.getElementById('export-trace')
         ];
         
         console.log('Found export buttons:', exportButtons.map(btn => btn ? btn.id : 'null'));
@@ -587,7 +745,7 @@ Doubly covered: C'[i,j] = C[i,j] + θ`;
         
         // Try multiple selectors to find the buttons
         const selectors = [
-            '#export-json', '#export-csv', '#export-pdf',
+            '#export-json', '#export-csv', '#export-pdf', '#export-trace',
             'button[id*="export"]', '.btn[id*="export"]',
             'button:contains("JSON")', 'button:contains("CSV")', 'button:contains("PDF")'
         ];
@@ -654,7 +812,8 @@ Doubly covered: C'[i,j] = C[i,j] + θ`;
         const exportButtons = [
             document.getElementById('export-json'),
             document.getElementById('export-csv'),
-            document.getElementById('export-pdf')
+            document.getElementById('export-pdf'),
+            document.getElementById('export-trace')
         ];
         
         console.log('Export buttons found for disabling:', exportButtons.map(btn => btn ? btn.id : 'null'));
@@ -681,7 +840,8 @@ Doubly covered: C'[i,j] = C[i,j] + θ`;
     }
     
     getAlgorithmSteps() {
-        return this.algorithmSteps;
+        // Paged runs expose only the steps loaded so far
+        return this.stepsPaged ? this.algorithmSteps.filter(step => step) : this.algorithmSteps;
     }
     
     getCurrentStep() {
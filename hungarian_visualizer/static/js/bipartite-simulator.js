@@ -137,315 +137,128 @@ class BipartiteSimulator {
         }
     }
     
-    generateSimulatorSteps(matrix, algorithmSteps) {
-        console.log('Generating simulator steps from algorithm steps...');
+    generateSimulatorSteps(track, matrix) {
+        // Frames come from the Python solver (see simulator_track.py); nothing is recomputed here
+        console.log('Building simulator steps from the server track...');
         this.simulatorSteps = [];
         this.currentSimulatorStep = 0;
         
-        const n = matrix.length;
-        
-        // Step 1: Construct Bipartite Graph
-        this.simulatorSteps.push({
-            stepNumber: 1,
-            title: 'Step 1: Construct the Bipartite Graph',
-            description: 'Create two disjoint sets of nodes (workers and tasks) and connect them with weighted edges.',
-            type: 'construct_graph',
-            matrix: JSON.parse(JSON.stringify(matrix)),
-            highlightedEdges: [],
-            highlightedNodes: { left: [], right: [] },
-            matchingEdges: [],
-            coveredLines: { rows: [], cols: [] },
-            details: `
-                <p><strong>Left Set (U):</strong> ${n} agents/workers</p>
-                <p><strong>Right Set (V):</strong> ${n} tasks/jobs</p>
-                <p><strong>Edges:</strong> ${n * n} complete weighted edges</p>
-                <p><strong>Graph Type:</strong> Complete weighted bipartite graph K_{${n},${n}}</p>
-            `
-        });
-        
-        // Step 2: Row and Column Reduction
-        let reducedMatrix = JSON.parse(JSON.stringify(matrix));
-        
-        // Row reduction
-        for (let i = 0; i < n; i++) {
-            const minVal = Math.min(...reducedMatrix[i]);
-            for (let j = 0; j < n; j++) {
-                reducedMatrix[i][j] -= minVal;
-            }
-        }
-        
-        this.simulatorSteps.push({
-            stepNumber: 2,
-            title: 'Step 2a: Row Reduction',
-            description: 'Subtract the minimum edge weight in each row (for each worker).',
-            type: 'row_reduction',
-            matrix: JSON.parse(JSON.stringify(reducedMatrix)),
-            highlightedEdges: this.findZeroEdges(reducedMatrix),
-            highlightedNodes: { left: [], right: [] },
-            matchingEdges: [],
-            coveredLines: { rows: [], cols: [] },
-            details: `
-                <p><strong>Operation:</strong> For each row i, subtract min(row_i) from all elements</p>
-                <p><strong>Result:</strong> At least one zero in each row</p>
-                <p><strong>Zero Edges Created:</strong> ${this.findZeroEdges(reducedMatrix).length}</p>
-            `
-        });
-        
-        // Column reduction
-        for (let j = 0; j < n; j++) {
-            const minVal = Math.min(...reducedMatrix.map(row => row[j]));
-            for (let i = 0; i < n; i++) {
-                reducedMatrix[i][j] -= minVal;
-            }
+        if (!track || !track.frames) {
+            throw new Error('response has no simulator track');
         }
         
-        this.simulatorSteps.push({
-            stepNumber: 2,
-            title: 'Step 2b: Column Reduction',
-            description: 'Subtract the minimum edge weight in each column (for each job).',
-            type: 'column_reduction',
-            matrix: JSON.parse(JSON.stringify(reducedMatrix)),
-            highlightedEdges: this.findZeroEdges(reducedMatrix),
-            highlightedNodes: { left: [], right: [] },
-            matchingEdges: [],
-            coveredLines: { rows: [], cols: [] },
-            details: `
-                <p><strong>Operation:</strong> For each column j, subtract min(col_j) from all elements</p>
-                <p><strong>Result:</strong> At least one zero in each row and column</p>
-                <p><strong>Total Zero Edges:</strong> ${this.findZeroEdges(reducedMatrix).length}</p>
-            `
-        });
-        
-        // Step 3: Find Initial Matching
-        const initialMatching = this.findMaximalMatching(reducedMatrix);
-        
-        this.simulatorSteps.push({
-            stepNumber: 3,
-            title: 'Step 3: Find Initial Matching Using Zero-Weight Edges',
-            description: 'Identify edges with zero weight and find maximum matching among them.',
-            type: 'initial_matching',
-            matrix: JSON.parse(JSON.stringify(reducedMatrix)),
-            highlightedEdges: this.findZeroEdges(reducedMatrix),
-            highlightedNodes: { left: [], right: [] },
-            matchingEdges: initialMatching,
-            coveredLines: { rows: [], cols: [] },
-            details: `
-                <p><strong>Zero-Weight Edges:</strong> ${this.findZeroEdges(reducedMatrix).length}</p>
-                <p><strong>Maximum Matching Found:</strong> ${initialMatching.length}</p>
-                <p><strong>Nodes Matched:</strong> ${initialMatching.length} / ${n}</p>
-                <p><strong>Perfect Matching:</strong> ${initialMatching.length === n ? '✅ YES' : '❌ NO'}</p>
-            `
-        });
-        
-        // Step 4: Check for Perfect Matching
-        const isPerfectMatching = initialMatching.length === n;
-        
-        this.simulatorSteps.push({
-            stepNumber: 4,
-            title: 'Step 4: Check for Perfect Matching',
-            description: isPerfectMatching ? 'Perfect matching found! Optimal solution achieved.' : 'Perfect matching not found. Continue to adjustment step.',
-            type: 'check_matching',
-            matrix: JSON.parse(JSON.stringify(reducedMatrix)),
-            highlightedEdges: this.findZeroEdges(reducedMatrix),
-            highlightedNodes: { left: [], right: [] },
-            matchingEdges: initialMatching,
-            coveredLines: { rows: [], cols: [] },
-            details: `
-                <p><strong>Matching Size:</strong> ${initialMatching.length}</p>
-                <p><strong>Required for Perfect Matching:</strong> ${n}</p>
-                <p><strong>Status:</strong> ${isPerfectMatching ? '✅ OPTIMAL SOLUTION FOUND' : '⏳ Need to adjust weights'}</p>
-            `
-        });
-        
-        // If not perfect matching, show adjustment steps
-        if (!isPerfectMatching) {
-            // Step 5: Find Vertex Cover and Adjust Weights
-            const vertexCover = this.findVertexCover(reducedMatrix, initialMatching);
-            const uncoveredMin = this.findUncoveredMinimum(reducedMatrix, vertexCover);
-            
-            this.simulatorSteps.push({
-                stepNumber: 5,
-                title: 'Step 5: Adjust Edge Weights (Relabeling)',
-                description: 'Draw minimum vertex-covering lines and adjust weights to create new zero-weight edges.',
-                type: 'adjust_weights',
-                matrix: JSON.parse(JSON.stringify(reducedMatrix)),
-                highlightedEdges: this.findZeroEdges(reducedMatrix),
-                highlightedNodes: { left: [], right: [] },
-                matchingEdges: initialMatching,
-                coveredLines: vertexCover,
-                uncoveredMin: uncoveredMin,
-                details: `
-                    <p><strong>Covered Rows:</strong> ${vertexCover.rows.length}</p>
-                    <p><strong>Covered Columns:</strong> ${vertexCover.cols.length}</p>
-                    <p><strong>Total Lines:</strong> ${vertexCover.rows.length + vertexCover.cols.length}</p>
-                    <p><strong>Minimum Uncovered Value (δ):</strong> ${uncoveredMin}</p>
-                    <p><strong>Weight Adjustment:</strong> Subtract δ from uncovered, add δ to doubly covered</p>
-                `
-            });
-            
-            // Apply weight adjustment
-            let adjustedMatrix = JSON.parse(JSON.stringify(reducedMatrix));
-            for (let i = 0; i < n; i++) {
-                for (let j = 0; j < n; j++) {
-                    const rowCovered = vertexCover.rows.includes(i);
-                    const colCovered = vertexCover.cols.includes(j);
-                    
-                    if (!rowCovered && !colCovered) {
-                        adjustedMatrix[i][j] -= uncoveredMin;
-                    } else if (rowCovered && colCovered) {
-                        adjustedMatrix[i][j] += uncoveredMin;
-                    }
-                }
-            }
-            
-            this.simulatorSteps.push({
-                stepNumber: 6,
-                title: 'Step 6: Repeat Matching Search',
-                description: 'Search for maximum matching with updated weights.',
-                type: 'repeat_matching',
-                matrix: JSON.parse(JSON.stringify(adjustedMatrix)),
-                highlightedEdges: this.findZeroEdges(adjustedMatrix),
-                highlightedNodes: { left: [], right: [] },
-                matchingEdges: this.findMaximalMatching(adjustedMatrix),
-                coveredLines: { rows: [], cols: [] },
-                details: `
-                    <p><strong>New Zero-Weight Edges:</strong> ${this.findZeroEdges(adjustedMatrix).length}</p>
-                    <p><strong>New Matching Size:</strong> ${this.findMaximalMatching(adjustedMatrix).length}</p>
-                    <p><strong>Progress:</strong> Improved matching found</p>
-                `
-            });
+        const n = track.n;
+        for (const frame of track.frames) {
+            const matchingEdges = frame.matching_rows.map((row, k) => [row, frame.matching_cols[k]]);
+            const step = {
+                stepNumber: this.simulatorSteps.length + 1,
+                type: frame.type,
+                algorithmStep: frame.step,
+                zeroEdges: new Set(frame.zeros),
+                matchingEdges: matchingEdges,
+                matchedCells: new Set(matchingEdges.map(([i, j]) => i * n + j)),
+                coveredLines: { rows: frame.cover_rows, cols: frame.cover_cols },
+                uncoveredMin: frame.theta === undefined ? null : frame.theta
+            };
+            Object.assign(step, this.describeFrame(frame, step, n, track.rounds, matrix));
+            this.simulatorSteps.push(step);
         }
         
-        // Step 7: Extract Optimal Assignment
-        const finalMatching = isPerfectMatching ? initialMatching : this.findMaximalMatching(reducedMatrix);
-        const totalCost = this.calculateMatchingCost(finalMatching, matrix);
-        
-        this.simulatorSteps.push({
-            stepNumber: 7,
-            title: 'Step 7: Extract Minimum-Cost Perfect Matching',
-            description: 'The chosen zero-weight edges form the optimal assignment.',
-            type: 'final_assignment',
-            matrix: JSON.parse(JSON.stringify(reducedMatrix)),
-            highlightedEdges: this.findZeroEdges(reducedMatrix),
-            highlightedNodes: { left: [], right: [] },
-            matchingEdges: finalMatching,
-            coveredLines: { rows: [], cols: [] },
-            details: `
-                <p><strong>Optimal Assignment:</strong></p>
-                <ul>
-                    ${finalMatching.map((edge, idx) => `<li>Worker ${edge[0]} → Task ${edge[1]} (Cost: ${matrix[edge[0]][edge[1]]})</li>`).join('')}
-                </ul>
-                <p><strong>Total Minimum Cost:</strong> ${totalCost}</p>
-            `
-        });
-        
         console.log(`Generated ${this.simulatorSteps.length} simulator steps`);
         this.setupSimulatorStepNavigation();
         this.displaySimulatorStep(0);
     }
     
-    findZeroEdges(matrix) {
-        const edges = [];
-        for (let i = 0; i < matrix.length; i++) {
-            for (let j = 0; j < matrix[i].length; j++) {
-                if (matrix[i][j] === 0) {
-                    edges.push([i, j]);
-                }
-            }
-        }
-        return edges;
-    }
-    
-    findMaximalMatching(matrix) {
-        const n = matrix.length;
-        const matching = [];
-        const usedRows = new Set();
-        const usedCols = new Set();
-        
-        // Find all zero edges
-        const zeroEdges = this.findZeroEdges(matrix);
-        
-        // Greedy matching
-        for (const [i, j] of zeroEdges) {
-            if (!usedRows.has(i) && !usedCols.has(j)) {
-                matching.push([i, j]);
-                usedRows.add(i);
-                usedCols.add(j);
-            }
-        }
-        
-        return matching;
-    }
-    
-    findVertexCover(matrix, matching) {
-        const n = matrix.length;
-        const matchedRows = new Set(matching.map(e => e[0]));
-        const matchedCols = new Set(matching.map(e => e[1]));
-        
-        const unmatchedRows = [];
-        for (let i = 0; i < n; i++) {
-            if (!matchedRows.has(i)) {
-                unmatchedRows.push(i);
-            }
-        }
-        
-        // Find reachable rows and columns
-        const reachableRows = new Set(unmatchedRows);
-        const reachableColumns = new Set();
-        
-        let changed = true;
-        while (changed) {
-            changed = false;
-            
-            // From reachable rows, find reachable columns via zeros
-            for (const i of reachableRows) {
-                for (let j = 0; j < n; j++) {
-                    if (matrix[i][j] === 0 && !reachableColumns.has(j)) {
-                        reachableColumns.add(j);
-                        changed = true;
-                    }
-                }
-            }
-            
-            // From reachable columns, find reachable rows via matching
-            for (const [i, j] of matching) {
-                if (reachableColumns.has(j) && !reachableRows.has(i)) {
-                    reachableRows.add(i);
-                    changed = true;
-                }
-            }
-        }
-        
-        // Vertex cover: non-reachable rows + reachable columns
-        const coveredRows = [];
-        for (let i = 0; i < n; i++) {
-            if (!reachableRows.has(i)) {
-                coveredRows.push(i);
-            }
-        }
-        
-        return {
-            rows: coveredRows,
-            cols: Array.from(reachableColumns)
-        };
-    }
-    
-    findUncoveredMinimum(matrix, vertexCover) {
-        let minVal = Infinity;
-        const n = matrix.length;
-        
-        for (let i = 0; i < n; i++) {
-            for (let j = 0; j < n; j++) {
-                const rowCovered = vertexCover.rows.includes(i);
-                const colCovered = vertexCover.cols.includes(j);
-                
-                if (!rowCovered && !colCovered) {
-                    minVal = Math.min(minVal, matrix[i][j]);
-                }
-            }
+    describeFrame(frame, step, n, rounds, matrix) {
+        const zeroCount = frame.zeros.length;
+        const matched = step.matchingEdges.length;
+        const round = frame.round === undefined ? '' : ` (Round ${frame.round + 1})`;
+        
+        switch (frame.type) {
+            case 'construct_graph':
+                return {
+                    title: 'Step 1: Construct the Bipartite Graph',
+                    description: 'Create two disjoint sets of nodes (workers and tasks) and connect them with weighted edges.',
+                    details: `
+                        <p><strong>Left Set (U):</strong> ${n} agents/workers</p>
+                        <p><strong>Right Set (V):</strong> ${n} tasks/jobs</p>
+                        <p><strong>Edges:</strong> ${n * n} complete weighted edges</p>
+                        <p><strong>Graph Type:</strong> Complete weighted bipartite graph K_{${n},${n}}</p>
+                    `
+                };
+            case 'row_reduction':
+                return {
+                    title: 'Step 2a: Row Reduction',
+                    description: 'Subtract the minimum edge weight in each row (for each worker).',
+                    details: `
+                        <p><strong>Operation:</strong> For each row i, subtract min(row_i) from all elements</p>
+                        <p><strong>Result:</strong> At least one zero in each row</p>
+                        <p><strong>Zero Edges Created:</strong> ${zeroCount}</p>
+                    `
+                };
+            case 'column_reduction':
+                return {
+                    title: 'Step 2b: Column Reduction',
+                    description: 'Subtract the minimum edge weight in each column (for each job).',
+                    details: `
+                        <p><strong>Operation:</strong> For each column j, subtract min(col_j) from all elements</p>
+                        <p><strong>Result:</strong> At least one zero in each row and column</p>
+                        <p><strong>Total Zero Edges:</strong> ${zeroCount}</p>
+                    `
+                };
+            case 'initial_matching':
+            case 'repeat_matching':
+                return {
+                    title: frame.type === 'initial_matching'
+                        ? 'Step 3: Find Initial Matching Using Zero-Weight Edges'
+                        : `Step 6: Repeat Matching Search${round}`,
+                    description: frame.type === 'initial_matching'
+                        ? 'Identify edges with zero weight and find maximum matching among them.'
+                        : 'Search for maximum matching with updated weights.',
+                    details: `
+                        <p><strong>Zero-Weight Edges:</strong> ${zeroCount}</p>
+                        <p><strong>Maximum Matching Found:</strong> ${matched}</p>
+                        <p><strong>Nodes Matched:</strong> ${matched} / ${n}</p>
+                        <p><strong>Perfect Matching:</strong> ${matched === n ? '✅ YES' : '❌ NO'}</p>
+                    `
+                };
+            case 'check_matching':
+                return {
+                    title: `Step 4: Check for Perfect Matching${round}`,
+                    description: frame.perfect ? 'Perfect matching found! Optimal solution achieved.' : 'Perfect matching not found. Continue to adjustment step.',
+                    details: `
+                        <p><strong>Matching Size:</strong> ${matched}</p>
+                        <p><strong>Required for Perfect Matching:</strong> ${n}</p>
+                        <p><strong>Status:</strong> ${frame.perfect ? '✅ OPTIMAL SOLUTION FOUND' : '⏳ Need to adjust weights'}</p>
+                    `
+                };
+            case 'adjust_weights':
+                return {
+                    title: `Step 5: Adjust Edge Weights (Relabeling)${round}`,
+                    description: 'Draw minimum vertex-covering lines and adjust weights to create new zero-weight edges.',
+                    details: `
+                        <p><strong>Covered Rows:</strong> ${frame.cover_rows.length}</p>
+                        <p><strong>Covered Columns:</strong> ${frame.cover_cols.length}</p>
+                        <p><strong>Total Lines:</strong> ${frame.cover_rows.length + frame.cover_cols.length}</p>
+                        <p><strong>Minimum Uncovered Value (δ):</strong> ${frame.theta}</p>
+                        <p><strong>Weight Adjustment:</strong> Subtract δ from uncovered, add δ to doubly covered</p>
+                    `
+                };
+            case 'final_assignment':
+                return {
+                    title: 'Step 7: Extract Minimum-Cost Perfect Matching',
+                    description: `The chosen zero-weight edges form the optimal assignment (${rounds} adjustment round${rounds === 1 ? '' : 's'}).`,
+                    details: `
+                        <p><strong>Optimal Assignment:</strong></p>
+                        <ul>
+                            ${step.matchingEdges.map(edge => `<li>Worker ${edge[0]} → Task ${edge[1]} (Cost: ${matrix[edge[0]][edge[1]]})</li>`).join('')}
+                        </ul>
+                        <p><strong>Total Minimum Cost:</strong> ${this.calculateMatchingCost(step.matchingEdges, matrix)}</p>
+                    `
+                };
+            default:
+                return { title: frame.type, description: '', details: '' };
         }
-        
-        return minVal === Infinity ? 0 : minVal;
     }
     
     calculateMatchingCost(matching, originalMatrix) {
@@ -464,11 +277,23 @@ class BipartiteSimulator {
     displaySimulatorStep(stepIndex) {
         if (stepIndex < 0 || stepIndex >= this.simulatorSteps.length) return;
         
-        this.currentSimulatorStep = stepIndex;
         const step = this.simulatorSteps[stepIndex];
+        const algorithmStep = this.app.algorithmSteps[step.algorithmStep];
+        if (!algorithmStep) {
+            // Edge weights come from the solver step, which may sit on a page not loaded yet
+            const steps = this.app.algorithmSteps;
+            this.app.loadStepPage(step.algorithmStep).then(() => {
+                if (steps === this.app.algorithmSteps && steps[step.algorithmStep]) {
+                    this.displaySimulatorStep(stepIndex);
+                }
+            });
+            return;
+        }
+        
+        this.currentSimulatorStep = stepIndex;
         
         // Update canvas
-        this.drawBipartiteGraph(step);
+        this.drawBipartiteGraph(step, algorithmStep.matrix);
         
         // Update explanation
         this.displaySimulatorStepExplanation(step);
@@ -483,7 +308,7 @@ class BipartiteSimulator {
         document.getElementById('sim-step-details').innerHTML = step.details;
     }
     
-    drawBipartiteGraph(step) {
+    drawBipartiteGraph(step, matrix) {
         const canvas = document.getElementById('bipartite-canvas');
         if (!canvas) {
             console.error('Canvas not found');
@@ -493,7 +318,7 @@ class BipartiteSimulator {
         const ctx = canvas.getContext('2d');
         const width = canvas.width;
         const height = canvas.height;
-        const n = step.matrix.length;
+        const n = matrix.length;
         
         // Clear canvas
         ctx.fillStyle = '#f8f9fa';
@@ -524,9 +349,8 @@ class BipartiteSimulator {
         // Draw edges
         for (let i = 0; i < n; i++) {
             for (let j = 0; j < n; j++) {
-                const isZeroEdge = step.matrix[i][j] === 0;
-                const isMatchingEdge = step.matchingEdges.some(e => e[0] === i && e[1] === j);
-                const isHighlighted = step.highlightedEdges.some(e => e[0] === i && e[1] === j);
+                const isZeroEdge = step.zeroEdges.has(i * n + j);
+                const isMatchingEdge = step.matchedCells.has(i * n + j);
                 
                 ctx.beginPath();
                 ctx.moveTo(leftNodes[i].x, leftNodes[i].y);
@@ -554,7 +378,7 @@ class BipartiteSimulator {
                 ctx.textAlign = 'center';
                 ctx.textBaseline = 'middle';
                 
-                const weight = step.matrix[i][j];
+                const weight = matrix[i][j];
                 ctx.fillText(weight, midX, midY);
             }
         }
@@ -713,9 +537,8 @@ class BipartiteSimulator {
     }
     
     refreshSimulator() {
-        if (this.app.algorithmSteps.length > 0) {
-            this.generateSimulatorSteps(this.app.currentMatrix, this.app.algorithmSteps);
-            this.displaySimulatorStep(0);
+        if (this.app.simulatorTrack) {
+            this.generateSimulatorSteps(this.app.simulatorTrack, this.app.currentMatrix);
         }
     }
     
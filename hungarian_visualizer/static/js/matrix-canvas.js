@@ -0,0 +1,396 @@
+// Canvas Matrix View
+// Large matrices are drawn on one canvas instead of one DOM node per cell.
+// Only the tiles covering the visible viewport are requested and drawn; when
+// zoomed out, each drawn cell stands for a block x block square of the matrix
+// (its minimum, so zeros stay visible), as served by /api/runs/<id>/tiles.
+
+// Matrices larger than this are shown in the canvas view
+const CANVAS_VIEW_THRESHOLD = 24;
+const CANVAS_TILE_CELLS = 64;       // tile edge, in drawn cells
+const CANVAS_MIN_BLOCK_PX = 4;      // zoomed out further, cells are aggregated into blocks
+const CANVAS_TEXT_MIN_PX = 28;      // values are written in cells at least this large
+const CANVAS_MAX_TILES = 256;       // tiles kept per view
+
+// Tiles of a stored run's step matrix, block-aggregated by the server
+class ServerTileSource {
+    constructor(runId, stepIndex) {
+        this.runId = runId;
+        this.stepIndex = stepIndex;
+        this.key = `run:${runId}:${stepIndex}`;
+    }
+
+    fetchTile(row, col, rows, cols, block) {
+        const query = `step=${this.stepIndex}&row=${row}&col=${col}&rows=${rows}&cols=${cols}&block=${block}`;
+        return fetch(`/api/runs/${this.runId}/tiles?${query}`)
+            .then(response => response.json())
+            .then(data => {
+                if (!data.success) {
+                    throw new Error(data.error);
+                }
+                return data;
+            });
+    }
+}
+
+// Tiles of a matrix held by the page, aggregated the same way as the server
+class LocalTileSource {
+    constructor(matrix, key = 'local') {
+        this.matrix = matrix;
+        this.key = key;
+    }
+
+    fetchTile(row, col, rows, cols, block) {
+        const n = this.matrix.length;
+        const rowEnd = Math.min(row + rows, n);
+        const colEnd = Math.min(col + cols, n);
+        const values = [];
+        const zeros = [];
+        for (let i = row; i < rowEnd; i += block) {
+            const valueRow = [];
+            const zeroRow = [];
+            for (let j = col; j < colEnd; j += block) {
+                let minimum = Infinity;
+                let zeroCount = 0;
+                for (let bi = i; bi < Math.min(i + block, rowEnd); bi++) {
+                    const source = this.matrix[bi];
+                    for (let bj = j; bj < Math.min(j + block, colEnd); bj++) {
+                        const value = source[bj];
+                        if (value < minimum) minimum = value;
+                        if (value === 0) zeroCount++;
+                    }
+                }
+                valueRow.push(minimum);
+                zeroRow.push(zeroCount);
+            }
+            values.push(valueRow);
+            zeros.push(zeroRow);
+        }
+        return Promise.resolve({ row, col, rows: rowEnd - row, cols: colEnd - col, block, values, zeros });
+    }
+}
+
+class MatrixCanvasView {
+    constructor(container, n, options = {}) {
+        this.n = n;
+        this.cellSize = options.cellSize || 32;
+        this.onCellClick = options.onCellClick || null;
+        this.source = null;
+        this.step = null;
+        this.tiles = new Map();    // key -> tile data, or null while loading
+        this.maxValue = 1;         // largest value seen, for the colour scale
+        this.frameRequested = false;
+
+        this.viewport = document.createElement('div');
+        this.viewport.className = 'matrix-canvas-viewport';
+        this.spacer = document.createElement('div');
+        this.spacer.className = 'matrix-canvas-spacer';
+        this.canvas = document.createElement('canvas');
+        this.canvas.className = 'matrix-canvas';
+        this.context = this.canvas.getContext('2d');
+        this.viewport.appendChild(this.spacer);
+        this.viewport.appendChild(this.canvas);
+
+        this.toolbar = this.createToolbar();
+        container.appendChild(this.toolbar);
+        container.appendChild(this.viewport);
+
+        this.viewport.addEventListener('scroll', () => this.requestDraw());
+        this.viewport.addEventListener('wheel', (e) => {
+            if (!e.ctrlKey) return;
+            e.preventDefault();
+            this.zoom(e.deltaY < 0 ? 2 : 0.5);
+        }, { passive: false });
+        this.canvas.addEventListener('mousemove', (e) => this.updateTooltip(e));
+        this.canvas.addEventListener('click', (e) => {
+            const cell = this.cellAt(e);
+            if (cell && this.onCellClick && this.blockSize() === 1) {
+                this.onCellClick(cell.row, cell.col, cell.x, cell.y);
+            }
+        });
+        window.addEventListener('resize', () => this.requestDraw());
+
+        this.updateSpacer();
+    }
+
+    createToolbar() {
+        const toolbar = document.createElement('div');
+        toolbar.className = 'matrix-canvas-toolbar';
+
+        const zoomOut = document.createElement('button');
+        zoomOut.className = 'btn btn-sm btn-outline';
+        zoomOut.textContent = '−';
+        zoomOut.title = 'Zoom out (Ctrl + wheel)';
+        zoomOut.addEventListener('click', () => this.zoom(0.5));
+
+        const zoomIn = document.createElement('button');
+        zoomIn.className = 'btn btn-sm btn-outline';
+        zoomIn.textContent = '+';
+        zoomIn.title = 'Zoom in (Ctrl + wheel)';
+        zoomIn.addEventListener('click', () => this.zoom(2));
+
+        const fit = document.createElement('button');
+        fit.className = 'btn btn-sm btn-outline';
+        fit.textContent = 'Fit';
+        fit.addEventListener('click', () => this.fit());
+
+        this.scaleLabel = document.createElement('span');
+        this.scaleLabel.className = 'matrix-canvas-scale';
+
+        toolbar.append(zoomOut, zoomIn, fit, this.scaleLabel);
+        return toolbar;
+    }
+
+    // Switch to another matrix (e.g. the next step); scroll and zoom are kept
+    setSource(source, step = null) {
+        if (!this.source || source.key !== this.source.key) {
+            this.tiles.clear();
+            this.maxValue = 1;
+        }
+        this.source = source;
+        this.step = step;
+        this.requestDraw();
+    }
+
+    // Drop cached tiles after the underlying matrix changed
+    invalidate() {
+        this.tiles.clear();
+        this.requestDraw();
+    }
+
+    zoom(factor) {
+        const size = Math.min(64, Math.max(1 / 64, this.cellSize * factor));
+        if (size === this.cellSize) return;
+
+        // Keep the centre of the viewport in place
+        const centerRow = (this.viewport.scrollTop + this.viewport.clientHeight / 2) / this.cellSize;
+        const centerCol = (this.viewport.scrollLeft + this.viewport.clientWidth / 2) / this.cellSize;
+        this.cellSize = size;
+        this.updateSpacer();
+        this.viewport.scrollTop = centerRow * size - this.viewport.clientHeight / 2;
+        this.viewport.scrollLeft = centerCol * size - this.viewport.clientWidth / 2;
+        this.requestDraw();
+    }
+
+    fit() {
+        const extent = Math.min(this.viewport.clientWidth, this.viewport.clientHeight) || 480;
+        this.cellSize = Math.pow(2, Math.floor(Math.log2(extent / this.n)));
+        this.updateSpacer();
+        this.requestDraw();
+    }
+
+    updateSpacer() {
+        const extent = `${Math.ceil(this.n * this.cellSize)}px`;
+        this.spacer.style.width = extent;
+        this.spacer.style.height = extent;
+        const block = this.blockSize();
+        this.scaleLabel.textContent = block > 1 ? `${block}×${block} blocks (minimum)` : '';
+    }
+
+    // Matrix cells per drawn cell at the current zoom
+    blockSize() {
+        return Math.max(1, Math.ceil(CANVAS_MIN_BLOCK_PX / this.cellSize));
+    }
+
+    requestDraw() {
+        if (this.frameRequested) return;
+        this.frameRequested = true;
+        requestAnimationFrame(() => {
+            this.frameRequested = false;
+            this.draw();
+        });
+    }
+
+    draw() {
+        if (!this.source) return;
+
+        const width = this.viewport.clientWidth;
+        const height = this.viewport.clientHeight;
+        const ratio = window.devicePixelRatio || 1;
+        if (this.canvas.width !== width * ratio || this.canvas.height !== height * ratio) {
+            this.canvas.width = width * ratio;
+            this.canvas.height = height * ratio;
+            this.canvas.style.width = `${width}px`;
+            this.canvas.style.height = `${height}px`;
+        }
+
+        // The canvas covers the viewport and follows the scroll position
+        const scrollTop = this.viewport.scrollTop;
+        const scrollLeft = this.viewport.scrollLeft;
+        this.canvas.style.transform = `translate(${scrollLeft}px, ${scrollTop}px)`;
+
+        const ctx = this.context;
+        ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+        ctx.clearRect(0, 0, width, height);
+        ctx.translate(-scrollLeft, -scrollTop);
+
+        const block = this.blockSize();
+        const span = CANVAS_TILE_CELLS * block;  // matrix cells per tile edge
+        const firstRow = Math.floor(scrollTop / this.cellSize / span);
+        const lastRow = Math.min(Math.floor((scrollTop + height) / this.cellSize / span),
+                                 Math.ceil(this.n / span) - 1);
+        const firstCol = Math.floor(scrollLeft / this.cellSize / span);
+        const lastCol = Math.min(Math.floor((scrollLeft + width) / this.cellSize / span),
+                                 Math.ceil(this.n / span) - 1);
+
+        for (let ti = firstRow; ti <= lastRow; ti++) {
+            for (let tj = firstCol; tj <= lastCol; tj++) {
+                const tile = this.getTile(ti * span, tj * span, span, block);
+                if (tile) {
+                    this.drawTile(tile);
+                } else {
+                    ctx.fillStyle = 'rgba(128, 128, 128, 0.15)';
+                    ctx.fillRect(tj * span * this.cellSize, ti * span * this.cellSize,
+                                 span * this.cellSize, span * this.cellSize);
+                }
+            }
+        }
+
+        this.drawStepOverlay(scrollTop, scrollLeft, width, height);
+    }
+
+    getTile(row, col, span, block) {
+        const key = `${block}:${row}:${col}`;
+        if (this.tiles.has(key)) {
+            const tile = this.tiles.get(key);
+            this.tiles.delete(key);  // keep recently drawn tiles at the end
+            this.tiles.set(key, tile);
+            return tile;
+        }
+
+        this.tiles.set(key, null);
+        const source = this.source;
+        source.fetchTile(row, col, span, span, block)
+            .then(tile => {
+                if (source !== this.source || !this.tiles.has(key)) return;
+                this.tiles.set(key, tile);
+                const tileMax = Math.max(...tile.values.map(values => Math.max(...values)));
+                if (tileMax > this.maxValue) {
+                    // The colour scale widened: every drawn tile changes
+                    this.maxValue = tileMax;
+                }
+                this.evictTiles();
+                this.requestDraw();
+            })
+            .catch(error => {
+                this.tiles.delete(key);
+                console.error('Error loading matrix tile:', error);
+            });
+        return null;
+    }
+
+    evictTiles() {
+        for (const key of this.tiles.keys()) {
+            if (this.tiles.size <= CANVAS_MAX_TILES) break;
+            this.tiles.delete(key);
+        }
+    }
+
+    drawTile(tile) {
+        const ctx = this.context;
+        const size = this.cellSize * tile.block;
+        const writeValues = tile.block === 1 && this.cellSize >= CANVAS_TEXT_MIN_PX;
+        if (writeValues) {
+            ctx.font = `${Math.round(this.cellSize * 0.35)}px sans-serif`;
+            ctx.textAlign = 'center';
+            ctx.textBaseline = 'middle';
+        }
+
+        tile.values.forEach((values, bi) => {
+            const y = (tile.row + bi * tile.block) * this.cellSize;
+            values.forEach((value, bj) => {
+                const x = (tile.col + bj * tile.block) * this.cellSize;
+                ctx.fillStyle = tile.zeros[bi][bj] > 0 ? '#27ae60' : this.valueColor(value);
+                ctx.fillRect(x, y, size, size);
+                if (writeValues) {
+                    ctx.strokeStyle = 'rgba(0, 0, 0, 0.15)';
+                    ctx.strokeRect(x, y, size, size);
+                    ctx.fillStyle = tile.zeros[bi][bj] > 0 ? 'white' : '#2c3e50';
+                    ctx.fillText(String(value), x + size / 2, y + size / 2);
+                }
+            });
+        });
+    }
+
+    valueColor(value) {
+        // Light to dark blue with increasing value
+        const intensity = Math.min(1, value / this.maxValue);
+        return `hsl(210, 60%, ${92 - intensity * 55}%)`;
+    }
+
+    drawStepOverlay(scrollTop, scrollLeft, width, height) {
+        const step = this.step;
+        if (!step) return;
+
+        const ctx = this.context;
+        const extent = this.n * this.cellSize;
+        const size = Math.max(this.cellSize, 1);
+
+        if (step.type === 'line_covering' || step.type === 'matrix_adjustment') {
+            ctx.fillStyle = 'rgba(231, 76, 60, 0.25)';
+            (step.covered_rows || []).forEach(row => {
+                const y = row * this.cellSize;
+                if (y + size >= scrollTop && y <= scrollTop + height) {
+                    ctx.fillRect(0, y, extent, size);
+                }
+            });
+            (step.covered_columns || []).forEach(col => {
+                const x = col * this.cellSize;
+                if (x + size >= scrollLeft && x <= scrollLeft + width) {
+                    ctx.fillRect(x, 0, size, extent);
+                }
+            });
+        }
+
+        if (step.type === 'assignment_extraction' && step.assigned_positions) {
+            ctx.strokeStyle = '#3498db';
+            ctx.lineWidth = Math.max(1, Math.min(3, this.cellSize / 8));
+            step.assigned_positions.forEach(([row, col]) => {
+                ctx.strokeRect(col * this.cellSize, row * this.cellSize, size, size);
+            });
+        }
+    }
+
+    cellAt(e) {
+        const rect = this.canvas.getBoundingClientRect();
+        const x = e.clientX - rect.left + this.viewport.scrollLeft;
+        const y = e.clientY - rect.top + this.viewport.scrollTop;
+        const row = Math.floor(y / this.cellSize);
+        const col = Math.floor(x / this.cellSize);
+        if (row < 0 || col < 0 || row >= this.n || col >= this.n) return null;
+        return { row, col, x: col * this.cellSize - this.viewport.scrollLeft,
+                 y: row * this.cellSize - this.viewport.scrollTop };
+    }
+
+    updateTooltip(e) {
+        const cell = this.cellAt(e);
+        if (!cell) {
+            this.canvas.title = '';
+            return;
+        }
+
+        const block = this.blockSize();
+        const span = CANVAS_TILE_CELLS * block;
+        const tile = this.tiles.get(`${block}:${cell.row - cell.row % span}:${cell.col - cell.col % span}`);
+        if (!tile) {
+            this.canvas.title = `Row ${cell.row + 1}, Column ${cell.col + 1}`;
+            return;
+        }
+
+        const bi = Math.floor((cell.row - tile.row) / tile.block);
+        const bj = Math.floor((cell.col - tile.col) / tile.block);
+        const value = tile.values[bi][bj];
+        if (tile.block === 1) {
+            this.canvas.title = `Row ${cell.row + 1}, Column ${cell.col + 1}: ${value}`;
+        } else {
+            const row = tile.row + bi * tile.block;
+            const col = tile.col + bj * tile.block;
+            this.canvas.title = `Rows ${row + 1}–${Math.min(row + tile.block, this.n)}, ` +
+                `columns ${col + 1}–${Math.min(col + tile.block, this.n)}: ` +
+                `minimum ${value}, ${tile.zeros[bi][bj]} zeros`;
+        }
+    }
+
+    exportImage() {
+        return this.canvas.toDataURL('image/png');
+    }
+}
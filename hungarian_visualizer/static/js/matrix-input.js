@@ -4,6 +4,7 @@ class MatrixInput {
         this.app = app;
         this.currentSize = 4;
         this.matrixData = [];
+        this.canvasView = null;  // large matrices are edited on a canvas, one cell at a time
         
         this.createMatrixInput(this.currentSize);
     }
@@ -14,6 +15,13 @@ class MatrixInput {
         
         const container = document.getElementById('matrix-input-container');
         container.innerHTML = '';
+        container.classList.remove('canvas-mode');
+        this.canvasView = null;
+        
+        if (size > CANVAS_VIEW_THRESHOLD) {
+            this.createCanvasInput(container, size);
+            return;
+        }
         
         const matrixGrid = document.createElement('div');
         matrixGrid.className = 'matrix-grid';
@@ -51,6 +59,55 @@ class MatrixInput {
         container.appendChild(matrixGrid);
     }
     
+    createCanvasInput(container, size) {
+        container.classList.add('canvas-mode');
+        this.canvasView = new MatrixCanvasView(container, size, {
+            onCellClick: (row, col, x, y) => this.editCanvasCell(row, col, x, y)
+        });
+        this.canvasView.setSource(new LocalTileSource(this.matrixData));
+        this.canvasView.fit();
+        
+        // A single editor input is placed over the clicked cell
+        this.cellEditor = document.createElement('input');
+        this.cellEditor.type = 'number';
+        this.cellEditor.className = 'matrix-cell matrix-canvas-editor';
+        this.cellEditor.min = '0';
+        this.cellEditor.max = '999';
+        this.cellEditor.style.display = 'none';
+        this.cellEditor.addEventListener('keydown', (e) => {
+            if (e.key === 'Enter') {
+                this.cellEditor.blur();
+            } else if (e.key === 'Escape') {
+                this.cellEditor.dataset.row = '';
+                this.cellEditor.blur();
+            }
+        });
+        this.cellEditor.addEventListener('blur', () => {
+            const { row, col } = this.cellEditor.dataset;
+            if (row !== '') {
+                this.updateMatrixData(Number(row), Number(col), this.validateInput(this.cellEditor.value));
+            }
+            this.cellEditor.style.display = 'none';
+        });
+        this.canvasView.viewport.appendChild(this.cellEditor);
+    }
+    
+    editCanvasCell(row, col, x, y) {
+        const size = this.canvasView.cellSize;
+        Object.assign(this.cellEditor.style, {
+            display: 'block',
+            left: `${x + this.canvasView.viewport.scrollLeft}px`,
+            top: `${y + this.canvasView.viewport.scrollTop}px`,
+            width: `${Math.max(size, 48)}px`,
+            height: `${Math.max(size, 24)}px`
+        });
+        this.cellEditor.dataset.row = row;
+        this.cellEditor.dataset.col = col;
+        this.cellEditor.value = this.matrixData[row][col];
+        this.cellEditor.focus();
+        this.cellEditor.select();
+    }
+    
     initializeMatrix(size) {
         const matrix = [];
         for (let i = 0; i < size; i++) {
@@ -68,6 +125,11 @@ class MatrixInput {
         
         this.matrixData[row][col] = value;
         
+        if (this.canvasView) {
+            this.canvasView.invalidate();
+            return;
+        }
+        
         // Update the input field to reflect any corrections
         const input = document.querySelector(`[data-row="${row}"][data-col="${col}"]`);
         if (input && parseInt(input.value) !== value) {
@@ -118,6 +180,12 @@ class MatrixInput {
     populateMatrix(matrix) {
         this.matrixData = matrix.map(row => [...row]); // Deep copy
         
+        if (this.canvasView) {
+            this.canvasView.setSource(new LocalTileSource(this.matrixData));
+            this.canvasView.invalidate();
+            return;
+        }
+        
         for (let i = 0; i < matrix.length; i++) {
             for (let j = 0; j < matrix[i].length; j++) {
                 const input = document.querySelector(`[data-row="${i}"][data-col="${j}"]`);
@@ -129,6 +197,10 @@ class MatrixInput {
     }
     
     getMatrixData() {
+        if (this.canvasView) {
+            return this.matrixData;  // edits are written to matrixData directly
+        }
+        
         // Get current values from input fields to ensure we have the latest data
         const inputs = document.querySelectorAll('.matrix-cell');
         const matrix = [];
@@ -163,6 +235,9 @@ class MatrixInput {
                 this.matrixData[i][j] = 0;
             }
         }
+        if (this.canvasView) {
+            this.canvasView.invalidate();
+        }
     }
     
     fillMatrix(value) {
@@ -175,6 +250,9 @@ class MatrixInput {
                 this.matrixData[i][j] = value;
             }
         }
+        if (this.canvasView) {
+            this.canvasView.invalidate();
+        }
     }
     
     randomizeMatrix(min = 1, max = 20) {
@@ -188,6 +266,9 @@ class MatrixInput {
                 this.matrixData[i][j] = value;
             }
         }
+        if (this.canvasView) {
+            this.canvasView.invalidate();
+        }
     }
     
     highlightCell(row, col, className = 'highlight') {
@@ -6,14 +6,22 @@ class MatrixVisualization {
         this.animationDuration = 300;
         this.currentMatrix = null;
         this.currentStep = null;
+        this.canvasView = null;  // used instead of DOM cells above CANVAS_VIEW_THRESHOLD
     }
     
     displayMatrix(matrix, step) {
         this.currentMatrix = matrix;
         this.currentStep = step;
         
+        if (matrix.length > CANVAS_VIEW_THRESHOLD) {
+            this.displayMatrixCanvas(matrix, step);
+            return;
+        }
+        
         const container = document.getElementById('matrix-display');
         container.innerHTML = '';
+        container.classList.remove('canvas-mode');
+        this.canvasView = null;
         
         const matrixGrid = document.createElement('div');
         matrixGrid.className = 'matrix-display-grid';
@@ -45,6 +53,26 @@ class MatrixVisualization {
         this.animateMatrixUpdate(matrixGrid);
     }
     
+    displayMatrixCanvas(matrix, step) {
+        const container = document.getElementById('matrix-display');
+        if (!this.canvasView || this.canvasView.n !== matrix.length) {
+            container.innerHTML = '';
+            container.classList.add('canvas-mode');
+            this.canvasView = new MatrixCanvasView(container, matrix.length);
+            this.canvasView.fit();
+        }
+        
+        // Stored runs are drawn from server tiles, so only the visible part is transferred
+        const source = this.app.runId
+            ? new ServerTileSource(this.app.runId, this.app.currentStep)
+            : new LocalTileSource(matrix);
+        this.canvasView.setSource(source, step);
+        
+        if (this.showAnnotations) {
+            this.updateAnnotations(step);
+        }
+    }
+    
     applyCellStyling(cell, row, col, step) {
         // Remove all existing classes
         cell.className = 'matrix-display-cell';
@@ -314,6 +342,7 @@ class MatrixVisualization {
     }
     
     highlightAssignment(assignment) {
+        if (this.canvasView) return;  // the canvas view outlines assignments itself
         assignment.forEach(([row, col]) => {
             const cell = document.querySelector(`[data-row="${row}"][data-col="${col}"]`);
             if (cell) {
@@ -336,6 +365,10 @@ class MatrixVisualization {
     }
     
     exportVisualization() {
+        if (this.canvasView) {
+            return this.canvasView.exportImage();
+        }
+        
         const canvas = document.createElement('canvas');
         const ctx = canvas.getContext('2d');
         const matrixGrid = document.querySelector('.matrix-display-grid');
@@ -0,0 +1,410 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+import numpy as np
+from typing import Dict, Any, Iterable, List, Optional, Callable, Tuple
+
+# File extension of persisted run archives
+ARCHIVE_EXTENSION = '.hgtrace'
+
+# File layout (all little-endian, every block starts on an 8-byte boundary):
+#   magic (4 bytes) | version (uint32)
+#   original matrix: n * n values of footer['original_dtype']
+#   one record per step, appended while the solver runs:
+#       potentials: 2 * n float64 (row potentials u, then column potentials v)
+#       zero bitmap: ceil(n * n / 8) bytes, bit k = cell k
+#       matrix: n * n values of footer['matrix_dtype'], keyframe steps only
+#       metadata: JSON of the remaining step fields
+#   step index: num_steps rows of INDEX_COLUMNS (int64 byte offsets, -1 = absent)
+#   scalars: num_steps rows of SCALAR_FIELDS (float64, NaN = absent)
+#   footer: JSON (n, dtypes, block offsets, run summary, CRC32 of everything before it), unpadded
+#   trailer: footer offset (uint64) | footer length (uint32) | footer CRC32 (uint32) | magic
+#
+# A step matrix is C - u[:, None] - v[None, :], the solver's invariant, so it is
+# rebuilt from the original matrix and the step's potentials. Steps where that
+# does not reproduce the recorded matrix bit for bit (fractional floats, warm
+# start snapping) are stored in full as keyframes.
+ARCHIVE_MAGIC = b'HGTA'
+ARCHIVE_VERSION = 2
+TRAILER = struct.Struct('<QII4s')
+
+INDEX_COLUMNS = ('potentials', 'bitmap', 'matrix', 'metadata', 'metadata_length')
+SCALAR_FIELDS = ('zero_density', 'frobenius_norm', 'total_cost', 'dual_objective')
+
+# Step fields carried in the binary blocks instead of the metadata JSON
+ARCHIVED_STEP_FIELDS = ('matrix', 'zeros', 'row_potentials', 'column_potentials') + SCALAR_FIELDS
+
+# Summary fields left out of the footer: rendered chart images, regenerated from the steps on replay
+UNARCHIVED_SUMMARY_FIELDS = ('charts',)
+
+
+class TraceWriter:
+    """Appends solver steps to a trace archive as they are produced
+
+    The archive is written to <path>.tmp and renamed into place by close(), so
+    a complete file at `path` is always a finished run; abort() discards it.
+    """
+
+    def __init__(self, path: str, cost_matrix: np.ndarray, dumps: Callable = json.dumps):
+        self.path = path
+        self.temp_path = path + '.tmp'
+        self.dumps = dumps
+
+        original = np.asarray(cost_matrix)
+        original = np.ascontiguousarray(original, dtype=original.dtype.newbyteorder('<'))
+        self.n = len(original)
+        self.original_dtype = original.dtype
+        self.matrix_dtype = None  # Working dtype, set by the first step
+        self.index = []
+        self.scalars = []
+
+        self.handle = open(self.temp_path, 'wb')
+        header = ARCHIVE_MAGIC + struct.pack('<I', ARCHIVE_VERSION)
+        self.handle.write(header)
+        self.crc = zlib.crc32(header)  # Running CRC32 of the data region, stored in the footer
+        self.original_offset = self._write(original.tobytes())
+
+        # Keyframe checks read the original back from the file, so overwrite_input
+        # solves can reduce the caller's buffer without the writer keeping a copy
+        self.handle.flush()
+        if original.size:
+            self.original = np.memmap(self.temp_path, dtype=original.dtype, mode='r',
+                                      offset=self.original_offset, shape=original.shape)
+        else:
+            self.original = original
+
+    def append(self, fields: Dict[str, Any], matrix: np.ndarray,
+               row_potentials: np.ndarray, column_potentials: np.ndarray):
+        """Write one step: its fields (without matrix/zeros/potentials), matrix and potentials"""
+        if self.matrix_dtype is None:
+            self.matrix_dtype = matrix.dtype.newbyteorder('<')
+        row_potentials = np.asarray(row_potentials, dtype='<f8')
+        column_potentials = np.asarray(column_potentials, dtype='<f8')
+
+        potentials_offset = self._write(np.concatenate([row_potentials, column_potentials]).tobytes())
+        bitmap_offset = self._write(np.packbits(matrix == 0, axis=None, bitorder='little').tobytes())
+
+        matrix_offset = -1
+        rebuilt = rebuild_matrix(self.original, row_potentials, column_potentials, matrix.dtype)
+        if not np.array_equal(rebuilt, matrix):
+            matrix_offset = self._write(np.ascontiguousarray(matrix, dtype=self.matrix_dtype).tobytes())
+
+        metadata = self.dumps({key: value for key, value in fields.items()
+                               if key not in ARCHIVED_STEP_FIELDS}).encode('utf-8')
+        metadata_offset = self._write(metadata)
+
+        self.index.append((potentials_offset, bitmap_offset, matrix_offset, metadata_offset, len(metadata)))
+        self.scalars.append([_scalar(fields.get(name)) for name in SCALAR_FIELDS])
+
+    def close(self, summary: Optional[Dict[str, Any]] = None,
+              final_step_fields: Optional[Dict[str, Any]] = None):
+        """Write the step index and footer, then move the archive into place
+
+        summary is stored as the run summary (without UNARCHIVED_SUMMARY_FIELDS);
+        final_step_fields are merged into the last step on read (fields known
+        only once the solve has finished).
+        """
+        index_offset = self._write(np.asarray(self.index, dtype='<i8').tobytes())
+        scalars_offset = self._write(np.asarray(self.scalars, dtype='<f8').tobytes())
+        footer = {
+            'version': ARCHIVE_VERSION,
+            'n': self.n,
+            'num_steps': len(self.index),
+            'original_dtype': self.original_dtype.str,
+            'original_offset': self.original_offset,
+            'matrix_dtype': (self.matrix_dtype or self.original_dtype).str,
+            'bitmap_stride': (self.n * self.n + 7) // 8,
+            'index_columns': list(INDEX_COLUMNS),
+            'index_offset': index_offset,
+            'scalar_fields': list(SCALAR_FIELDS),
+            'scalars_offset': scalars_offset,
+            'keyframes': sum(row[2] >= 0 for row in self.index),
+            'summary': {key: value for key, value in (summary or {}).items()
+                        if key not in UNARCHIVED_SUMMARY_FIELDS},
+            'final_step_fields': final_step_fields or {},
+            'data_crc32': self.crc
+        }
+        footer_bytes = self.dumps(footer).encode('utf-8')
+        footer_offset = self.handle.tell()
+        self.handle.write(footer_bytes)  # Unpadded: the trailer follows directly, so no byte is unchecked
+        self.handle.write(TRAILER.pack(footer_offset, len(footer_bytes), zlib.crc32(footer_bytes), ARCHIVE_MAGIC))
+        self.handle.close()
+
+        self.original = None  # Unmap before the rename
+        os.replace(self.temp_path, self.path)
+
+    def abort(self):
+        """Discard a partly written archive"""
+        self.original = None
+        self.handle.close()
+        try:
+            os.remove(self.temp_path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if self.handle.closed:
+            return  # Already closed explicitly
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _write(self, data: bytes) -> int:
+        """Append a block padded to 8 bytes, returning its offset"""
+        offset = self.handle.tell()
+        padding = b'\0' * (-len(data) % 8)
+        self.handle.write(data)
+        self.handle.write(padding)
+        self.crc = zlib.crc32(padding, zlib.crc32(data, self.crc))
+        return offset
+
+
+class TraceReader:
+    """Memory-maps a trace archive and serves any step without reading the others
+
+    Opening checks the footer CRC and, with verify, the CRC of the whole data
+    region (one sequential read); otherwise it reads only the trailer, footer
+    and step index. A step costs one matrix rebuild (or keyframe read) and its
+    bitmap and metadata.
+    """
+
+    def __init__(self, path: str, verify: bool = True):
+        with open(path, 'rb') as handle:
+            if os.fstat(handle.fileno()).st_size < 8 + TRAILER.size:
+                raise ValueError('Not a Hungarian trace archive')
+            self.buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            footer = _read_footer(self.buffer, verify)
+        except ValueError:
+            self.buffer.close()
+            raise
+
+        self.n = footer['n']
+        self.num_steps = footer['num_steps']
+        self.summary = footer['summary']
+        self.keyframes = footer['keyframes']
+        self.final_step_fields = footer['final_step_fields']
+        self.matrix_dtype = footer['matrix_dtype']
+        self.bitmap_stride = footer['bitmap_stride']
+        self.scalar_fields = footer['scalar_fields']
+
+        n = self.n
+        self.original = np.frombuffer(self.buffer, dtype=footer['original_dtype'],
+                                      count=n * n, offset=footer['original_offset']).reshape(n, n)
+        self.index = np.frombuffer(self.buffer, dtype='<i8', count=self.num_steps * len(INDEX_COLUMNS),
+                                   offset=footer['index_offset']).reshape(self.num_steps, len(INDEX_COLUMNS))
+        self.scalars = np.frombuffer(self.buffer, dtype='<f8', count=self.num_steps * len(self.scalar_fields),
+                                     offset=footer['scalars_offset']).reshape(self.num_steps, len(self.scalar_fields))
+
+    def __len__(self) -> int:
+        return self.num_steps
+
+    def potentials(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Row and column potentials after step k"""
+        offset = int(self.index[self._position(k), 0])
+        potentials = np.frombuffer(self.buffer, dtype='<f8', count=2 * self.n, offset=offset)
+        return potentials[:self.n], potentials[self.n:]
+
+    def matrix(self, k: int) -> np.ndarray:
+        """Matrix of step k: a read-only view of a keyframe, or rebuilt from the potentials"""
+        k = self._position(k)
+        matrix_offset = int(self.index[k, 2])
+        if matrix_offset >= 0:
+            return np.frombuffer(self.buffer, dtype=self.matrix_dtype, count=self.n * self.n,
+                                 offset=matrix_offset).reshape(self.n, self.n)
+        row_potentials, column_potentials = self.potentials(k)
+        return rebuild_matrix(self.original, row_potentials, column_potentials, self.matrix_dtype)
+
+    def zero_mask(self, k: int) -> np.ndarray:
+        """Boolean mask of the zero cells of step k, from its packed bitmap"""
+        offset = int(self.index[self._position(k), 1])
+        bitmap = np.frombuffer(self.buffer, dtype=np.uint8, count=self.bitmap_stride, offset=offset)
+        return np.unpackbits(bitmap, count=self.n * self.n, bitorder='little').reshape(self.n, self.n).view(bool)
+
+    def metadata(self, k: int) -> Dict[str, Any]:
+        """The JSON step fields of step k, raising ValueError if they are malformed"""
+        k = self._position(k)
+        _, _, _, metadata_offset, metadata_length = (int(value) for value in self.index[k])
+        metadata = json.loads(self.buffer[metadata_offset:metadata_offset + metadata_length].decode('utf-8'))
+        if (not isinstance(metadata, dict) or not isinstance(metadata.get('type'), str)
+                or not isinstance(metadata.get('step_number'), int) or isinstance(metadata['step_number'], bool)):
+            raise ValueError(f'Trace archive step {k} has invalid metadata')
+        return metadata
+
+    def fields(self, k: int) -> Dict[str, Any]:
+        """Step k without its matrix, zeros and potentials (metadata and scalars only)"""
+        k = self._position(k)
+        step = self.metadata(k)
+        for name, value in zip(self.scalar_fields, self.scalars[k].tolist()):
+            if value == value:  # NaN marks a field the step did not have
+                step[name] = value
+        if k == self.num_steps - 1:
+            step.update(self.final_step_fields)
+        return step
+
+    def step(self, k: int) -> Dict[str, Any]:
+        """Step k in the solver's JSON step shape"""
+        k = self._position(k)
+        step = self.fields(k)
+
+        row_potentials, column_potentials = self.potentials(k)
+        step['matrix'] = self.matrix(k).tolist()
+        step['zeros'] = np.argwhere(self.zero_mask(k)).tolist()
+        step['row_potentials'] = row_potentials.tolist()
+        step['column_potentials'] = column_potentials.tolist()
+        return step
+
+    def steps(self, start: int = 0, end: Optional[int] = None) -> List[Dict[str, Any]]:
+        """steps[start:end], reading only those steps"""
+        return [self.step(k) for k in range(*slice(start, end).indices(self.num_steps))]
+
+    def close(self):
+        """Unmap the file; views returned by matrix() must not be used afterwards"""
+        self.original = self.index = self.scalars = None
+        try:
+            self.buffer.close()
+        except BufferError:
+            pass  # A keyframe view is still alive; the map is released with it
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def _position(self, k: int) -> int:
+        if not -self.num_steps <= k < self.num_steps:
+            raise IndexError(f'Step {k} out of range for {self.num_steps} steps')
+        return k % self.num_steps
+
+
+def write_trace_archive(path: str, steps: Iterable[Dict[str, Any]], summary: Optional[Dict[str, Any]] = None,
+                        dumps: Callable = json.dumps):
+    """Archive already recorded steps (e.g. a stored run), consuming them once in order
+
+    The first step's matrix serves as the original; every step needs a square
+    'matrix' of the same shape, otherwise ValueError is raised.
+    """
+    writer = None
+    try:
+        for step in steps:
+            if 'matrix' not in step:
+                raise ValueError('Every step needs a matrix to be archived')
+            matrix = np.asarray(step['matrix'])
+            if writer is None:
+                if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+                    raise ValueError('Step matrices must be square')
+                writer = TraceWriter(path, matrix, dumps=dumps)
+                zeros = np.zeros(writer.n)
+            elif matrix.shape != (writer.n, writer.n):
+                raise ValueError('Step matrices must all have the same shape')
+            writer.append(step, matrix, step.get('row_potentials', zeros), step.get('column_potentials', zeros))
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+
+    if writer is None:
+        raise ValueError('No steps to archive')
+    writer.close(summary)
+
+
+def _read_footer(buffer, verify: bool = True) -> Dict[str, Any]:
+    """Parse and check the footer against the file, raising ValueError for anything malformed
+
+    Archives may be uploaded by users, so the checksums are compared and every
+    offset is checked to lie inside the file before any block is mapped.
+    """
+    if buffer[:4] != ARCHIVE_MAGIC:
+        raise ValueError('Not a Hungarian trace archive')
+    footer_offset, footer_length, footer_crc, magic = TRAILER.unpack_from(buffer, len(buffer) - TRAILER.size)
+    if magic != ARCHIVE_MAGIC:
+        raise ValueError('Incomplete Hungarian trace archive')
+    data_end = len(buffer) - TRAILER.size
+    if footer_offset < 8 or footer_offset + footer_length != data_end:
+        raise ValueError('Trace archive footer lies outside the file')
+
+    footer_bytes = buffer[footer_offset:footer_offset + footer_length]
+    if zlib.crc32(footer_bytes) != footer_crc:
+        raise ValueError('Trace archive footer is corrupted (checksum mismatch)')
+    footer = json.loads(footer_bytes.decode('utf-8'))
+    if not isinstance(footer, dict):
+        raise ValueError('Trace archive footer is not an object')
+    expected = {'version': int, 'n': int, 'num_steps': int, 'original_dtype': str, 'original_offset': int,
+                'matrix_dtype': str, 'bitmap_stride': int, 'index_columns': list, 'index_offset': int,
+                'scalar_fields': list, 'scalars_offset': int, 'keyframes': int, 'summary': dict,
+                'final_step_fields': dict, 'data_crc32': int}
+    for key, kind in expected.items():
+        value = footer.get(key)
+        if not isinstance(value, kind) or isinstance(value, bool) or (kind is int and value < 0):
+            raise ValueError(f'Trace archive footer has a missing or invalid "{key}"')
+    if footer['version'] != ARCHIVE_VERSION:
+        raise ValueError(f"Unsupported trace archive version {footer['version']}")
+    if footer['index_columns'] != list(INDEX_COLUMNS):
+        raise ValueError('Trace archive step index has unknown columns')
+    if not all(isinstance(name, str) for name in footer['scalar_fields']):
+        raise ValueError('Trace archive footer has an invalid "scalar_fields"')
+
+    if verify:
+        with memoryview(buffer) as view, view[:footer_offset] as data:
+            if zlib.crc32(data) != footer['data_crc32']:
+                raise ValueError('Trace archive is corrupted (checksum mismatch)')
+
+    for key in ('original_dtype', 'matrix_dtype'):
+        try:
+            dtype = np.dtype(footer[key])
+        except TypeError:
+            raise ValueError(f'Trace archive footer has an invalid "{key}"')
+        if dtype.kind not in 'biuf':
+            raise ValueError(f'Trace archive footer has a non-numeric "{key}"')
+        footer[key] = dtype
+
+    n, num_steps = footer['n'], footer['num_steps']
+    if footer['bitmap_stride'] != (n * n + 7) // 8:
+        raise ValueError('Trace archive bitmap stride does not match its size')
+    blocks = (('original matrix', footer['original_offset'], n * n * footer['original_dtype'].itemsize),
+              ('step index', footer['index_offset'], num_steps * len(INDEX_COLUMNS) * 8),
+              ('scalars', footer['scalars_offset'], num_steps * len(footer['scalar_fields']) * 8))
+    for name, offset, size in blocks:
+        if offset < 8 or offset + size > footer_offset:
+            raise ValueError(f'Trace archive {name} lies outside the file')
+
+    # Every step record must lie inside the record area, before the step index
+    # (read from a copy: a view would keep the map open if this raises)
+    index_bytes = buffer[footer['index_offset']:footer['index_offset'] + num_steps * len(INDEX_COLUMNS) * 8]
+    index = np.frombuffer(index_bytes, dtype='<i8').reshape(num_steps, len(INDEX_COLUMNS))
+    potentials, bitmaps, matrices, metadata, metadata_length = index.T
+    matrix_bytes = n * n * footer['matrix_dtype'].itemsize
+    keyframes = matrices >= 0
+    records_end = footer['index_offset']
+    if (np.any(index[:, :4].min(axis=0, initial=8) < np.array([8, 8, -1, 8]))
+            or np.any(metadata_length < 0)
+            or np.any(potentials + 16 * n > records_end)
+            or np.any(bitmaps + footer['bitmap_stride'] > records_end)
+            or np.any(matrices[keyframes] + matrix_bytes > records_end)
+            or np.any(metadata + metadata_length > records_end)):
+        raise ValueError('Trace archive step index points outside the file')
+    return footer
+
+
+def rebuild_matrix(original: np.ndarray, row_potentials: np.ndarray, column_potentials: np.ndarray,
+                   dtype: np.dtype) -> np.ndarray:
+    """C - u[:, None] - v[None, :] in float64, cast to the working dtype"""
+    matrix = original.astype(np.float64)
+    matrix -= row_potentials[:, None]
+    matrix -= column_potentials[None, :]
+    return matrix.astype(dtype, copy=False)
+
+
+def _scalar(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
@@ -0,0 +1,108 @@
+import os
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+# Maximum matrix size per solve mode. The step-by-step visual mode renders every
+# cell of every step, so it stays small; headless solve/batch modes only return
+# the assignment. Override with HUNGARIAN_SIZE_LIMIT_<MODE> environment variables.
+DEFAULT_SIZE_LIMITS = {
+    'visual': 10,
+    'solve': 2000,
+    'batch': 2000
+}
+
+# Duplicate row/column groups reported individually before summarizing
+MAX_DUPLICATE_GROUPS_REPORTED = 10
+
+# Seed for the odd 64-bit multipliers that hash rows and columns (fixed so results are stable)
+_HASH_SEED = 0x5EED
+
+
+def load_size_limits(environ: Optional[Dict[str, str]] = None) -> Dict[str, int]:
+    """Build the per-mode size limits, applying environment overrides"""
+    environ = os.environ if environ is None else environ
+    limits = dict(DEFAULT_SIZE_LIMITS)
+    for mode in limits:
+        value = environ.get(f'HUNGARIAN_SIZE_LIMIT_{mode.upper()}')
+        if value:
+            limits[mode] = int(value)
+    return limits
+
+
+def size_limit_error(size: int, mode: str, limits: Dict[str, int]) -> Optional[str]:
+    """Return the size error message for a mode, or None if the size is allowed"""
+    if mode not in limits:
+        return f"Unknown mode '{mode}' (expected one of: {', '.join(limits)})"
+
+    limit = limits[mode]
+    if size <= limit:
+        return None
+    if mode == 'visual':
+        return f"Matrix size must be ≤ {limit} for clarity"
+    return f"Matrix size must be ≤ {limit} in {mode} mode"
+
+
+def find_duplicate_groups(matrix: np.ndarray) -> Tuple[List[List[int]], List[List[int]]]:
+    """Find groups of identical rows and of identical columns
+
+    Rows and columns are hashed with an exact 64-bit polynomial over their bit
+    patterns (O(n²), no Python loops); only hash collisions are compared
+    element-wise, via np.unique(axis=0).
+    """
+    if matrix.ndim != 2 or matrix.size == 0:
+        return [], []
+
+    bits = _hashable_bits(matrix)
+    with np.errstate(over='ignore'):
+        row_keys = bits @ _hash_weights(matrix.shape[1])
+        column_keys = _hash_weights(matrix.shape[0]) @ bits
+
+    return _group_equal_lines(matrix, row_keys), _group_equal_lines(matrix.T, column_keys)
+
+
+def describe_duplicate_groups(groups: List[List[int]], label: str) -> List[str]:
+    """Format duplicate groups as 1-based warning messages"""
+    messages = []
+    for group in groups[:MAX_DUPLICATE_GROUPS_REPORTED]:
+        positions = [str(index + 1) for index in group]
+        joined = ', '.join(positions[:-1]) + ' and ' + positions[-1]
+        messages.append(f"Duplicate {label}s detected: {joined}")
+
+    remaining = len(groups) - MAX_DUPLICATE_GROUPS_REPORTED
+    if remaining > 0:
+        messages.append(f"... and {remaining} more groups of duplicate {label}s")
+    return messages
+
+
+def _group_equal_lines(lines: np.ndarray, keys: np.ndarray) -> List[List[int]]:
+    """Group identical rows of a 2D array, using precomputed hash keys as buckets"""
+    unique_keys, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+
+    groups = []
+    for key_index in np.flatnonzero(counts > 1):
+        candidates = np.flatnonzero(inverse == key_index)
+        # Confirm exact equality within the hash bucket
+        _, bucket_inverse, bucket_counts = np.unique(lines[candidates], axis=0,
+                                                      return_inverse=True, return_counts=True)
+        for bucket in np.flatnonzero(bucket_counts > 1):
+            groups.append(candidates[bucket_inverse.ravel() == bucket].tolist())
+
+    groups.sort()
+    return groups
+
+
+def _hashable_bits(matrix: np.ndarray) -> np.ndarray:
+    """View matrix values as uint64 bit patterns where equal values map to equal bits"""
+    if matrix.dtype.kind == 'f':
+        # Adding 0.0 folds -0.0 into 0.0 so equal values share a bit pattern
+        bits = np.add(matrix, 0.0, dtype=np.float64).view(np.uint64)
+        # Integral floats have all-zero low mantissa bits; fold the high bits down
+        bits ^= bits >> np.uint64(29)
+        return bits
+    return matrix.astype(np.int64, copy=False).view(np.uint64)
+
+
+def _hash_weights(length: int) -> np.ndarray:
+    """Fixed random odd 64-bit multipliers for the polynomial hash"""
+    rng = np.random.default_rng(_HASH_SEED)
+    return rng.integers(0, 2 ** 63, size=length, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
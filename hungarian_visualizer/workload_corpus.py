@@ -0,0 +1,103 @@
+import json
+import os
+import tempfile
+import time
+import numpy as np
+from typing import List, Dict, Any, Optional, Iterable
+from matrix_generator import WorkloadInstance
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+def write_corpus(directory: str, families: Iterable[str], sizes: Iterable[int], count: int = 1,
+                 seed: int = 0, dtype=np.int32, **options) -> Dict[str, Any]:
+    """Write `count` instances of every family and size as .npy files plus a manifest
+
+    Each instance gets its own seed, drawn from the corpus seed and recorded in
+    the manifest, so any one of them can be regenerated or replayed on its
+    own. Instances already on disk with the same family, size, seed, dtype and
+    options are kept, so benchmark and test runs can share one fixture
+    directory instead of regenerating it. Options are those of
+    WorkloadInstance (max_value, rank, clusters, degree).
+    """
+    os.makedirs(directory, exist_ok=True)
+    existing = {entry['file']: entry for entry in _read_manifest(directory).get('instances', [])}
+    dtype_name = np.dtype(dtype).name
+
+    rng = np.random.default_rng(seed)
+    instances = []
+    for family in families:
+        for size in sizes:
+            for k in range(count):
+                instance_seed = int(rng.integers(2 ** 63))
+                entry = {
+                    'file': f'{family}-n{size}-{k}.npy',
+                    'family': family,
+                    'size': int(size),
+                    'seed': instance_seed,
+                    'dtype': dtype_name,
+                    'options': options
+                }
+                path = os.path.join(directory, entry['file'])
+                if not _is_current(existing.get(entry['file']), entry, path):
+                    start = time.perf_counter()
+                    WorkloadInstance(family, size, seed=instance_seed, dtype=dtype, **options).write_npy(path)
+                    print(f"Wrote {entry['file']} in {time.perf_counter() - start:.2f} s")
+                entry['bytes'] = os.path.getsize(path)
+                instances.append(entry)
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'created': time.time(),
+        'seed': seed,
+        'instances': instances
+    }
+    _write_manifest(directory, manifest)
+    return manifest
+
+
+def load_corpus(directory: str, family: Optional[str] = None,
+                size: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Manifest entries of a corpus with their matrices memory-mapped read-only
+
+    Each entry gets a 'matrix' key holding np.load(..., mmap_mode='r'), so
+    instances are paged in on use and shared between processes.
+    """
+    manifest = _read_manifest(directory)
+    if not manifest:
+        raise FileNotFoundError(f'No corpus manifest in {directory}')
+
+    entries = []
+    for entry in manifest['instances']:
+        if family is not None and entry['family'] != family:
+            continue
+        if size is not None and entry['size'] != size:
+            continue
+        entry = dict(entry, matrix=np.load(os.path.join(directory, entry['file']), mmap_mode='r'))
+        entries.append(entry)
+    return entries
+
+
+def _is_current(previous: Optional[Dict[str, Any]], entry: Dict[str, Any], path: str) -> bool:
+    """Whether an instance file on disk was written from the same parameters"""
+    if previous is None or not os.path.exists(path):
+        return False
+    keys = ('family', 'size', 'seed', 'dtype', 'options')
+    return (all(previous.get(key) == entry[key] for key in keys)
+            and previous.get('bytes') == os.path.getsize(path))
+
+
+def _read_manifest(directory: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), 'r', encoding='utf-8') as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return {}
+
+
+def _write_manifest(directory: str, manifest: Dict[str, Any]):
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.json')
+    with os.fdopen(handle, 'w', encoding='utf-8') as temp_file:
+        json.dump(manifest, temp_file, indent=2)
+    os.replace(temp_path, os.path.join(directory, MANIFEST_NAME))
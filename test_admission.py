@@ -0,0 +1,37 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hungarian_visualizer'))
+
+from admission import AdmissionController
+
+
+class FixedCostModel:
+    """Estimates each solve as its n, so tests pick exact costs"""
+
+    def estimate(self, n, engine='hungarian', trace='full'):
+        return n
+
+    def observe(self, n, seconds, engine='hungarian', trace='full'):
+        pass
+
+
+def test_oversized_request_runs_alone_after_overlapping_heavy_solves():
+    # 1.3 and 2.1 are not representable: releasing them in admission order leaves 4.4e-16 behind
+    controller = AdmissionController(FixedCostModel(), max_inflight_cost=4.0, interactive_cost=1.0,
+                                     max_queue_wait=0.1)
+    first = controller.admit(1.3)
+    second = controller.admit(2.1)
+    first.__enter__()
+    second.__enter__()
+    first.__exit__(None, None, None)
+    second.__exit__(None, None, None)
+
+    assert controller.snapshot()['inflight_cost'] == 0
+    with controller.admit(9.0) as cost:
+        assert cost == 9.0
+    assert controller.snapshot()['inflight_cost'] == 0
+
+
+if __name__ == '__main__':
+    test_oversized_request_runs_alone_after_overlapping_heavy_solves()
+    print('OK')
@@ -0,0 +1,72 @@
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hungarian_visualizer'))
+
+import numpy as np
+from hungarian_algorithm import HungarianAlgorithm
+from trace_archive import TraceReader, write_trace_archive
+
+COSTS = [[4, 1, 3, 2], [2, 0, 5, 3], [3, 2, 2, 6], [5, 3, 1, 2]]
+
+
+def _solved_steps():
+    steps, _, _ = HungarianAlgorithm(np.array(COSTS)).solve_with_steps()
+    return steps
+
+
+def _expect_rejected(path):
+    try:
+        TraceReader(path).close()
+    except ValueError:
+        return
+    raise AssertionError(f'{path} was opened despite being corrupted')
+
+
+def test_archive_round_trips_every_step():
+    steps = _solved_steps()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'run.hgtrace')
+        write_trace_archive(path, steps, summary={'total_cost': 7, 'charts': {'zero_density': 'data:image/png'}})
+        with TraceReader(path) as reader:
+            assert reader.summary == {'total_cost': 7}
+            assert len(reader) == len(steps)
+            for expected, step in zip(steps, reader.steps()):
+                assert step['type'] == expected['type']
+                assert step['step_number'] == expected['step_number']
+                assert np.array_equal(step['matrix'], expected['matrix'])
+                assert sorted(map(tuple, step['zeros'])) == sorted(map(tuple, expected['zeros']))
+
+
+def test_corrupted_archives_are_rejected():
+    steps = _solved_steps()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'run.hgtrace')
+        write_trace_archive(path, steps)
+        with open(path, 'rb') as handle:
+            data = handle.read()
+
+        corrupted = os.path.join(directory, 'corrupted.hgtrace')
+        for position in range(0, len(data), 7):
+            flipped = bytearray(data)
+            flipped[position] ^= 0x10
+            with open(corrupted, 'wb') as handle:
+                handle.write(flipped)
+            _expect_rejected(corrupted)
+
+        # Step metadata must carry the fields every consumer reads
+        write_trace_archive(corrupted, [{key: value for key, value in step.items() if key != 'type'}
+                                        for step in steps])
+        with TraceReader(corrupted) as reader:
+            try:
+                reader.metadata(0)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError('Step metadata without a type was accepted')
+
+
+if __name__ == '__main__':
+    test_archive_round_trips_every_step()
+    test_corrupted_archives_are_rejected()
+    print('OK')